@@ -0,0 +1,23 @@
+# cython: language_level=3
+"""Cython-версия two_sum с типизированными индексами и значениями.
+
+Собирается на лету через pyximport:
+
+    import pyximport; pyximport.install()
+    from two_sum_cy import two_sum
+
+Числа должны помещаться в C long; для произвольно больших целых
+используйте two_sum из two_sum.py.
+"""
+
+
+def two_sum(nums, long target):
+    cdef dict seen = {}
+    cdef Py_ssize_t i
+    cdef long num, diff
+    for i, num in enumerate(nums):
+        diff = target - num
+        if diff in seen:
+            return [seen[diff], i]
+        seen[num] = i
+    return []
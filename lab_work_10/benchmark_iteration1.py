@@ -1,15 +1,26 @@
 import math
 import timeit
 from iteration1.iteration1 import integrate
+from iteration1.iteration1_numba import integrate_numba, sin_nb, warmup
 
 # Замер времени выполнения для разных чисел итераций
 def measure_performance():
     print("Замер времени выполнения для функции math.sin от 0 до π:")
     for n in [100, 1000, 10000, 100000, 1000000]:
-        time = timeit.timeit(
+        time = min(timeit.repeat(
             lambda: integrate(math.sin, 0, math.pi, n_iter=n),
-            number=10
-        )
+            number=10, repeat=5
+        ))
+        print(f"n_iter={n:8d}: {time/10:.6f} секунд на одно выполнение")
+
+    # Компиляция не должна попадать в замер
+    warmup(sin_nb)
+    print("\nТо же самое, скомпилированное Numba:")
+    for n in [100, 1000, 10000, 100000, 1000000]:
+        time = min(timeit.repeat(
+            lambda: integrate_numba(sin_nb, 0, math.pi, n_iter=n),
+            number=10, repeat=5
+        ))
         print(f"n_iter={n:8d}: {time/10:.6f} секунд на одно выполнение")
  
 if __name__ == "__main__":
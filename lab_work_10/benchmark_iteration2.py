@@ -1,16 +1,31 @@
-from iteration2.iteration2 import integrate_threaded
+from iteration2.iteration2 import integrate_threaded, integrate_numpy_threaded
+import gc
 import math
+import numpy as np
 import timeit
 
 def benchmark_threaded():
     print("\nБенчмарк многопоточной версии (sin от 0 до π, n_iter=1_000_000):")
     
     for n_jobs in [1, 2, 4, 6, 8]:
-        time = timeit.timeit( 
+        gc.collect()  # убираем остатки предыдущего прогона до замера
+        time = min(timeit.repeat( 
           lambda: integrate_threaded(math.sin, 0, math.pi, 
             n_jobs=n_jobs, n_iter=1_000_000),
-          number=1
-        )
+          number=1, repeat=5
+        ))
+        
+        print(f"n_jobs={n_jobs}: {time:.6f} секунд на одно выполнение")
+
+    print("\nБенчмарк многопоточной NumPy версии (np.sin от 0 до π, n_iter=1_000_000):")
+    
+    for n_jobs in [1, 2, 4, 6, 8]:
+        gc.collect()  # убираем остатки предыдущего прогона до замера
+        time = min(timeit.repeat( 
+          lambda: integrate_numpy_threaded(np.sin, 0, math.pi, 
+            n_jobs=n_jobs, n_iter=1_000_000),
+          number=1, repeat=5
+        ))
         
         print(f"n_jobs={n_jobs}: {time:.6f} секунд на одно выполнение")
 
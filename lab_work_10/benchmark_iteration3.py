@@ -1,6 +1,7 @@
 import sys
 from pathlib import Path
 from iteration3.iteration3 import integrate_processed
+import gc
 import math
 import timeit
 
@@ -8,11 +9,12 @@ def benchmark_processed():
     print("\nБенчмарк многопроцессорной версии (sin от 0 до π, n_iter=1_000_000):")
     
     for n_jobs in [1, 2, 4, 6, 8]:
-        time = timeit.timeit( 
+        gc.collect()  # убираем остатки предыдущего прогона до замера
+        time = min(timeit.repeat( 
           lambda: integrate_processed(math.sin, 0, math.pi, 
             n_jobs=n_jobs, n_iter=1_000_000),
-          number=1
-        )
+          number=1, repeat=5
+        ))
         
         print(f"n_jobs={n_jobs}: {time:.6f} секунд на одно выполнение")
 
@@ -4,10 +4,12 @@ from iteration4.iteration4 import (
   integrate_cython_threaded,
 )
 from iteration1.iteration1 import integrate
+from iteration1.iteration1_numpy import integrate_numpy
 from iteration2.iteration2 import integrate_threaded
 from iteration3.iteration3 import integrate_processed
 import math
 import timeit
+import numpy as np
 
 def benchmark():
   n_iter = 10_000_000
@@ -17,37 +19,46 @@ def benchmark():
   # Линейная версия на python
   print("\n1. Линейная версия:")
   print("\n\tPython:")
-  time_py = timeit.timeit(
+  time_py = min(timeit.repeat(
     lambda: integrate(math.sin, a, b, n_iter=n_iter),
-    number=1
-  )
+    number=1, repeat=5
+  ))
   print(f"\tВремя: {time_py:.4f} сек")
   
   # Cython линейная версия
   print("\n\tCython")
-  time_cy = timeit.timeit(
+  time_cy = min(timeit.repeat(
     lambda: cy.integrate_cython(math.sin, a, b, n_iter=n_iter),
-    number=1
-  )
+    number=1, repeat=5
+  ))
   print(f"\tВремя: {time_cy:.4f} сек")
   print(f"\tУскорение: {time_py/time_cy:.2f}x")
   
+  # NumPy линейная версия (блоками)
+  print("\n\tNumPy")
+  time_np = min(timeit.repeat(
+    lambda: integrate_numpy(np.sin, a, b, n_iter=n_iter),
+    number=1, repeat=5
+  ))
+  print(f"\tВремя: {time_np:.4f} сек")
+  print(f"\tУскорение: {time_py/time_np:.2f}x")
+  
   #===2===
   # Многопоточная версия на python
   print("\n2. Многопоточная версия 4 потокоа:")
   print("\n\tPython:")
-  time_py = timeit.timeit(
+  time_py = min(timeit.repeat(
     lambda: integrate_threaded(math.sin, a, b, n_iter=n_iter, n_jobs=4),
-    number=1
-  )
+    number=1, repeat=5
+  ))
   print(f"\tВремя: {time_py:.4f} сек")
   
   # Cython многопоточная версия
   print("\n\tCython")
-  time_cy = timeit.timeit(
+  time_cy = min(timeit.repeat(
     lambda: integrate_cython_threaded(math.sin, a, b, n_iter=n_iter, n_jobs=4),
-    number=1
-  )
+    number=1, repeat=5
+  ))
   print(f"\tВремя: {time_cy:.4f} сек")
   print(f"\tУскорение: {time_py/time_cy:.2f}x")
   
@@ -55,18 +66,18 @@ def benchmark():
   # Многопроцессорная версия на python
   print("\n3. Многопроцессорная версия 4 работника:")
   print("\n\tPython:")
-  time_py = timeit.timeit(
+  time_py = min(timeit.repeat(
     lambda: integrate_processed(math.sin, a, b, n_iter=n_iter, n_jobs=4),
-    number=1
-  )
+    number=1, repeat=5
+  ))
   print(f"\tВремя: {time_py:.4f} сек")
   
   # Cython многопроцессорная версия
   print("\n\tCython")
-  time_cy = timeit.timeit(
+  time_cy = min(timeit.repeat(
     lambda: integrate_cython_processed(math.sin, a, b, n_iter=n_iter, n_jobs=4),
-    number=1
-  )
+    number=1, repeat=5
+  ))
   print(f"\tВремя: {time_cy:.4f} сек")
   print(f"\tУскорение: {time_py/time_cy:.2f}x")
 
@@ -1,7 +1,9 @@
-from iteration5.integrate_nogil import integrate_sin_threaded
+from iteration5.integrate_nogil import integrate_sin_threaded, integrate_sin_simd
 from iteration4.iteration4 import integrate_cython_processed
+from iteration1.iteration1_numba import integrate_sin_numba_parallel
 # from iteration5.iteration5 import integrate_nogil_threaded_sin
 # from iteration5.integrate_nogil import integrate_sin_nogil_threads # type: ignore
+import gc
 import math
 import timeit
 
@@ -11,20 +13,44 @@ def benchmark():
 
   print("\nБенчмарк многопоточной noGIL версии (sin от 0 до π, n_iter=10_000_000):")
   for n_jobs in [1, 2, 4, 6, 8]:
-    time = timeit.timeit( 
+    gc.collect()  # убираем остатки предыдущего прогона до замера
+    time = min(timeit.repeat( 
       lambda: integrate_sin_threaded(0, math.pi, 
         n_threads=n_jobs, n_iter=n_iter),
-      number=1
-    )
+      number=1, repeat=5
+    ))
+    print(f"n_jobs={n_jobs}: {time:.6f} ") 
+    
+  print("\nБенчмарк noGIL версии с SIMD-циклом (sin от 0 до π, n_iter=10_000_000):")
+  for n_jobs in [1, 2, 4, 6, 8]:
+    gc.collect()  # убираем остатки предыдущего прогона до замера
+    time = min(timeit.repeat( 
+      lambda: integrate_sin_simd(0, math.pi, 
+        n_threads=n_jobs, n_iter=n_iter),
+      number=1, repeat=5
+    ))
     print(f"n_jobs={n_jobs}: {time:.6f} ") 
     
   print("\nБенчмарк многопроцессороной Cyhton версии (sin от 0 до π, n_iter=10_000_000):")
   for n_jobs in [1, 2, 4, 6, 8]:
-    time = timeit.timeit( 
+    gc.collect()  # убираем остатки предыдущего прогона до замера
+    time = min(timeit.repeat( 
       lambda: integrate_cython_processed(math.sin, 0, math.pi, 
         n_jobs=n_jobs, n_iter=n_iter),
-      number=1
-    )
+      number=1, repeat=5
+    ))
+    print(f"n_jobs={n_jobs}: {time:.6f} ") 
+    
+  print("\nБенчмарк параллельной Numba версии (sin от 0 до π, n_iter=10_000_000):")
+  # Прогрев: JIT-компиляция не должна попадать в замер
+  integrate_sin_numba_parallel(0, math.pi, n_iter=1)
+  for n_jobs in [1, 2, 4, 6, 8]:
+    gc.collect()  # убираем остатки предыдущего прогона до замера
+    time = min(timeit.repeat( 
+      lambda: integrate_sin_numba_parallel(0, math.pi, 
+        n_jobs=n_jobs, n_iter=n_iter),
+      number=1, repeat=5
+    ))
     print(f"n_jobs={n_jobs}: {time:.6f} ") 
     
 
@@ -1,5 +1,6 @@
-import time
+import gc
 import math
+import timeit
 from iteration2.iteration2 import integrate_threaded
 from iteration3.iteration3 import integrate_processed
 
@@ -8,17 +9,24 @@ def compare_threads_processes():
     print("-" * 60)
     
     for n_jobs in [2, 4, 6, 8]:
+        gc.collect()  # убираем остатки предыдущего прогона до замера
         # Многопоточность
-        start_time = time.time()
         result_t = integrate_threaded(math.sin, 0, math.pi, 
                                       n_jobs=n_jobs, n_iter=10_000_000)
-        time_t = time.time() - start_time
+        time_t = min(timeit.repeat(
+          lambda: integrate_threaded(math.sin, 0, math.pi, 
+                                     n_jobs=n_jobs, n_iter=10_000_000),
+          number=1, repeat=5
+        ))
         
         # Многопроцессность
-        start_time = time.time()
         result_p = integrate_processed(math.sin, 0, math.pi, 
                                        n_jobs=n_jobs, n_iter=10_000_000)
-        time_p = time.time() - start_time
+        time_p = min(timeit.repeat(
+          lambda: integrate_processed(math.sin, 0, math.pi, 
+                                      n_jobs=n_jobs, n_iter=10_000_000),
+          number=1, repeat=5
+        ))
         
         print(f"Работников: {n_jobs}")
         print(f"  Потоки:    {result_t:.6f}, время: {time_t:.4f} сек")
@@ -35,10 +35,45 @@ def integrate(f: Callable[[float], float],
   return acc
 
 
-import doctest
+def integrate_trap(f: Callable[[float], float],
+            a: float,
+            b: float,
+            *,
+            n_iter: int = 100000) -> float:
+  """
+  Вычисляет определенный интеграл функции методом трапеций.
+  
+  Ошибка метода убывает как O(1/n_iter²) против O(1/n_iter) у метода
+  прямоугольников, поэтому та же точность достигается при меньшем
+  числе итераций. Отличие от integrate — только в весах крайних точек.
+  
+  Args:
+    f: Функция одного аргумента, которую нужно интегрировать.
+    a: Нижний предел интегрирования.
+    b: Верхний предел интегрирования.
+    n_iter: Количество итераций (трапеций) для вычисления.
+  
+  Returns:
+    Приближенное значение определенного интеграла ∫f(x)dx от a до b.
+  
+  Examples:
+    >>> import math
+    >>> round(integrate_trap(math.sin, 0, math.pi, n_iter=1_000), 5)
+    2.0
+  
+    >>> round(integrate_trap(lambda x: x**2, 0, 1, n_iter=1_000), 5)
+    0.33333
+  """
+  step = (b - a) / n_iter
+  acc = 0.5 * (f(a) + f(b))
+  for i in range(1, n_iter):
+    acc += f(a + i * step)
+  return acc * step
 
 
 # Запуск doctest
 if __name__ == "__main__":
+    import doctest
+
     # Запускаем doctest
     doctest.testmod(verbose=True)
\ No newline at end of file
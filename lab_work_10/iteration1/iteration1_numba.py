@@ -0,0 +1,118 @@
+import math
+from typing import Callable
+
+from numba import config, njit, prange, set_num_threads
+
+
+@njit(fastmath=True, cache=True)
+def sin_nb(x: float) -> float:
+  """sin(x), скомпилированный Numba для передачи в integrate_numba."""
+  return math.sin(x)
+
+
+@njit(fastmath=True, cache=True)
+def _integrate_nb(f, a, b, n_iter):
+  acc = 0.0
+  step = (b - a) / n_iter
+  for i in range(n_iter):
+    acc += f(a + i * step)
+  return acc * step
+
+
+@njit(fastmath=True, cache=True)
+def _integrate_trap_nb(f, a, b, n_iter):
+  step = (b - a) / n_iter
+  acc = 0.5 * (f(a) + f(b))
+  for i in range(1, n_iter):
+    acc += f(a + i * step)
+  return acc * step
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _integrate_sin_par(a, b, n_iter):
+  step = (b - a) / n_iter
+  acc = 0.0
+  for i in prange(n_iter):
+    acc += math.sin(a + i * step)
+  return acc * step
+
+
+def warmup(f: Callable[[float], float]) -> None:
+  """
+  Компилирует ядро интегрирования для функции f заранее.
+
+  Первый вызов njit-функции запускает JIT-компиляцию, поэтому перед
+  замерами времени достаточно один раз вызвать ядро с n_iter=1.
+
+  Args:
+    f: Функция, скомпилированная через numba.njit.
+  """
+  _integrate_nb(f, 0.0, 1.0, 1)
+
+
+def integrate_numba(f: Callable[[float], float],
+            a: float,
+            b: float,
+            *,
+            n_iter: int = 100000) -> float:
+  """
+  Вычисляет определенный интеграл методом прямоугольников в машинном коде.
+
+  Тот же алгоритм, что и integrate из iteration1, но цикл компилируется
+  Numba, поэтому вызовы f не проходят через интерпретатор.
+
+  Args:
+    f: Функция одного аргумента, скомпилированная через numba.njit.
+    a: Нижний предел интегрирования.
+    b: Верхний предел интегрирования.
+    n_iter: Количество итераций (прямоугольников) для вычисления.
+
+  Returns:
+    Приближенное значение определенного интеграла ∫f(x)dx от a до b.
+  """
+  # Приводим пределы к float, чтобы не плодить специализации под int
+  return _integrate_nb(f, float(a), float(b), n_iter)
+
+
+def integrate_trap_numba(f: Callable[[float], float],
+            a: float,
+            b: float,
+            *,
+            n_iter: int = 100000) -> float:
+  """
+  Вычисляет определенный интеграл методом трапеций в машинном коде.
+
+  Args:
+    f: Функция одного аргумента, скомпилированная через numba.njit.
+    a: Нижний предел интегрирования.
+    b: Верхний предел интегрирования.
+    n_iter: Количество итераций (трапеций) для вычисления.
+
+  Returns:
+    Приближенное значение определенного интеграла ∫f(x)dx от a до b.
+  """
+  return _integrate_trap_nb(f, float(a), float(b), n_iter)
+
+
+def integrate_sin_numba_parallel(a: float,
+            b: float,
+            *,
+            n_jobs: int = 2,
+            n_iter: int = 100000) -> float:
+  """
+  Вычисляет интеграл sin(x) методом прямоугольников в n_jobs потоках.
+
+  Цикл распараллеливается Numba (prange с редукцией суммы) внутри
+  одного вызова, без пулов потоков/процессов и без GIL.
+
+  Args:
+    a: Нижний предел интегрирования.
+    b: Верхний предел интегрирования.
+    n_jobs: Количество потоков (не больше числа потоков Numba).
+    n_iter: Количество итераций (прямоугольников) для вычисления.
+
+  Returns:
+    Приближенное значение определенного интеграла ∫sin(x)dx от a до b.
+  """
+  set_num_threads(min(n_jobs, config.NUMBA_NUM_THREADS))
+  return _integrate_sin_par(float(a), float(b), n_iter)
@@ -1,6 +1,6 @@
 import unittest
 import math
-from iteration1 import integrate
+from iteration1 import integrate, integrate_trap
 
 # Юнит-тесты
 class TestIntegrate(unittest.TestCase):
@@ -24,6 +24,24 @@ class TestIntegrate(unittest.TestCase):
         """Проверка с обратными пределами интегрирования"""
         result = integrate(math.sin, math.pi, 0, n_iter=1000)
         self.assertAlmostEqual(result, -2.0, places=2)
+
+
+
+class TestIntegrateTrap(unittest.TestCase):
+    def test_sin_integral(self):
+        """Метод трапеций: интеграл sin(x) от 0 до π при n_iter=1000"""
+        result = integrate_trap(math.sin, 0, math.pi, n_iter=1000)
+        self.assertAlmostEqual(result, 2.0, places=5)
+    
+    def test_polynomial(self):
+        """Метод трапеций: интеграл x² от 0 до 1 при n_iter=1000"""
+        result = integrate_trap(lambda x: x**2, 0, 1, n_iter=1000)
+        self.assertAlmostEqual(result, 1/3, places=6)
+    
+    def test_reverse_bounds(self):
+        """Метод трапеций с обратными пределами интегрирования"""
+        result = integrate_trap(math.sin, math.pi, 0, n_iter=1000)
+        self.assertAlmostEqual(result, -2.0, places=5)
         
         
 if __name__ == "__main__":
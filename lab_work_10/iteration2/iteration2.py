@@ -1,6 +1,7 @@
 import concurrent.futures as ftres
 from functools import partial
-from typing import Callable, List
+from typing import Callable
+import numpy as np
 from iteration1.iteration1 import integrate
 
 def integrate_threaded(f: Callable[[float], float], 
@@ -21,22 +22,62 @@ def integrate_threaded(f: Callable[[float], float],
   
   Returns:
     Приближенное значение интеграла.
+  
+  Note:
+    Если у f есть атрибут __nogil__ (его выставляют обертки из iteration5),
+    он содержит ядро kernel(a, b, n_iter, n_threads), которое само
+    распараллеливает цикл без GIL. Тогда пул потоков не создается:
+    потоки Python лишь сериализовались бы на GIL вокруг вызовов f.
   """
-  executor = ftres.ThreadPoolExecutor(max_workers=n_jobs)
+  kernel = getattr(f, "__nogil__", None)
+  if kernel is not None:
+    return kernel(a, b, n_iter, n_jobs)
   
-  # Создаем частичную функцию с зафиксированными аргументами
-  spawn = partial(executor.submit, integrate, f, n_iter=n_iter // n_jobs)
+  # Частичная функция с зафиксированными f и n_iter, границы задаются map
+  part = partial(integrate, f, n_iter=n_iter // n_jobs)
   
   step = (b - a) / n_jobs
-  fs: List[ftres.Future] = []
-  
-  # Создаем задачи для каждого потока
-  for i in range(n_jobs):
-    a_i = a + i * step
-    b_i = a + (i + 1) * step
-    # print(f"Поток {i}, границы: [{a_i:.3f}, {b_i:.3f}]")
-    fs.append(spawn(a_i, b_i))
-  
-  # Собираем результаты
-  results = [f.result() for f in ftres.as_completed(fs)]
-  return sum(results)
\ No newline at end of file
+  bounds_a = [a + i * step for i in range(n_jobs)]
+  bounds_b = [a + (i + 1) * step for i in range(n_jobs)]
+  
+  # Пул закрывается сразу после расчета, потоки не переживают вызов
+  with ftres.ThreadPoolExecutor(max_workers=n_jobs) as executor:
+    # Собираем результаты
+    return sum(executor.map(part, bounds_a, bounds_b))
+
+
+def _sum_chunk(f: np.ufunc, xs: np.ndarray) -> float:
+  """Суммирует значения f на узлах xs (ufunc отпускает GIL на время расчета)."""
+  return float(f(xs).sum())
+
+
+def integrate_numpy_threaded(f: np.ufunc, 
+  a: float, 
+  b: float, 
+  *, 
+  n_jobs: int = 2, 
+  n_iter: int = 10000) -> float:
+  """
+  Вычисляет интеграл векторизованной функции в нескольких потоках.
+  
+  Узлы сетки строятся один раз в вызывающем потоке и делятся на n_jobs
+  срезов-представлений без копирования. Каждый поток применяет f
+  к своему срезу; ufunc NumPy отпускают GIL, поэтому потоки работают
+  параллельно, а данные между ними не передаются.
+  
+  Args:
+    f: Векторизованная функция (ufunc), например np.sin.
+    a: Нижний предел.
+    b: Верхний предел.
+    n_jobs: Количество потоков.
+    n_iter: Общее количество итераций.
+  
+  Returns:
+    Приближенное значение интеграла.
+  """
+  step = (b - a) / n_iter
+  xs = a + np.arange(n_iter, dtype=np.float64) * step
+  chunks = np.array_split(xs, n_jobs)
+  
+  with ftres.ThreadPoolExecutor(max_workers=n_jobs) as executor:
+    return sum(executor.map(partial(_sum_chunk, f), chunks)) * step
\ No newline at end of file
@@ -1,8 +1,23 @@
 import concurrent.futures as ftres
-from functools import partial
-from typing import Callable, List
+from itertools import repeat
+from typing import Callable, Optional
 from iteration1.iteration1 import integrate
 
+# Интегрируемая функция в процессе-работнике (задается инициализатором)
+_f: Optional[Callable[[float], float]] = None
+
+
+def _set_f(f: Callable[[float], float]) -> None:
+  """Сохраняет f в процессе-работнике, чтобы не передавать ее с каждой задачей."""
+  global _f
+  _f = f
+
+
+def _integrate_part(a: float, b: float, n_iter: int) -> float:
+  """Считает интеграл _f на отрезке [a, b] в процессе-работнике."""
+  return integrate(_f, a, b, n_iter=n_iter)
+
+
 def integrate_processed(
   f: Callable[[float], float], 
   a: float, 
@@ -14,6 +29,9 @@ def integrate_processed(
   """
   Вычисляет интеграл с использованием многопроцессности.
   
+  Функция f сериализуется один раз на процесс через инициализатор пула,
+  задачи содержат только границы отрезков.
+  
   Args:
       f: Интегрируемая функция.
       a: Нижний предел.
@@ -24,20 +42,14 @@ def integrate_processed(
   Returns:
       Приближенное значение интеграла.
   """
-  executor = ftres.ProcessPoolExecutor(max_workers=n_jobs)
-  
-  spawn = partial(executor.submit, integrate, f, n_iter=n_iter // n_jobs)
-  
   step = (b - a) / n_jobs
-  fs: List[ftres.Future] = []
-  
-  # Создаем задачи для каждого процесса
-  for i in range(n_jobs):
-    a_i = a + i * step
-    b_i = a + (i + 1) * step
-    # print(f"Процесс {i}, границы: [{a_i:.3f}, {b_i:.3f}]")
-    fs.append(spawn(a_i, b_i))
+  bounds_a = [a + i * step for i in range(n_jobs)]
+  bounds_b = [a + (i + 1) * step for i in range(n_jobs)]
   
-  # Собираем результаты
-  results = [f.result() for f in ftres.as_completed(fs)]
-  return sum(results)
\ No newline at end of file
+  with ftres.ProcessPoolExecutor(
+    max_workers=n_jobs, initializer=_set_f, initargs=(f,)
+  ) as executor:
+    results = executor.map(
+      _integrate_part, bounds_a, bounds_b, repeat(n_iter // n_jobs)
+    )
+    return sum(results)
\ No newline at end of file
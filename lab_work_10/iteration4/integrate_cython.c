@@ -1525,10 +1525,11 @@ static const char* const __pyx_f[] = {
 
 /*--- Type declarations ---*/
 struct __pyx_opt_args_10iteration4_16integrate_cython_integrate_cython;
+struct __pyx_opt_args_10iteration4_16integrate_cython_integrate_cython_trap;
 
-/* "iteration4/integrate_cython.pyx":7
- * @cython.wraparound(False)
+/* "iteration4/integrate_cython.pyx":8
  * @cython.nonecheck(False)
+ * @cython.cdivision(True)
  * cpdef double integrate_cython(f, double a, double b, int n_iter=100000):             # <<<<<<<<<<<<<<
  *     """
  *     Cython-     .
@@ -1537,6 +1538,18 @@ struct __pyx_opt_args_10iteration4_16integrate_cython_integrate_cython {
   int __pyx_n;
   int n_iter;
 };
+
+/* "iteration4/integrate_cython.pyx":50
+ * @cython.nonecheck(False)
+ * @cython.cdivision(True)
+ * cpdef double integrate_cython_trap(f, double a, double b, int n_iter=100000):             # <<<<<<<<<<<<<<
+ *     """
+ *     Cython-    .
+*/
+struct __pyx_opt_args_10iteration4_16integrate_cython_integrate_cython_trap {
+  int __pyx_n;
+  int n_iter;
+};
 /* #### Code section: utility_code_proto ### */
 
 /* --- Runtime support code (head) --- */
@@ -2216,6 +2229,7 @@ static int __Pyx_State_RemoveModule(void*);
 
 /* Module declarations from "iteration4.integrate_cython" */
 static double __pyx_f_10iteration4_16integrate_cython_integrate_cython(PyObject *, double, double, int __pyx_skip_dispatch, struct __pyx_opt_args_10iteration4_16integrate_cython_integrate_cython *__pyx_optional_args); /*proto*/
+static double __pyx_f_10iteration4_16integrate_cython_integrate_cython_trap(PyObject *, double, double, int __pyx_skip_dispatch, struct __pyx_opt_args_10iteration4_16integrate_cython_integrate_cython_trap *__pyx_optional_args); /*proto*/
 /* #### Code section: typeinfo ### */
 /* #### Code section: before_global_var ### */
 #define __Pyx_MODULE_NAME "iteration4.integrate_cython"
@@ -2227,6 +2241,7 @@ int __pyx_module_is_main_iteration4__integrate_cython = 0;
 /* #### Code section: string_decls ### */
 /* #### Code section: decls ### */
 static PyObject *__pyx_pf_10iteration4_16integrate_cython_integrate_cython(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_f, double __pyx_v_a, double __pyx_v_b, int __pyx_v_n_iter); /* proto */
+static PyObject *__pyx_pf_10iteration4_16integrate_cython_2integrate_cython_trap(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_f, double __pyx_v_a, double __pyx_v_b, int __pyx_v_n_iter); /* proto */
 /* #### Code section: late_includes ### */
 /* #### Code section: module_state ### */
 /* SmallCodeConfig */
@@ -2251,8 +2266,8 @@ typedef struct {
   __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_pop;
   __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_values;
   PyObject *__pyx_tuple[1];
-  PyObject *__pyx_codeobj_tab[1];
-  PyObject *__pyx_string_tab[24];
+  PyObject *__pyx_codeobj_tab[2];
+  PyObject *__pyx_string_tab[26];
   PyObject *__pyx_number_tab[1];
 /* #### Code section: module_state_contents ### */
 /* CommonTypesMetaclass.module_state_decls */
@@ -2304,20 +2319,22 @@ static __pyx_mstatetype * const __pyx_mstate_global = &__pyx_mstate_global_stati
 #define __pyx_n_u_f __pyx_string_tab[7]
 #define __pyx_n_u_func __pyx_string_tab[8]
 #define __pyx_n_u_integrate_cython __pyx_string_tab[9]
-#define __pyx_n_u_is_coroutine __pyx_string_tab[10]
-#define __pyx_n_u_items __pyx_string_tab[11]
-#define __pyx_n_u_iteration4_integrate_cython __pyx_string_tab[12]
-#define __pyx_n_u_main __pyx_string_tab[13]
-#define __pyx_n_u_module __pyx_string_tab[14]
-#define __pyx_n_u_n_iter __pyx_string_tab[15]
-#define __pyx_n_u_name __pyx_string_tab[16]
-#define __pyx_n_u_pop __pyx_string_tab[17]
-#define __pyx_n_u_qualname __pyx_string_tab[18]
-#define __pyx_n_u_set_name __pyx_string_tab[19]
-#define __pyx_n_u_setdefault __pyx_string_tab[20]
-#define __pyx_n_u_test __pyx_string_tab[21]
-#define __pyx_n_u_values __pyx_string_tab[22]
-#define __pyx_kp_b_iso88591_A_a_Cr_U_1_Bb_A_q_Ba_1 __pyx_string_tab[23]
+#define __pyx_n_u_integrate_cython_trap __pyx_string_tab[10]
+#define __pyx_n_u_is_coroutine __pyx_string_tab[11]
+#define __pyx_n_u_items __pyx_string_tab[12]
+#define __pyx_n_u_iteration4_integrate_cython __pyx_string_tab[13]
+#define __pyx_n_u_main __pyx_string_tab[14]
+#define __pyx_n_u_module __pyx_string_tab[15]
+#define __pyx_n_u_n_iter __pyx_string_tab[16]
+#define __pyx_n_u_name __pyx_string_tab[17]
+#define __pyx_n_u_pop __pyx_string_tab[18]
+#define __pyx_n_u_qualname __pyx_string_tab[19]
+#define __pyx_n_u_set_name __pyx_string_tab[20]
+#define __pyx_n_u_setdefault __pyx_string_tab[21]
+#define __pyx_n_u_test __pyx_string_tab[22]
+#define __pyx_n_u_values __pyx_string_tab[23]
+#define __pyx_kp_b_iso88591_A_A_A_Cr_A_U_1_HAQc_1_Bb_Rr_Ba __pyx_string_tab[24]
+#define __pyx_kp_b_iso88591_F_Q_D_81AS_1A_A_Cr_U_3a_HAQb_Bf __pyx_string_tab[25]
 #define __pyx_int_100000 __pyx_number_tab[0]
 /* #### Code section: module_state_clear ### */
 #if CYTHON_USE_MODULE_STATE
@@ -2334,8 +2351,8 @@ static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
   __Pyx_State_RemoveModule(NULL);
   #endif
   for (int i=0; i<1; ++i) { Py_CLEAR(clear_module_state->__pyx_tuple[i]); }
-  for (int i=0; i<1; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<24; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<2; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
+  for (int i=0; i<26; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
   for (int i=0; i<1; ++i) { Py_CLEAR(clear_module_state->__pyx_number_tab[i]); }
 /* #### Code section: module_state_clear_contents ### */
 /* CommonTypesMetaclass.module_state_clear */
@@ -2360,8 +2377,8 @@ static CYTHON_SMALL_CODE int __pyx_m_traverse(PyObject *m, visitproc visit, void
   __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_bytes);
   __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_unicode);
   for (int i=0; i<1; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_tuple[i]); }
-  for (int i=0; i<1; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<24; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<2; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
+  for (int i=0; i<26; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
   for (int i=0; i<1; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_number_tab[i]); }
 /* #### Code section: module_state_traverse_contents ### */
 /* CommonTypesMetaclass.module_state_traverse */
@@ -2393,22 +2410,25 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
 ); /*proto*/
 static double __pyx_f_10iteration4_16integrate_cython_integrate_cython(PyObject *__pyx_v_f, double __pyx_v_a, double __pyx_v_b, CYTHON_UNUSED int __pyx_skip_dispatch, struct __pyx_opt_args_10iteration4_16integrate_cython_integrate_cython *__pyx_optional_args) {
   int __pyx_v_n_iter = ((int)0x186A0);
-  double __pyx_v_acc;
+  double __pyx_v_s;
+  double __pyx_v_c;
+  double __pyx_v_y;
+  double __pyx_v_t;
   double __pyx_v_step;
   double __pyx_v_x;
   int __pyx_v_i;
   double __pyx_r;
   __Pyx_RefNannyDeclarations
-  double __pyx_t_1;
+  int __pyx_t_1;
   int __pyx_t_2;
   int __pyx_t_3;
-  int __pyx_t_4;
+  PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
   PyObject *__pyx_t_6 = NULL;
   PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
-  size_t __pyx_t_10;
+  size_t __pyx_t_8;
+  double __pyx_t_9;
+  int __pyx_t_10;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -2419,106 +2439,168 @@ static double __pyx_f_10iteration4_16integrate_cython_integrate_cython(PyObject
     }
   }
 
-  /* "iteration4/integrate_cython.pyx":20
+  /* "iteration4/integrate_cython.pyx":26
  * 
  *     """
- *     cdef double acc = 0.0             # <<<<<<<<<<<<<<
- *     cdef double step = (b - a) / n_iter
- *     cdef double x
+ *     cdef double s = 0.0  #             # <<<<<<<<<<<<<<
+ *     cdef double c = 0.0  #
+ *     cdef double y, t
 */
-  __pyx_v_acc = 0.0;
+  __pyx_v_s = 0.0;
 
-  /* "iteration4/integrate_cython.pyx":21
+  /* "iteration4/integrate_cython.pyx":27
  *     """
- *     cdef double acc = 0.0
+ *     cdef double s = 0.0  #
+ *     cdef double c = 0.0  #             # <<<<<<<<<<<<<<
+ *     cdef double y, t
+ *     cdef double step = (b - a) / n_iter
+*/
+  __pyx_v_c = 0.0;
+
+  /* "iteration4/integrate_cython.pyx":29
+ *     cdef double c = 0.0  #
+ *     cdef double y, t
  *     cdef double step = (b - a) / n_iter             # <<<<<<<<<<<<<<
- *     cdef double x
+ *     cdef double x = a
  *     cdef int i
 */
-  __pyx_t_1 = (__pyx_v_b - __pyx_v_a);
-  if (unlikely(__pyx_v_n_iter == 0)) {
-    PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-    __PYX_ERR(0, 21, __pyx_L1_error)
-  }
-  __pyx_v_step = (__pyx_t_1 / ((double)__pyx_v_n_iter));
+  __pyx_v_step = ((__pyx_v_b - __pyx_v_a) / ((double)__pyx_v_n_iter));
 
-  /* "iteration4/integrate_cython.pyx":25
+  /* "iteration4/integrate_cython.pyx":30
+ *     cdef double y, t
+ *     cdef double step = (b - a) / n_iter
+ *     cdef double x = a             # <<<<<<<<<<<<<<
  *     cdef int i
  * 
- *     for i in range(n_iter):             # <<<<<<<<<<<<<<
- *         x = a + i * step
- *         acc += f(x) * step
 */
-  __pyx_t_2 = __pyx_v_n_iter;
-  __pyx_t_3 = __pyx_t_2;
-  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
-    __pyx_v_i = __pyx_t_4;
+  __pyx_v_x = __pyx_v_a;
 
-    /* "iteration4/integrate_cython.pyx":26
- * 
- *     for i in range(n_iter):
- *         x = a + i * step             # <<<<<<<<<<<<<<
- *         acc += f(x) * step
+  /* "iteration4/integrate_cython.pyx":33
+ *     cdef int i
  * 
+ *     for i in range(n_iter):             # <<<<<<<<<<<<<<
+ *         y = <double>f(x) - c
+ *         t = s + y
 */
-    __pyx_v_x = (__pyx_v_a + (__pyx_v_i * __pyx_v_step));
+  __pyx_t_1 = __pyx_v_n_iter;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
 
-    /* "iteration4/integrate_cython.pyx":27
- *     for i in range(n_iter):
- *         x = a + i * step
- *         acc += f(x) * step             # <<<<<<<<<<<<<<
+    /* "iteration4/integrate_cython.pyx":34
  * 
- *     return acc
+ *     for i in range(n_iter):
+ *         y = <double>f(x) - c             # <<<<<<<<<<<<<<
+ *         t = s + y
+ *         c = (t - s) - y
 */
-    __pyx_t_5 = PyFloat_FromDouble(__pyx_v_acc); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 27, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_7 = NULL;
+    __pyx_t_5 = NULL;
     __Pyx_INCREF(__pyx_v_f);
-    __pyx_t_8 = __pyx_v_f; 
-    __pyx_t_9 = PyFloat_FromDouble(__pyx_v_x); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 27, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_9);
-    __pyx_t_10 = 1;
+    __pyx_t_6 = __pyx_v_f; 
+    __pyx_t_7 = PyFloat_FromDouble(__pyx_v_x); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 34, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_8 = 1;
     #if CYTHON_UNPACK_METHODS
-    if (unlikely(PyMethod_Check(__pyx_t_8))) {
-      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_8);
-      assert(__pyx_t_7);
-      PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_8);
-      __Pyx_INCREF(__pyx_t_7);
+    if (unlikely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_6);
+      assert(__pyx_t_5);
+      PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_5);
       __Pyx_INCREF(__pyx__function);
-      __Pyx_DECREF_SET(__pyx_t_8, __pyx__function);
-      __pyx_t_10 = 0;
+      __Pyx_DECREF_SET(__pyx_t_6, __pyx__function);
+      __pyx_t_8 = 0;
     }
     #endif
     {
-      PyObject *__pyx_callargs[2] = {__pyx_t_7, __pyx_t_9};
-      __pyx_t_6 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_8, __pyx_callargs+__pyx_t_10, (2-__pyx_t_10) | (__pyx_t_10*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 27, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-    }
-    __pyx_t_8 = PyFloat_FromDouble(__pyx_v_step); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 27, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_8);
-    __pyx_t_9 = PyNumber_Multiply(__pyx_t_6, __pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 27, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_9);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __pyx_t_8 = PyNumber_InPlaceAdd(__pyx_t_5, __pyx_t_9); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 27, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_8);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-    __pyx_t_1 = __Pyx_PyFloat_AsDouble(__pyx_t_8); if (unlikely((__pyx_t_1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 27, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __pyx_v_acc = __pyx_t_1;
+      PyObject *__pyx_callargs[2] = {__pyx_t_5, __pyx_t_7};
+      __pyx_t_4 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_6, __pyx_callargs+__pyx_t_8, (2-__pyx_t_8) | (__pyx_t_8*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 34, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+    }
+    __pyx_t_9 = __Pyx_PyFloat_AsDouble(__pyx_t_4); if (unlikely((__pyx_t_9 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 34, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_v_y = (((double)__pyx_t_9) - __pyx_v_c);
+
+    /* "iteration4/integrate_cython.pyx":35
+ *     for i in range(n_iter):
+ *         y = <double>f(x) - c
+ *         t = s + y             # <<<<<<<<<<<<<<
+ *         c = (t - s) - y
+ *         s = t
+*/
+    __pyx_v_t = (__pyx_v_s + __pyx_v_y);
+
+    /* "iteration4/integrate_cython.pyx":36
+ *         y = <double>f(x) - c
+ *         t = s + y
+ *         c = (t - s) - y             # <<<<<<<<<<<<<<
+ *         s = t
+ *         if (i & 1023) == 1023:
+*/
+    __pyx_v_c = ((__pyx_v_t - __pyx_v_s) - __pyx_v_y);
+
+    /* "iteration4/integrate_cython.pyx":37
+ *         t = s + y
+ *         c = (t - s) - y
+ *         s = t             # <<<<<<<<<<<<<<
+ *         if (i & 1023) == 1023:
+ *             x = a + (i + 1) * step
+*/
+    __pyx_v_s = __pyx_v_t;
+
+    /* "iteration4/integrate_cython.pyx":38
+ *         c = (t - s) - y
+ *         s = t
+ *         if (i & 1023) == 1023:             # <<<<<<<<<<<<<<
+ *             x = a + (i + 1) * step
+ *         else:
+*/
+    __pyx_t_10 = ((__pyx_v_i & 0x3FF) == 0x3FF);
+    if (__pyx_t_10) {
+
+      /* "iteration4/integrate_cython.pyx":39
+ *         s = t
+ *         if (i & 1023) == 1023:
+ *             x = a + (i + 1) * step             # <<<<<<<<<<<<<<
+ *         else:
+ *             x += step
+*/
+      __pyx_v_x = (__pyx_v_a + ((__pyx_v_i + 1) * __pyx_v_step));
+
+      /* "iteration4/integrate_cython.pyx":38
+ *         c = (t - s) - y
+ *         s = t
+ *         if (i & 1023) == 1023:             # <<<<<<<<<<<<<<
+ *             x = a + (i + 1) * step
+ *         else:
+*/
+      goto __pyx_L5;
+    }
+
+    /* "iteration4/integrate_cython.pyx":41
+ *             x = a + (i + 1) * step
+ *         else:
+ *             x += step             # <<<<<<<<<<<<<<
+ * 
+ *     return s * step
+*/
+    /*else*/ {
+      __pyx_v_x = (__pyx_v_x + __pyx_v_step);
+    }
+    __pyx_L5:;
   }
 
-  /* "iteration4/integrate_cython.pyx":29
- *         acc += f(x) * step
+  /* "iteration4/integrate_cython.pyx":43
+ *             x += step
+ * 
+ *     return s * step             # <<<<<<<<<<<<<<
+ * 
  * 
- *     return acc             # <<<<<<<<<<<<<<
 */
-  __pyx_r = __pyx_v_acc;
+  __pyx_r = (__pyx_v_s * __pyx_v_step);
   goto __pyx_L0;
 
   /* "iteration4/integrate_cython.pyx":4
@@ -2531,11 +2613,10 @@ static double __pyx_f_10iteration4_16integrate_cython_integrate_cython(PyObject
 
   /* function exit code */
   __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_XDECREF(__pyx_t_9);
   __Pyx_AddTraceback("iteration4.integrate_cython.integrate_cython", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = -1;
   __pyx_L0:;
@@ -2551,7 +2632,7 @@ PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_10iteration4_16integrate_cython_integrate_cython, "\n    Cython-\320\276\320\277\321\202\320\270\320\274\320\270\320\267\320\270\321\200\320\276\320\262\320\260\320\275\320\275\320\260\321\217 \320\262\320\265\321\200\321\201\320\270\321\217 \321\207\320\270\321\201\320\273\320\265\320\275\320\275\320\276\320\263\320\276 \320\270\320\275\321\202\320\265\320\263\321\200\320\270\321\200\320\276\320\262\320\260\320\275\320\270\321\217 \320\274\320\265\321\202\320\276\320\264\320\276\320\274 \320\277\321\200\321\217\320\274\320\276\321\203\320\263\320\276\320\273\321\214\320\275\320\270\320\272\320\276\320\262.\n    \n    Args:\n        f: \320\244\321\203\320\275\320\272\321\206\320\270\321\217 Python \320\270\320\273\320\270 C-\321\204\321\203\320\275\320\272\321\206\320\270\321\217\n        a: \320\235\320\270\320\266\320\275\320\270\320\271 \320\277\321\200\320\265\320\264\320\265\320\273\n        b: \320\222\320\265\321\200\321\205\320\275\320\270\320\271 \320\277\321\200\320\265\320\264\320\265\320\273\n        n_iter: \320\232\320\276\320\273\320\270\321\207\320\265\321\201\321\202\320\262\320\276 \320\270\321\202\320\265\321\200\320\260\321\206\320\270\320\271\n    \n    Returns:\n        \320\237\321\200\320\270\320\261\320\273\320\270\320\266\320\265\320\275\320\275\320\276\320\265 \320\267\320\275\320\260\321\207\320\265\320\275\320\270\320\265 \320\270\320\275\321\202\320\265\320\263\321\200\320\260\320\273\320\260\n    ");
+PyDoc_STRVAR(__pyx_doc_10iteration4_16integrate_cython_integrate_cython, "\n    Cython-\320\276\320\277\321\202\320\270\320\274\320\270\320\267\320\270\321\200\320\276\320\262\320\260\320\275\320\275\320\260\321\217 \320\262\320\265\321\200\321\201\320\270\321\217 \321\207\320\270\321\201\320\273\320\265\320\275\320\275\320\276\320\263\320\276 \320\270\320\275\321\202\320\265\320\263\321\200\320\270\321\200\320\276\320\262\320\260\320\275\320\270\321\217 \320\274\320\265\321\202\320\276\320\264\320\276\320\274 \320\277\321\200\321\217\320\274\320\276\321\203\320\263\320\276\320\273\321\214\320\275\320\270\320\272\320\276\320\262.\n    \n    \320\241\320\273\320\260\320\263\320\260\320\265\320\274\321\213\320\265 \320\275\320\260\320\272\320\260\320\277\320\273\320\270\320\262\320\260\321\216\321\202\321\201\321\217 \321\201 \320\272\320\276\320\274\320\277\320\265\320\275\321\201\320\260\321\206\320\270\320\265\320\271 \320\232\321\215\321\205\321\215\320\275\320\260, \320\277\320\276\321\215\321\202\320\276\320\274\321\203 \320\276\321\210\320\270\320\261\320\272\320\260 \320\276\320\272\321\200\321\203\320\263\320\273\320\265\320\275\320\270\321\217\n    \320\275\320\265 \321\200\320\260\321\201\321\202\320\265\321\202 \321\201 n_iter, \320\260 \321\210\320\260\320\263 \321\203\320\274\320\275\320\276\320\266\320\260\320\265\321\202\321\201\321\217 \320\276\320\264\320\270\320\275 \321\200\320\260\320\267 \320\262 \320\272\320\276\320\275\321\206\320\265. \320\243\320\267\320\265\320\273 x \321\201\320\264\320\262\320\270\320\263\320\260\320\265\321\202\321\201\321\217\n    \321\201\320\273\320\276\320\266\320\265\320\275\320\270\320\265\320\274, \320\260 \320\272\320\260\320\266\320\264\321\213\320\265 1024 \321\210\320\260\320\263\320\260 \320\277\320\265\321\200\320\265\321\201\321\207\320\270\321\202\321\213\320\262\320\260\320\265\321\202\321\201\321\217 \321\202\320\276\321\207\320\275\320\276, \321\207\321\202\320\276\320\261\321\213 \320\275\320\265 \320\272\320\276\320\277\320\270\321\202\321\214\n    \320\276\321\210\320\270""\320\261\320\272\321\203 \320\276\321\202 \320\274\320\275\320\276\320\263\320\276\320\272\321\200\320\260\321\202\320\275\320\276\320\263\320\276 \320\277\321\200\320\270\320\261\320\260\320\262\320\273\320\265\320\275\320\270\321\217 step.\n    \n    Args:\n        f: \320\244\321\203\320\275\320\272\321\206\320\270\321\217 Python \320\270\320\273\320\270 C-\321\204\321\203\320\275\320\272\321\206\320\270\321\217\n        a: \320\235\320\270\320\266\320\275\320\270\320\271 \320\277\321\200\320\265\320\264\320\265\320\273\n        b: \320\222\320\265\321\200\321\205\320\275\320\270\320\271 \320\277\321\200\320\265\320\264\320\265\320\273\n        n_iter: \320\232\320\276\320\273\320\270\321\207\320\265\321\201\321\202\320\262\320\276 \320\270\321\202\320\265\321\200\320\260\321\206\320\270\320\271\n    \n    Returns:\n        \320\237\321\200\320\270\320\261\320\273\320\270\320\266\320\265\320\275\320\275\320\276\320\265 \320\267\320\275\320\260\321\207\320\265\320\275\320\270\320\265 \320\270\320\275\321\202\320\265\320\263\321\200\320\260\320\273\320\260\n    ");
 static PyMethodDef __pyx_mdef_10iteration4_16integrate_cython_1integrate_cython = {"integrate_cython", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10iteration4_16integrate_cython_1integrate_cython, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_10iteration4_16integrate_cython_integrate_cython};
 static PyObject *__pyx_pw_10iteration4_16integrate_cython_1integrate_cython(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
@@ -2631,10 +2712,10 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
       }
     }
     __pyx_v_f = values[0];
-    __pyx_v_a = __Pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_a == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 7, __pyx_L3_error)
-    __pyx_v_b = __Pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_b == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 7, __pyx_L3_error)
+    __pyx_v_a = __Pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_a == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 8, __pyx_L3_error)
+    __pyx_v_b = __Pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_b == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 8, __pyx_L3_error)
     if (values[3]) {
-      __pyx_v_n_iter = __Pyx_PyLong_As_int(values[3]); if (unlikely((__pyx_v_n_iter == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 7, __pyx_L3_error)
+      __pyx_v_n_iter = __Pyx_PyLong_As_int(values[3]); if (unlikely((__pyx_v_n_iter == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 8, __pyx_L3_error)
     } else {
       __pyx_v_n_iter = ((int)0x186A0);
     }
@@ -2692,6 +2773,390 @@ static PyObject *__pyx_pf_10iteration4_16integrate_cython_integrate_cython(CYTHO
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
+
+/* "iteration4/integrate_cython.pyx":46
+ * 
+ * 
+ * @cython.boundscheck(False)             # <<<<<<<<<<<<<<
+ * @cython.wraparound(False)
+ * @cython.nonecheck(False)
+*/
+
+static PyObject *__pyx_pw_10iteration4_16integrate_cython_3integrate_cython_trap(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static double __pyx_f_10iteration4_16integrate_cython_integrate_cython_trap(PyObject *__pyx_v_f, double __pyx_v_a, double __pyx_v_b, CYTHON_UNUSED int __pyx_skip_dispatch, struct __pyx_opt_args_10iteration4_16integrate_cython_integrate_cython_trap *__pyx_optional_args) {
+  int __pyx_v_n_iter = ((int)0x186A0);
+  double __pyx_v_s;
+  double __pyx_v_c;
+  double __pyx_v_y;
+  double __pyx_v_t;
+  double __pyx_v_step;
+  int __pyx_v_i;
+  double __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  size_t __pyx_t_5;
+  double __pyx_t_6;
+  double __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("integrate_cython_trap", 0);
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_n_iter = __pyx_optional_args->n_iter;
+    }
+  }
+
+  /* "iteration4/integrate_cython.pyx":63
+ * 
+ *     """
+ *     cdef double s = 0.5 * (<double>f(a) + <double>f(b))             # <<<<<<<<<<<<<<
+ *     cdef double c = 0.0
+ *     cdef double y, t
+*/
+  __pyx_t_2 = NULL;
+  __Pyx_INCREF(__pyx_v_f);
+  __pyx_t_3 = __pyx_v_f; 
+  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_a); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
+    assert(__pyx_t_2);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_3);
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_3, __pyx__function);
+    __pyx_t_5 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_2, __pyx_t_4};
+    __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_3, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 63, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __pyx_t_6 = __Pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 63, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = NULL;
+  __Pyx_INCREF(__pyx_v_f);
+  __pyx_t_4 = __pyx_v_f; 
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_b); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_4);
+    assert(__pyx_t_3);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_4);
+    __Pyx_INCREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_4, __pyx__function);
+    __pyx_t_5 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_t_2};
+    __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 63, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __pyx_t_7 = __Pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_7 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 63, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_s = (0.5 * (((double)__pyx_t_6) + ((double)__pyx_t_7)));
+
+  /* "iteration4/integrate_cython.pyx":64
+ *     """
+ *     cdef double s = 0.5 * (<double>f(a) + <double>f(b))
+ *     cdef double c = 0.0             # <<<<<<<<<<<<<<
+ *     cdef double y, t
+ *     cdef double step = (b - a) / n_iter
+*/
+  __pyx_v_c = 0.0;
+
+  /* "iteration4/integrate_cython.pyx":66
+ *     cdef double c = 0.0
+ *     cdef double y, t
+ *     cdef double step = (b - a) / n_iter             # <<<<<<<<<<<<<<
+ *     cdef int i
+ * 
+*/
+  __pyx_v_step = ((__pyx_v_b - __pyx_v_a) / ((double)__pyx_v_n_iter));
+
+  /* "iteration4/integrate_cython.pyx":69
+ *     cdef int i
+ * 
+ *     for i in range(1, n_iter):             # <<<<<<<<<<<<<<
+ *         y = <double>f(a + i * step) - c
+ *         t = s + y
+*/
+  __pyx_t_8 = __pyx_v_n_iter;
+  __pyx_t_9 = __pyx_t_8;
+  for (__pyx_t_10 = 1; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_i = __pyx_t_10;
+
+    /* "iteration4/integrate_cython.pyx":70
+ * 
+ *     for i in range(1, n_iter):
+ *         y = <double>f(a + i * step) - c             # <<<<<<<<<<<<<<
+ *         t = s + y
+ *         c = (t - s) - y
+*/
+    __pyx_t_4 = NULL;
+    __Pyx_INCREF(__pyx_v_f);
+    __pyx_t_2 = __pyx_v_f; 
+    __pyx_t_3 = PyFloat_FromDouble((__pyx_v_a + (__pyx_v_i * __pyx_v_step))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 70, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_5 = 1;
+    #if CYTHON_UNPACK_METHODS
+    if (unlikely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
+      assert(__pyx_t_4);
+      PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(__pyx__function);
+      __Pyx_DECREF_SET(__pyx_t_2, __pyx__function);
+      __pyx_t_5 = 0;
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_t_3};
+      __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_2, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 70, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __pyx_t_7 = __Pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_7 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 70, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_v_y = (((double)__pyx_t_7) - __pyx_v_c);
+
+    /* "iteration4/integrate_cython.pyx":71
+ *     for i in range(1, n_iter):
+ *         y = <double>f(a + i * step) - c
+ *         t = s + y             # <<<<<<<<<<<<<<
+ *         c = (t - s) - y
+ *         s = t
+*/
+    __pyx_v_t = (__pyx_v_s + __pyx_v_y);
+
+    /* "iteration4/integrate_cython.pyx":72
+ *         y = <double>f(a + i * step) - c
+ *         t = s + y
+ *         c = (t - s) - y             # <<<<<<<<<<<<<<
+ *         s = t
+ * 
+*/
+    __pyx_v_c = ((__pyx_v_t - __pyx_v_s) - __pyx_v_y);
+
+    /* "iteration4/integrate_cython.pyx":73
+ *         t = s + y
+ *         c = (t - s) - y
+ *         s = t             # <<<<<<<<<<<<<<
+ * 
+ *     return s * step
+*/
+    __pyx_v_s = __pyx_v_t;
+  }
+
+  /* "iteration4/integrate_cython.pyx":75
+ *         s = t
+ * 
+ *     return s * step             # <<<<<<<<<<<<<<
+*/
+  __pyx_r = (__pyx_v_s * __pyx_v_step);
+  goto __pyx_L0;
+
+  /* "iteration4/integrate_cython.pyx":46
+ * 
+ * 
+ * @cython.boundscheck(False)             # <<<<<<<<<<<<<<
+ * @cython.wraparound(False)
+ * @cython.nonecheck(False)
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("iteration4.integrate_cython.integrate_cython_trap", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_10iteration4_16integrate_cython_3integrate_cython_trap(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_10iteration4_16integrate_cython_2integrate_cython_trap, "\n    Cython-\320\262\320\265\321\200\321\201\320\270\321\217 \321\207\320\270\321\201\320\273\320\265\320\275\320\275\320\276\320\263\320\276 \320\270\320\275\321\202\320\265\320\263\321\200\320\270\321\200\320\276\320\262\320\260\320\275\320\270\321\217 \320\274\320\265\321\202\320\276\320\264\320\276\320\274 \321\202\321\200\320\260\320\277\320\265\321\206\320\270\320\271.\n    \n    Args:\n        f: \320\244\321\203\320\275\320\272\321\206\320\270\321\217 Python \320\270\320\273\320\270 C-\321\204\321\203\320\275\320\272\321\206\320\270\321\217\n        a: \320\235\320\270\320\266\320\275\320\270\320\271 \320\277\321\200\320\265\320\264\320\265\320\273\n        b: \320\222\320\265\321\200\321\205\320\275\320\270\320\271 \320\277\321\200\320\265\320\264\320\265\320\273\n        n_iter: \320\232\320\276\320\273\320\270\321\207\320\265\321\201\321\202\320\262\320\276 \320\270\321\202\320\265\321\200\320\260\321\206\320\270\320\271\n    \n    Returns:\n        \320\237\321\200\320\270\320\261\320\273\320\270\320\266\320\265\320\275\320\275\320\276\320\265 \320\267\320\275\320\260\321\207\320\265\320\275\320\270\320\265 \320\270\320\275\321\202\320\265\320\263\321\200\320\260\320\273\320\260\n    ");
+static PyMethodDef __pyx_mdef_10iteration4_16integrate_cython_3integrate_cython_trap = {"integrate_cython_trap", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10iteration4_16integrate_cython_3integrate_cython_trap, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_10iteration4_16integrate_cython_2integrate_cython_trap};
+static PyObject *__pyx_pw_10iteration4_16integrate_cython_3integrate_cython_trap(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_f = 0;
+  double __pyx_v_a;
+  double __pyx_v_b;
+  int __pyx_v_n_iter;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[4] = {0,0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("integrate_cython_trap (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_f,&__pyx_mstate_global->__pyx_n_u_a,&__pyx_mstate_global->__pyx_n_u_b,&__pyx_mstate_global->__pyx_n_u_n_iter,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 46, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  4:
+        values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 46, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 46, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 46, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 46, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "integrate_cython_trap", 0) < (0)) __PYX_ERR(0, 46, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("integrate_cython_trap", 0, 3, 4, i); __PYX_ERR(0, 46, __pyx_L3_error) }
+      }
+    } else {
+      switch (__pyx_nargs) {
+        case  4:
+        values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 46, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 46, __pyx_L3_error)
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 46, __pyx_L3_error)
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 46, __pyx_L3_error)
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_f = values[0];
+    __pyx_v_a = __Pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_a == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 50, __pyx_L3_error)
+    __pyx_v_b = __Pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_b == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 50, __pyx_L3_error)
+    if (values[3]) {
+      __pyx_v_n_iter = __Pyx_PyLong_As_int(values[3]); if (unlikely((__pyx_v_n_iter == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 50, __pyx_L3_error)
+    } else {
+      __pyx_v_n_iter = ((int)0x186A0);
+    }
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("integrate_cython_trap", 0, 3, 4, __pyx_nargs); __PYX_ERR(0, 46, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("iteration4.integrate_cython.integrate_cython_trap", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_10iteration4_16integrate_cython_2integrate_cython_trap(__pyx_self, __pyx_v_f, __pyx_v_a, __pyx_v_b, __pyx_v_n_iter);
+
+  /* function exit code */
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_10iteration4_16integrate_cython_2integrate_cython_trap(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_f, double __pyx_v_a, double __pyx_v_b, int __pyx_v_n_iter) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  double __pyx_t_1;
+  struct __pyx_opt_args_10iteration4_16integrate_cython_integrate_cython_trap __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("integrate_cython_trap", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2.__pyx_n = 1;
+  __pyx_t_2.n_iter = __pyx_v_n_iter;
+  __pyx_t_1 = __pyx_f_10iteration4_16integrate_cython_integrate_cython_trap(__pyx_v_f, __pyx_v_a, __pyx_v_b, 1, &__pyx_t_2); if (unlikely(__pyx_t_1 == ((double)-1) && PyErr_Occurred())) __PYX_ERR(0, 46, __pyx_L1_error)
+  __pyx_t_3 = PyFloat_FromDouble(__pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 46, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("iteration4.integrate_cython.integrate_cython_trap", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 /* #### Code section: module_exttypes ### */
 
 static PyMethodDef __pyx_methods[] = {
@@ -3057,6 +3522,22 @@ __Pyx_RefNannySetupContext("PyInit_integrate_cython", 0);
   if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_integrate_cython, __pyx_t_2) < (0)) __PYX_ERR(0, 4, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
+  /* "iteration4/integrate_cython.pyx":46
+ * 
+ * 
+ * @cython.boundscheck(False)             # <<<<<<<<<<<<<<
+ * @cython.wraparound(False)
+ * @cython.nonecheck(False)
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_10iteration4_16integrate_cython_3integrate_cython_trap, 0, __pyx_mstate_global->__pyx_n_u_integrate_cython_trap, NULL, __pyx_mstate_global->__pyx_n_u_iteration4_integrate_cython, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[1])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 46, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_mstate_global->__pyx_tuple[0]);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_integrate_cython_trap, __pyx_t_2) < (0)) __PYX_ERR(0, 46, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
   /* "iteration4/integrate_cython.pyx":1
  * import cython             # <<<<<<<<<<<<<<
  * from libc.math cimport sin, cos
@@ -3160,23 +3641,31 @@ static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
 static int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate) {
   CYTHON_UNUSED_VAR(__pyx_mstate);
   {
-    const struct { const unsigned int length: 7; } index[] = {{1},{20},{20},{1},{18},{1},{18},{1},{8},{16},{13},{5},{27},{8},{10},{6},{8},{3},{12},{12},{10},{8},{6},{74}};
-    #if (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (243 bytes) */
-const char* const cstring = "x\332eN\275J\304@\020N\216\213\234(\210X(\026\202\367\000\201\003{\271\323Z\016\301z\230\354Mt1\331\315eg\345\322Yn\271eJ\037\305\307H\351#\344\021n@\261\320)\276\231\217\357\207\271\325\206\351\271E&P\035\277X\2237\335\016`-\260\356\356\265bx\240\035?R\211\350:\243\264\315\225m\255gm\310\025\252\222\005\332\000\267\250\250@\365Z\002\224\336(\200\277\265\240\035\374&5S\355\004D\327\326\334\344\377\314P\243\264\312\324v\343+\002\220\274\330ec-\254\261\r\300\326c\365M\001\034\361\217$\327F\236\365\025\00309\3017\254<\271\367t<H\256\226\351g:^&\331y\304az\321O\372y\177\327\267\037\247\343,\311\016C\026\236\342u\\\014\263\343\260\nE\234\304y\\\016\263\223\260\215i<\213\253\210_\323\243\260\330\003dxv\317";
-    PyObject *data = __Pyx_DecompressString(cstring, 243, 1);
+    const struct { const unsigned int length: 8; } index[] = {{1},{20},{20},{1},{18},{1},{18},{1},{8},{16},{21},{13},{5},{27},{8},{10},{6},{8},{3},{12},{12},{10},{8},{6},{139},{129}};
+    #if (CYTHON_COMPRESS_STRINGS) == 2 /* compression: bz2 (406 bytes) */
+const char* const cstring = "BZh91AY&SY\205f\345\002\000\0004\177\377\377n~Q<A<@\275Az\000\277\357\377`@@@@@@@\000@\000\000@@\000@\0000\001[Ed4\242\031\006\236\246@\000\000\000\000\000\320\036\243\322\036P\211\220\232h\232\001\240\000\000\000\000\000\r\000\002T\321\244\321#d\321\211\006\200\000\000\000\000\321\246G\243R#B\211\016Cgw\360\304V\334\214\376L\306f!(VXA\007\260))\033\t\230\022\003\353k\" \025\031\220\020[i\017\314\030\347C\217]y\265\255\230 )?z\350\005\n\224\004db\021\n\205\216\342y\242\307\025V\240\350\332<[\032\304B\336\037\254.uiZFehF\210\2615\217@h\221\303\026\\\326A\217\310\214!9:S,\327X\262H\211n_\034\255\010\211\360]\261\007\005\252rV\240\250\304J\256\030\354\274KCB\001\216\207\314\246*-\276\342Ib\342\037\213D(\023Vb :)\"p\340\252\t2D\300\357\342\023N|\023A\207\032\205,\222Y\313\001\260\024\323\276J\373\322\\vzk\315E*<*\013L\222\220\250{\215\3110-Y\001\210\"'\330\246\001y\317\232\3347\214d^\207\021\224<V\300\2709\254\355\220\240\351\307\340s\221\302\375\006\243\017\211\362\263\215\240i\246#\270HCo\021\202C!)\275%\2054\251\354\2502)b\025\034\215QU\020Tk\213\351\376.\344\212p\241!\n\315\312\004";
+    PyObject *data = __Pyx_DecompressString(cstring, 406, 2);
     if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
     const char* const bytes = __Pyx_PyBytes_AsString(data);
     #if !CYTHON_ASSUME_SAFE_MACROS
     if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
     #endif
-    #else /* compression: none (306 bytes) */
-const char* const bytes = "?integrate_cython.pyx__Pyx_PyDict_NextRefaasyncio.coroutinesbcline_in_tracebackf__func__integrate_cython_is_coroutineitemsiteration4.integrate_cython__main____module__n_iter__name__pop__qualname____set_name__setdefault__test__values\200\001\360\006\000\036A\001\300\001\360\032\000\005\027\220a\330\004\030\230\002\230\"\230C\230r\240\021\360\010\000\005\t\210\005\210U\220!\2201\330\010\014\210B\210b\220\002\220\"\220A\330\010\017\210q\220\001\220\023\220B\220a\340\004\013\2101";
+    #elif (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (351 bytes) */
+const char* const cstring = "x\332}\217\261N\3030\020\206\233\322VE\024\211P\220\020\003R)\003S\245\002\003\033J\250\020\023j\213\230O\216\353\200E\342\244\211\203\232\2151\243G\217\031;\366\021\372\030\031\373\010y\004\234\024\020*\010\017w\376}\377\335}\276\241\214\223\347\000q\0028\346/\036\353\371\361\014`\250\3020\036P\314\341\201\314\370\230\330\010\2051\303\324\353a/\360\"N\031\t-\354\250\004\224\001\017\020&\026\302\2576\200\0351\014\2609vS\027->\320\020\276\307QN\334P\005e\242\036\273\352\375\352\000\027\251U\352\270\336$r\010\000\203\302\2562r\225\362=\037`\032!g-\001B\302?K\3526Q?\210\034\016\300I\250\342\033r\"\022\276ky\263rbhK-?\253\324\017\205\221\325\016\204\261\252\035\311\252<\225\2672H\365\362%oT\352\333I=y\022\035\321\317\232\255\344^\030b$\260\334\227\2454\023KhYs7\031'\201h\013S\240\342\325\370*5\224S\317Z{\242*\272b,\002\331\226\246D\253\226.\364Um'\271Pm\323\022\245{\247-G\371q\2012\220[\362:\355\247F\3728\257\316\317\027\235E\177\361\007\336O\262\313\365\3325\233UzLi\247f\212\376a\374\006\370\000C\354\307\305";
+    PyObject *data = __Pyx_DecompressString(cstring, 351, 1);
+    if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
+    const char* const bytes = __Pyx_PyBytes_AsString(data);
+    #if !CYTHON_ASSUME_SAFE_MACROS
+    if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
+    #endif
+    #else /* compression: none (521 bytes) */
+const char* const bytes = "?integrate_cython.pyx__Pyx_PyDict_NextRefaasyncio.coroutinesbcline_in_tracebackf__func__integrate_cythonintegrate_cython_trap_is_coroutineitemsiteration4.integrate_cython__main____module__n_iter__name__pop__qualname____set_name__setdefault__test__values\200\001\360\010\000\036A\001\300\001\360$\000\005\025\220A\330\004\024\220A\340\004\030\230\002\230\"\230C\230r\240\021\330\004\024\220A\360\006\000\005\t\210\005\210U\220!\2201\330\010\014\210H\220A\220Q\220c\230\022\2301\330\010\014\210B\210b\220\001\330\010\r\210R\210r\220\023\220B\220a\330\010\014\210A\330\010\014\210B\210b\220\006\220c\230\021\330\014\020\220\002\220#\220R\220r\230\023\230B\230a\340\014\021\220\021\340\004\013\2102\210R\210q\200\001\360\010\000#F\001\300Q\360\032\000\005\025\220D\230\003\2308\2401\240A\240S\250\002\250(\260!\2601\260A\330\004\024\220A\340\004\030\230\002\230\"\230C\230r\240\021\360\006\000\005\t\210\005\210U\220!\2203\220a\330\010\014\210H\220A\220Q\220b\230\002\230\"\230B\230f\240B\240a\330\010\014\210B\210b\220\001\330\010\r\210R\210r\220\023\220B\220a\330\010\014\210A\340\004\013\2102\210R\210q";
     PyObject *data = NULL;
     CYTHON_UNUSED_VAR(__Pyx_DecompressString);
     #endif
     PyObject **stringtab = __pyx_mstate->__pyx_string_tab;
     Py_ssize_t pos = 0;
-    for (int i = 0; i < 23; i++) {
+    for (int i = 0; i < 24; i++) {
       Py_ssize_t bytes_length = index[i].length;
       PyObject *string = PyUnicode_DecodeUTF8(bytes + pos, bytes_length, NULL);
       if (likely(string) && i >= 2) PyUnicode_InternInPlace(&string);
@@ -3187,7 +3676,7 @@ const char* const bytes = "?integrate_cython.pyx__Pyx_PyDict_NextRefaasyncio.cor
       stringtab[i] = string;
       pos += bytes_length;
     }
-    for (int i = 23; i < 24; i++) {
+    for (int i = 24; i < 26; i++) {
       Py_ssize_t bytes_length = index[i].length;
       PyObject *string = PyBytes_FromStringAndSize(bytes + pos, bytes_length);
       stringtab[i] = string;
@@ -3198,15 +3687,15 @@ const char* const bytes = "?integrate_cython.pyx__Pyx_PyDict_NextRefaasyncio.cor
       }
     }
     Py_XDECREF(data);
-    for (Py_ssize_t i = 0; i < 24; i++) {
+    for (Py_ssize_t i = 0; i < 26; i++) {
       if (unlikely(PyObject_Hash(stringtab[i]) == -1)) {
         __PYX_ERR(0, 1, __pyx_L1_error)
       }
     }
     #if CYTHON_IMMORTAL_CONSTANTS
     {
-      PyObject **table = stringtab + 23;
-      for (Py_ssize_t i=0; i<1; ++i) {
+      PyObject **table = stringtab + 24;
+      for (Py_ssize_t i=0; i<2; ++i) {
         #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
         #if PY_VERSION_HEX < 0x030E0000
         if (_Py_IsOwnedByCurrentThread(table[i]) && Py_REFCNT(table[i]) == 1)
@@ -3261,7 +3750,7 @@ typedef struct {
     unsigned int num_kwonly_args : 1;
     unsigned int nlocals : 3;
     unsigned int flags : 10;
-    unsigned int first_line : 3;
+    unsigned int first_line : 6;
 } __Pyx_PyCode_New_function_description;
 /* NewCodeObj.proto */
 static PyObject* __Pyx_PyCode_New(
@@ -3280,7 +3769,12 @@ static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
   {
     const __Pyx_PyCode_New_function_description descr = {4, 0, 0, 4, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 4};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_f, __pyx_mstate->__pyx_n_u_a, __pyx_mstate->__pyx_n_u_b, __pyx_mstate->__pyx_n_u_n_iter};
-    __pyx_mstate_global->__pyx_codeobj_tab[0] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_integrate_cython_pyx, __pyx_mstate->__pyx_n_u_integrate_cython, __pyx_mstate->__pyx_kp_b_iso88591_A_a_Cr_U_1_Bb_A_q_Ba_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[0])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[0] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_integrate_cython_pyx, __pyx_mstate->__pyx_n_u_integrate_cython, __pyx_mstate->__pyx_kp_b_iso88591_A_A_A_Cr_A_U_1_HAQc_1_Bb_Rr_Ba, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[0])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {4, 0, 0, 4, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 46};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_f, __pyx_mstate->__pyx_n_u_a, __pyx_mstate->__pyx_n_u_b, __pyx_mstate->__pyx_n_u_n_iter};
+    __pyx_mstate_global->__pyx_codeobj_tab[1] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_integrate_cython_pyx, __pyx_mstate->__pyx_n_u_integrate_cython_trap, __pyx_mstate->__pyx_kp_b_iso88591_F_Q_D_81AS_1A_A_Cr_U_3a_HAQb_Bf, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[1])) goto bad;
   }
   Py_DECREF(tuple_dedup_map);
   return 0;
@@ -4,10 +4,16 @@ from libc.math cimport sin, cos
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.nonecheck(False)
+@cython.cdivision(True)
 cpdef double integrate_cython(f, double a, double b, int n_iter=100000):
     """
     Cython-оптимизированная версия численного интегрирования методом прямоугольников.
     
+    Слагаемые накапливаются с компенсацией Кэхэна, поэтому ошибка округления
+    не растет с n_iter, а шаг умножается один раз в конце. Узел x сдвигается
+    сложением, а каждые 1024 шага пересчитывается точно, чтобы не копить
+    ошибку от многократного прибавления step.
+    
     Args:
         f: Функция Python или C-функция
         a: Нижний предел
@@ -17,13 +23,53 @@ cpdef double integrate_cython(f, double a, double b, int n_iter=100000):
     Returns:
         Приближенное значение интеграла
     """
-    cdef double acc = 0.0
+    cdef double s = 0.0  # сумма
+    cdef double c = 0.0  # накопленная потеря младших разрядов
+    cdef double y, t
     cdef double step = (b - a) / n_iter
-    cdef double x
+    cdef double x = a
     cdef int i
     
     for i in range(n_iter):
-        x = a + i * step
-        acc += f(x) * step
+        y = <double>f(x) - c
+        t = s + y
+        c = (t - s) - y
+        s = t
+        if (i & 1023) == 1023:
+            x = a + (i + 1) * step
+        else:
+            x += step
+    
+    return s * step
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.nonecheck(False)
+@cython.cdivision(True)
+cpdef double integrate_cython_trap(f, double a, double b, int n_iter=100000):
+    """
+    Cython-версия численного интегрирования методом трапеций.
+    
+    Args:
+        f: Функция Python или C-функция
+        a: Нижний предел
+        b: Верхний предел
+        n_iter: Количество итераций
+    
+    Returns:
+        Приближенное значение интеграла
+    """
+    cdef double s = 0.5 * (<double>f(a) + <double>f(b))
+    cdef double c = 0.0
+    cdef double y, t
+    cdef double step = (b - a) / n_iter
+    cdef int i
+    
+    for i in range(1, n_iter):
+        y = <double>f(a + i * step) - c
+        t = s + y
+        c = (t - s) - y
+        s = t
     
-    return acc
+    return s * step
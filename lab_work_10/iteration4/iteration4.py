@@ -1,7 +1,35 @@
 import concurrent.futures as ftres
+import importlib
+import math
+import multiprocessing as mp
+import sys
+import tempfile
 from functools import partial
+from itertools import repeat
+from pathlib import Path
+from typing import Callable, Dict, Optional
 import iteration4.integrate_cython as cy # type: ignore
 
+# fork дешевле spawn: дочерний процесс получает копию уже загруженного модуля
+_MP_CONTEXT = mp.get_context(
+  "fork" if "fork" in mp.get_all_start_methods() else "spawn"
+)
+
+# Интегрируемая функция в процессе-работнике (задается инициализатором)
+_f = None
+
+
+def _set_f(f) -> None:
+  """Сохраняет f в процессе-работнике, чтобы не передавать ее с каждой задачей."""
+  global _f
+  _f = f
+
+
+def _integrate_part(a: float, b: float, n_iter: int) -> float:
+  """Считает интеграл _f на отрезке [a, b] Cython-ядром."""
+  return cy.integrate_cython(_f, a, b, n_iter=n_iter)
+
+
 # Многопоточная версия с Cython
 def integrate_cython_threaded(
   f, 
@@ -14,21 +42,14 @@ def integrate_cython_threaded(
   """
   Многопоточная версия с Cython-оптимизированной функцией.
   """
-  executor = ftres.ThreadPoolExecutor(max_workers=n_jobs)
-  
-  spawn = partial(executor.submit, cy.integrate_cython, f, 
-                  n_iter=n_iter // n_jobs)
+  part = partial(cy.integrate_cython, f, n_iter=n_iter // n_jobs)
   
   step = (b - a) / n_jobs
-  fs = []
-  
-  for i in range(n_jobs):
-    a_i = a + i * step
-    b_i = a + (i + 1) * step
-    fs.append(spawn(a_i, b_i))
+  bounds_a = [a + i * step for i in range(n_jobs)]
+  bounds_b = [a + (i + 1) * step for i in range(n_jobs)]
   
-  results = [f.result() for f in ftres.as_completed(fs)]
-  return sum(results)
+  with ftres.ThreadPoolExecutor(max_workers=n_jobs) as executor:
+    return sum(executor.map(part, bounds_a, bounds_b))
   
   
 # Многопроцессная версия с Cython
@@ -42,21 +63,106 @@ def integrate_cython_processed(
   ) -> float:
   """
   Многопроцессная версия с Cython-оптимизированной функцией.
+  
+  Где доступен fork, работники наследуют уже импортированное расширение
+  и не импортируют его заново, как при spawn. Функция f передается
+  один раз на процесс через инициализатор пула.
+  """
+  step = (b - a) / n_jobs
+  bounds_a = [a + i * step for i in range(n_jobs)]
+  bounds_b = [a + (i + 1) * step for i in range(n_jobs)]
+  
+  with ftres.ProcessPoolExecutor(
+    max_workers=n_jobs,
+    mp_context=_MP_CONTEXT,
+    initializer=_set_f,
+    initargs=(f,),
+  ) as executor:
+    results = executor.map(
+      _integrate_part, bounds_a, bounds_b, repeat(n_iter // n_jobs)
+    )
+    return sum(results)
+
+
+# Функции math, для которых есть nogil-аналог в libc.math
+_LIBC_MATH = frozenset(
+  {"sin", "cos", "tan", "exp", "log", "sqrt", "atan", "sinh", "cosh", "tanh"}
+)
+
+# Каталог для сгенерированных .pyx и кэш уже собранных ядер по имени функции
+_GENERATED_DIR = Path(tempfile.gettempdir()) / "integrate_specialized"
+_COMPILED: Dict[str, Callable[[float, float, int], float]] = {}
+
+_KERNEL_TEMPLATE = """\
+import cython
+from libc.math cimport {name}
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def integrate(double a, double b, long n_iter):
+    cdef double acc = 0.0
+    cdef double step = (b - a) / n_iter
+    cdef long i
+    with nogil:
+        for i in range(n_iter):
+            acc += {name}(a + i * step)
+    return acc * step
+"""
+
+
+def _specialized_kernel(f) -> Optional[Callable[[float, float, int], float]]:
   """
-  executor = ftres.ProcessPoolExecutor(max_workers=n_jobs)
+  Возвращает скомпилированное ядро, в которое f встроена как C-функция.
   
-  spawn = partial(executor.submit, cy.integrate_cython, f, 
-                  n_iter=n_iter // n_jobs)
+  Для функций модуля math из _LIBC_MATH генерируется .pyx с вызовом
+  одноименной функции libc.math и собирается через pyximport один раз
+  на процесс (сборки между запусками кэширует сам pyximport).
   
-  step = (b - a) / n_jobs
-  fs = []
+  Args:
+    f: Интегрируемая функция.
   
-  for i in range(n_jobs):
-    a_i = a + i * step
-    b_i = a + (i + 1) * step
-    fs.append(spawn(a_i, b_i))
+  Returns:
+    Ядро kernel(a, b, n_iter) или None, если f не поддерживается.
+  """
+  name = getattr(f, "__name__", None)
+  if name not in _LIBC_MATH or getattr(math, name) is not f:
+    return None
   
-  results = [f.result() for f in ftres.as_completed(fs)]
-  return sum(results)
+  kernel = _COMPILED.get(name)
+  if kernel is None:
+    import pyximport
+    
+    _GENERATED_DIR.mkdir(exist_ok=True)
+    module_name = f"_integrate_{name}"
+    source = _GENERATED_DIR / f"{module_name}.pyx"
+    code = _KERNEL_TEMPLATE.format(name=name)
+    if not source.exists() or source.read_text() != code:
+      source.write_text(code)
+    
+    if str(_GENERATED_DIR) not in sys.path:
+      sys.path.append(str(_GENERATED_DIR))
+    pyximport.install(language_level=3)
+    kernel = importlib.import_module(module_name).integrate
+    _COMPILED[name] = kernel
+  return kernel
 
 
+def integrate_cython_specialized(
+  f,
+  a: float,
+  b: float,
+  *,
+  n_iter: int = 100000
+  ) -> float:
+  """
+  Cython-интегрирование с функцией, встроенной на этапе компиляции.
+  
+  Если f — функция math с аналогом в libc.math (например, math.sin),
+  интеграл считается ядром без вызовов Python-объектов внутри цикла.
+  Для остальных функций используется integrate_cython.
+  """
+  kernel = _specialized_kernel(f)
+  if kernel is None:
+    return cy.integrate_cython(f, a, b, n_iter=n_iter)
+  return kernel(a, b, n_iter)
\ No newline at end of file
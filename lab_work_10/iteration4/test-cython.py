@@ -2,7 +2,7 @@ import integrate_cython as cy
 import math
 
 
-n_iter = 10_000_000
-
-print(cy.integrate_cython(math.sin, 0, math.pi, n_iter))
+if __name__ == "__main__":
+    n_iter = 10_000_000
+    print(cy.integrate_cython(math.sin, 0, math.pi, n_iter))
 
@@ -5,14 +5,21 @@
     "distutils": {
         "depends": [],
         "extra_compile_args": [
-            "/openmp",
-            "/O2",
-            "/fp:fast"
+            "-fopenmp",
+            "-O3",
+            "-march=native",
+            "-ffast-math"
+        ],
+        "extra_link_args": [
+            "-fopenmp"
         ],
         "include_dirs": [
-            "C:\\Users\\\u0412\u0430\u0434\u0438\u043c\\AppData\\Local\\Programs\\Python\\Python311\\Lib\\site-packages\\numpy\\core\\include"
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/_core/include"
         ],
         "language": "c",
+        "libraries": [
+            "m"
+        ],
         "name": "integrate_nogil",
         "sources": [
             "integrate_nogil.pyx"
@@ -1140,6 +1147,19 @@ static int __Pyx_init_co_variables(void) {
 #define __PYX_HAVE_API__integrate_nogil
 /* Early includes */
 #include <math.h>
+#include <omp.h>
+
+    #include <math.h>
+    static double _kern(double a, double h, Py_ssize_t start, Py_ssize_t stop) {
+        double s = 0.0;
+        Py_ssize_t i;
+        #pragma omp simd reduction(+:s)
+        for (i = start; i < stop; i++) {
+            s += sin(a + (i + 0.5) * h);
+        }
+        return s;
+    }
+    
 #ifdef _OPENMP
 #include <omp.h>
 #endif /* _OPENMP */
@@ -1546,12 +1566,12 @@ static const char* const __pyx_f[] = {
 
 /*--- Type declarations ---*/
 
-/* "integrate_nogil.pyx":6
+/* "integrate_nogil.pyx":7
  * from cython.parallel import prange, parallel
  * 
  * ctypedef double (*func_t)(double) nogil             # <<<<<<<<<<<<<<
  * 
- * # Nogil
+ * #    C: pragma omp simd  GCC  -ffast-math
 */
 typedef double (*__pyx_t_15integrate_nogil_func_t)(double);
 /* #### Code section: utility_code_proto ### */
@@ -2234,6 +2254,8 @@ static int __Pyx_State_RemoveModule(void*);
 
 /* Module declarations from "libc.math" */
 
+/* Module declarations from "openmp" */
+
 /* Module declarations from "integrate_nogil" */
 /* #### Code section: typeinfo ### */
 /* #### Code section: before_global_var ### */
@@ -2246,6 +2268,7 @@ int __pyx_module_is_main_integrate_nogil = 0;
 /* #### Code section: string_decls ### */
 /* #### Code section: decls ### */
 static PyObject *__pyx_pf_15integrate_nogil_integrate_sin_threaded(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_a, double __pyx_v_b, long __pyx_v_n_iter, CYTHON_UNUSED int __pyx_v_n_threads); /* proto */
+static PyObject *__pyx_pf_15integrate_nogil_2integrate_sin_simd(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_a, double __pyx_v_b, long __pyx_v_n_iter, int __pyx_v_n_threads); /* proto */
 /* #### Code section: late_includes ### */
 /* #### Code section: module_state ### */
 /* SmallCodeConfig */
@@ -2269,8 +2292,8 @@ typedef struct {
   __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_items;
   __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_pop;
   __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_values;
-  PyObject *__pyx_codeobj_tab[1];
-  PyObject *__pyx_string_tab[28];
+  PyObject *__pyx_codeobj_tab[2];
+  PyObject *__pyx_string_tab[35];
 /* #### Code section: module_state_contents ### */
 /* CommonTypesMetaclass.module_state_decls */
 PyTypeObject *__pyx_CommonTypesMetaclassType;
@@ -2317,28 +2340,35 @@ static __pyx_mstatetype * const __pyx_mstate_global = &__pyx_mstate_global_stati
 #define __pyx_n_u_a __pyx_string_tab[3]
 #define __pyx_n_u_asyncio_coroutines __pyx_string_tab[4]
 #define __pyx_n_u_b __pyx_string_tab[5]
-#define __pyx_n_u_cline_in_traceback __pyx_string_tab[6]
-#define __pyx_n_u_dx __pyx_string_tab[7]
-#define __pyx_n_u_func __pyx_string_tab[8]
-#define __pyx_n_u_i __pyx_string_tab[9]
-#define __pyx_n_u_integrate_nogil __pyx_string_tab[10]
-#define __pyx_n_u_integrate_sin_threaded __pyx_string_tab[11]
-#define __pyx_n_u_is_coroutine __pyx_string_tab[12]
-#define __pyx_n_u_items __pyx_string_tab[13]
-#define __pyx_n_u_main __pyx_string_tab[14]
-#define __pyx_n_u_module __pyx_string_tab[15]
-#define __pyx_n_u_n_iter __pyx_string_tab[16]
-#define __pyx_n_u_n_threads __pyx_string_tab[17]
-#define __pyx_n_u_name __pyx_string_tab[18]
-#define __pyx_n_u_pop __pyx_string_tab[19]
-#define __pyx_n_u_qualname __pyx_string_tab[20]
-#define __pyx_n_u_set_name __pyx_string_tab[21]
-#define __pyx_n_u_setdefault __pyx_string_tab[22]
-#define __pyx_n_u_test __pyx_string_tab[23]
-#define __pyx_n_u_total __pyx_string_tab[24]
-#define __pyx_n_u_values __pyx_string_tab[25]
-#define __pyx_n_u_x __pyx_string_tab[26]
-#define __pyx_kp_b_iso88591_Rr_Ba_q_q_A_Rr_b_S_6_1 __pyx_string_tab[27]
+#define __pyx_n_u_block __pyx_string_tab[6]
+#define __pyx_n_u_cline_in_traceback __pyx_string_tab[7]
+#define __pyx_n_u_dx __pyx_string_tab[8]
+#define __pyx_n_u_func __pyx_string_tab[9]
+#define __pyx_n_u_i __pyx_string_tab[10]
+#define __pyx_n_u_integrate_nogil __pyx_string_tab[11]
+#define __pyx_n_u_integrate_sin_simd __pyx_string_tab[12]
+#define __pyx_n_u_integrate_sin_threaded __pyx_string_tab[13]
+#define __pyx_n_u_is_coroutine __pyx_string_tab[14]
+#define __pyx_n_u_items __pyx_string_tab[15]
+#define __pyx_n_u_k __pyx_string_tab[16]
+#define __pyx_n_u_main __pyx_string_tab[17]
+#define __pyx_n_u_module __pyx_string_tab[18]
+#define __pyx_n_u_n_blocks __pyx_string_tab[19]
+#define __pyx_n_u_n_iter __pyx_string_tab[20]
+#define __pyx_n_u_n_threads __pyx_string_tab[21]
+#define __pyx_n_u_name __pyx_string_tab[22]
+#define __pyx_n_u_pop __pyx_string_tab[23]
+#define __pyx_n_u_qualname __pyx_string_tab[24]
+#define __pyx_n_u_set_name __pyx_string_tab[25]
+#define __pyx_n_u_setdefault __pyx_string_tab[26]
+#define __pyx_n_u_start __pyx_string_tab[27]
+#define __pyx_n_u_stop __pyx_string_tab[28]
+#define __pyx_n_u_test __pyx_string_tab[29]
+#define __pyx_n_u_total __pyx_string_tab[30]
+#define __pyx_n_u_values __pyx_string_tab[31]
+#define __pyx_n_u_x __pyx_string_tab[32]
+#define __pyx_kp_b_iso88591_9_Rr_Ba_q_Jb_QQR_G2Yb_3a_q_a_Bb __pyx_string_tab[33]
+#define __pyx_kp_b_iso88591_Rr_Ba_q_q_A_Rr_b_S_6_1 __pyx_string_tab[34]
 /* #### Code section: module_state_clear ### */
 #if CYTHON_USE_MODULE_STATE
 static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
@@ -2353,8 +2383,8 @@ static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
   #if CYTHON_PEP489_MULTI_PHASE_INIT
   __Pyx_State_RemoveModule(NULL);
   #endif
-  for (int i=0; i<1; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<28; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<2; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
+  for (int i=0; i<35; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
 /* #### Code section: module_state_clear_contents ### */
 /* CommonTypesMetaclass.module_state_clear */
 Py_CLEAR(clear_module_state->__pyx_CommonTypesMetaclassType);
@@ -2377,8 +2407,8 @@ static CYTHON_SMALL_CODE int __pyx_m_traverse(PyObject *m, visitproc visit, void
   __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_tuple);
   __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_bytes);
   __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_unicode);
-  for (int i=0; i<1; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<28; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<2; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
+  for (int i=0; i<35; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
 /* #### Code section: module_state_traverse_contents ### */
 /* CommonTypesMetaclass.module_state_traverse */
 Py_VISIT(traverse_module_state->__pyx_CommonTypesMetaclassType);
@@ -2392,7 +2422,7 @@ return 0;
 #endif
 /* #### Code section: module_code ### */
 
-/* "integrate_nogil.pyx":9
+/* "integrate_nogil.pyx":27
  * 
  * # Nogil
  * @cython.boundscheck(False)             # <<<<<<<<<<<<<<
@@ -2443,62 +2473,62 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_a,&__pyx_mstate_global->__pyx_n_u_b,&__pyx_mstate_global->__pyx_n_u_n_iter,&__pyx_mstate_global->__pyx_n_u_n_threads,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 9, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 27, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  4:
         values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 9, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 27, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  3:
         values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 9, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 27, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  2:
         values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 9, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 27, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 9, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 27, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "integrate_sin_threaded", 0) < (0)) __PYX_ERR(0, 9, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "integrate_sin_threaded", 0) < (0)) __PYX_ERR(0, 27, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("integrate_sin_threaded", 0, 3, 4, i); __PYX_ERR(0, 9, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("integrate_sin_threaded", 0, 3, 4, i); __PYX_ERR(0, 27, __pyx_L3_error) }
       }
     } else {
       switch (__pyx_nargs) {
         case  4:
         values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 9, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 27, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  3:
         values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 9, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 27, __pyx_L3_error)
         values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 9, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 27, __pyx_L3_error)
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 9, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 27, __pyx_L3_error)
         break;
         default: goto __pyx_L5_argtuple_error;
       }
     }
-    __pyx_v_a = __Pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_a == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 12, __pyx_L3_error)
-    __pyx_v_b = __Pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_b == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 12, __pyx_L3_error)
-    __pyx_v_n_iter = __Pyx_PyLong_As_long(values[2]); if (unlikely((__pyx_v_n_iter == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 12, __pyx_L3_error)
+    __pyx_v_a = __Pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_a == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 30, __pyx_L3_error)
+    __pyx_v_b = __Pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_b == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 30, __pyx_L3_error)
+    __pyx_v_n_iter = __Pyx_PyLong_As_long(values[2]); if (unlikely((__pyx_v_n_iter == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 30, __pyx_L3_error)
     if (values[3]) {
-      __pyx_v_n_threads = __Pyx_PyLong_As_int(values[3]); if (unlikely((__pyx_v_n_threads == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 12, __pyx_L3_error)
+      __pyx_v_n_threads = __Pyx_PyLong_As_int(values[3]); if (unlikely((__pyx_v_n_threads == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 30, __pyx_L3_error)
     } else {
       __pyx_v_n_threads = ((int)((int)0));
     }
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("integrate_sin_threaded", 0, 3, 4, __pyx_nargs); __PYX_ERR(0, 9, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("integrate_sin_threaded", 0, 3, 4, __pyx_nargs); __PYX_ERR(0, 27, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -2535,7 +2565,7 @@ static PyObject *__pyx_pf_15integrate_nogil_integrate_sin_threaded(CYTHON_UNUSED
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("integrate_sin_threaded", 0);
 
-  /* "integrate_nogil.pyx":26
+  /* "integrate_nogil.pyx":44
  *     """
  *     cdef:
  *         double dx = (b - a) / n_iter             # <<<<<<<<<<<<<<
@@ -2544,7 +2574,7 @@ static PyObject *__pyx_pf_15integrate_nogil_integrate_sin_threaded(CYTHON_UNUSED
 */
   __pyx_v_dx = ((__pyx_v_b - __pyx_v_a) / ((double)__pyx_v_n_iter));
 
-  /* "integrate_nogil.pyx":27
+  /* "integrate_nogil.pyx":45
  *     cdef:
  *         double dx = (b - a) / n_iter
  *         double total = 0.0             # <<<<<<<<<<<<<<
@@ -2553,7 +2583,7 @@ static PyObject *__pyx_pf_15integrate_nogil_integrate_sin_threaded(CYTHON_UNUSED
 */
   __pyx_v_total = 0.0;
 
-  /* "integrate_nogil.pyx":32
+  /* "integrate_nogil.pyx":50
  * 
  *     #    reduction
  *     with nogil:             # <<<<<<<<<<<<<<
@@ -2566,7 +2596,7 @@ static PyObject *__pyx_pf_15integrate_nogil_integrate_sin_threaded(CYTHON_UNUSED
       __Pyx_FastGIL_Remember();
       /*try:*/ {
 
-        /* "integrate_nogil.pyx":33
+        /* "integrate_nogil.pyx":51
  *     #    reduction
  *     with nogil:
  *         for i in prange(n_iter, num_threads=n_threads, schedule='static'):             # <<<<<<<<<<<<<<
@@ -2595,7 +2625,7 @@ static PyObject *__pyx_pf_15integrate_nogil_integrate_sin_threaded(CYTHON_UNUSED
                         {
                             __pyx_v_i = (long)(0 + 1 * __pyx_t_2);
 
-                            /* "integrate_nogil.pyx":34
+                            /* "integrate_nogil.pyx":52
  *     with nogil:
  *         for i in prange(n_iter, num_threads=n_threads, schedule='static'):
  *             x = a + (i + 0.5) * dx             # <<<<<<<<<<<<<<
@@ -2604,7 +2634,7 @@ static PyObject *__pyx_pf_15integrate_nogil_integrate_sin_threaded(CYTHON_UNUSED
 */
                             __pyx_v_x = (__pyx_v_a + ((__pyx_v_i + 0.5) * __pyx_v_dx));
 
-                            /* "integrate_nogil.pyx":35
+                            /* "integrate_nogil.pyx":53
  *         for i in prange(n_iter, num_threads=n_threads, schedule='static'):
  *             x = a + (i + 0.5) * dx
  *             total += sin(x)             # <<<<<<<<<<<<<<
@@ -2625,7 +2655,7 @@ static PyObject *__pyx_pf_15integrate_nogil_integrate_sin_threaded(CYTHON_UNUSED
         #endif
       }
 
-      /* "integrate_nogil.pyx":32
+      /* "integrate_nogil.pyx":50
  * 
  *     #    reduction
  *     with nogil:             # <<<<<<<<<<<<<<
@@ -2642,19 +2672,21 @@ static PyObject *__pyx_pf_15integrate_nogil_integrate_sin_threaded(CYTHON_UNUSED
       }
   }
 
-  /* "integrate_nogil.pyx":37
+  /* "integrate_nogil.pyx":55
  *             total += sin(x)
  * 
  *     return total * dx             # <<<<<<<<<<<<<<
+ * 
+ * 
 */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_4 = PyFloat_FromDouble((__pyx_v_total * __pyx_v_dx)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 37, __pyx_L1_error)
+  __pyx_t_4 = PyFloat_FromDouble((__pyx_v_total * __pyx_v_dx)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 55, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __pyx_r = __pyx_t_4;
   __pyx_t_4 = 0;
   goto __pyx_L0;
 
-  /* "integrate_nogil.pyx":9
+  /* "integrate_nogil.pyx":27
  * 
  * # Nogil
  * @cython.boundscheck(False)             # <<<<<<<<<<<<<<
@@ -2672,6 +2704,354 @@ static PyObject *__pyx_pf_15integrate_nogil_integrate_sin_threaded(CYTHON_UNUSED
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
+
+/* "integrate_nogil.pyx":58
+ * 
+ * 
+ * @cython.boundscheck(False)             # <<<<<<<<<<<<<<
+ * @cython.wraparound(False)
+ * @cython.nonecheck(False)
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_15integrate_nogil_3integrate_sin_simd(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_15integrate_nogil_2integrate_sin_simd, "\n    \320\222\321\213\321\207\320\270\321\201\320\273\321\217\320\265\321\202 \320\270\320\275\321\202\320\265\320\263\321\200\320\260\320\273 sin(x) \320\276\321\202 a \320\264\320\276 b \320\274\320\265\321\202\320\276\320\264\320\276\320\274 \320\277\321\200\321\217\320\274\320\276\321\203\320\263\320\276\320\273\321\214\320\275\320\270\320\272\320\276\320\262 (SIMD + prange).\n    \n    \320\236\321\202\321\200\320\265\320\267\320\276\320\272 \320\264\320\265\320\273\320\270\321\202\321\201\321\217 \320\275\320\260 \320\261\320\273\320\276\320\272\320\270 \320\277\320\276 \321\207\320\270\321\201\320\273\321\203 \320\277\320\276\321\202\320\276\320\272\320\276\320\262, \320\272\320\260\320\266\320\264\321\213\320\271 \320\261\320\273\320\276\320\272 \321\201\321\207\320\270\321\202\320\260\320\265\321\202\321\201\321\217\n    \320\262\320\265\320\272\321\202\320\276\321\200\320\270\320\267\320\276\320\262\320\260\320\275\320\275\321\213\320\274 \321\206\320\270\320\272\320\273\320\276\320\274 _kern.\n    \n    Parameters:\n    -----------\n    a, b : float\n        \320\237\321\200\320\265\320\264\320\265\320\273\321\213 \320\270\320\275\321\202\320\265\320\263\321\200\320\270\321\200\320\276\320\262\320\260\320\275\320\270\321\217\n    n_iter : int\n        \320\232\320\276\320\273\320\270\321\207\320\265\321\201\321\202\320\262\320\276 \321\202\320\276\321\207\320\265\320\272 \321\200\320\260\320\267\320\261\320\270\320\265\320\275\320\270\321\217\n    n_threads : int\n        \320\232\320\276\320\273\320\270\321\207\320\265\321\201\321\202\320\262\320\276 \320\277\320\276\321\202\320\276\320\272\320\276\320\262 (0 = \320\260\320\262\321\202\320\276\320\276\320\277\321\200\320\265\320\264\320\265\320\273\320\265\320\275\320\270\320\265)\n    ");
+static PyMethodDef __pyx_mdef_15integrate_nogil_3integrate_sin_simd = {"integrate_sin_simd", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_15integrate_nogil_3integrate_sin_simd, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_15integrate_nogil_2integrate_sin_simd};
+static PyObject *__pyx_pw_15integrate_nogil_3integrate_sin_simd(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  double __pyx_v_a;
+  double __pyx_v_b;
+  long __pyx_v_n_iter;
+  int __pyx_v_n_threads;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[4] = {0,0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("integrate_sin_simd (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_a,&__pyx_mstate_global->__pyx_n_u_b,&__pyx_mstate_global->__pyx_n_u_n_iter,&__pyx_mstate_global->__pyx_n_u_n_threads,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 58, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  4:
+        values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 58, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 58, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 58, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 58, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "integrate_sin_simd", 0) < (0)) __PYX_ERR(0, 58, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("integrate_sin_simd", 0, 3, 4, i); __PYX_ERR(0, 58, __pyx_L3_error) }
+      }
+    } else {
+      switch (__pyx_nargs) {
+        case  4:
+        values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 58, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 58, __pyx_L3_error)
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 58, __pyx_L3_error)
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 58, __pyx_L3_error)
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_a = __Pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_a == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 61, __pyx_L3_error)
+    __pyx_v_b = __Pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_b == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 61, __pyx_L3_error)
+    __pyx_v_n_iter = __Pyx_PyLong_As_long(values[2]); if (unlikely((__pyx_v_n_iter == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 61, __pyx_L3_error)
+    if (values[3]) {
+      __pyx_v_n_threads = __Pyx_PyLong_As_int(values[3]); if (unlikely((__pyx_v_n_threads == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 61, __pyx_L3_error)
+    } else {
+      __pyx_v_n_threads = ((int)((int)0));
+    }
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("integrate_sin_simd", 0, 3, 4, __pyx_nargs); __PYX_ERR(0, 58, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("integrate_nogil.integrate_sin_simd", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_15integrate_nogil_2integrate_sin_simd(__pyx_self, __pyx_v_a, __pyx_v_b, __pyx_v_n_iter, __pyx_v_n_threads);
+
+  /* function exit code */
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_15integrate_nogil_2integrate_sin_simd(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_a, double __pyx_v_b, long __pyx_v_n_iter, int __pyx_v_n_threads) {
+  double __pyx_v_dx;
+  double __pyx_v_total;
+  int __pyx_v_n_blocks;
+  Py_ssize_t __pyx_v_block;
+  Py_ssize_t __pyx_v_start;
+  Py_ssize_t __pyx_v_stop;
+  int __pyx_v_k;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  long __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("integrate_sin_simd", 0);
+
+  /* "integrate_nogil.pyx":78
+ *     """
+ *     cdef:
+ *         double dx = (b - a) / n_iter             # <<<<<<<<<<<<<<
+ *         double total = 0.0
+ *         int n_blocks = n_threads if n_threads > 0 else openmp.omp_get_max_threads()
+*/
+  __pyx_v_dx = ((__pyx_v_b - __pyx_v_a) / ((double)__pyx_v_n_iter));
+
+  /* "integrate_nogil.pyx":79
+ *     cdef:
+ *         double dx = (b - a) / n_iter
+ *         double total = 0.0             # <<<<<<<<<<<<<<
+ *         int n_blocks = n_threads if n_threads > 0 else openmp.omp_get_max_threads()
+ *         Py_ssize_t block = (n_iter + n_blocks - 1) // n_blocks
+*/
+  __pyx_v_total = 0.0;
+
+  /* "integrate_nogil.pyx":80
+ *         double dx = (b - a) / n_iter
+ *         double total = 0.0
+ *         int n_blocks = n_threads if n_threads > 0 else openmp.omp_get_max_threads()             # <<<<<<<<<<<<<<
+ *         Py_ssize_t block = (n_iter + n_blocks - 1) // n_blocks
+ *         Py_ssize_t start, stop
+*/
+  __pyx_t_2 = (__pyx_v_n_threads > 0);
+  if (__pyx_t_2) {
+    __pyx_t_1 = __pyx_v_n_threads;
+  } else {
+    __pyx_t_1 = omp_get_max_threads();
+  }
+  __pyx_v_n_blocks = __pyx_t_1;
+
+  /* "integrate_nogil.pyx":81
+ *         double total = 0.0
+ *         int n_blocks = n_threads if n_threads > 0 else openmp.omp_get_max_threads()
+ *         Py_ssize_t block = (n_iter + n_blocks - 1) // n_blocks             # <<<<<<<<<<<<<<
+ *         Py_ssize_t start, stop
+ *         int k
+*/
+  __pyx_v_block = (((__pyx_v_n_iter + __pyx_v_n_blocks) - 1) / __pyx_v_n_blocks);
+
+  /* "integrate_nogil.pyx":85
+ *         int k
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for k in prange(n_blocks, num_threads=n_threads, schedule='static'):
+ *             start = k * block
+*/
+  {
+      PyThreadState * _save;
+      _save = PyEval_SaveThread();
+      __Pyx_FastGIL_Remember();
+      /*try:*/ {
+
+        /* "integrate_nogil.pyx":86
+ * 
+ *     with nogil:
+ *         for k in prange(n_blocks, num_threads=n_threads, schedule='static'):             # <<<<<<<<<<<<<<
+ *             start = k * block
+ *             stop = min(start + block, n_iter)
+*/
+        __pyx_t_1 = __pyx_v_n_blocks;
+        {
+            #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+                #undef likely
+                #undef unlikely
+                #define likely(x)   (x)
+                #define unlikely(x) (x)
+            #endif
+            __pyx_t_4 = (__pyx_t_1 - 0 + 1 - 1/abs(1)) / 1;
+            if (__pyx_t_4 > 0)
+            {
+                #ifdef _OPENMP
+                #pragma omp parallel reduction(+:__pyx_v_total) num_threads(__pyx_v_n_threads) private(__pyx_t_2, __pyx_t_5, __pyx_t_6, __pyx_t_7)
+                #endif /* _OPENMP */
+                {
+                    #ifdef _OPENMP
+                    #pragma omp for firstprivate(__pyx_v_k) lastprivate(__pyx_v_k) firstprivate(__pyx_v_start) lastprivate(__pyx_v_start) firstprivate(__pyx_v_stop) lastprivate(__pyx_v_stop) schedule(static)
+                    #endif /* _OPENMP */
+                    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_4; __pyx_t_3++){
+                        {
+                            __pyx_v_k = (int)(0 + 1 * __pyx_t_3);
+
+                            /* "integrate_nogil.pyx":87
+ *     with nogil:
+ *         for k in prange(n_blocks, num_threads=n_threads, schedule='static'):
+ *             start = k * block             # <<<<<<<<<<<<<<
+ *             stop = min(start + block, n_iter)
+ *             if start < stop:
+*/
+                            __pyx_v_start = (__pyx_v_k * __pyx_v_block);
+
+                            /* "integrate_nogil.pyx":88
+ *         for k in prange(n_blocks, num_threads=n_threads, schedule='static'):
+ *             start = k * block
+ *             stop = min(start + block, n_iter)             # <<<<<<<<<<<<<<
+ *             if start < stop:
+ *                 total += _kern(a, dx, start, stop)
+*/
+                            __pyx_t_5 = __pyx_v_n_iter;
+                            __pyx_t_6 = (__pyx_v_start + __pyx_v_block);
+                            __pyx_t_2 = (__pyx_t_5 < __pyx_t_6);
+                            if (__pyx_t_2) {
+                              __pyx_t_7 = __pyx_t_5;
+                            } else {
+                              __pyx_t_7 = __pyx_t_6;
+                            }
+                            __pyx_v_stop = __pyx_t_7;
+
+                            /* "integrate_nogil.pyx":89
+ *             start = k * block
+ *             stop = min(start + block, n_iter)
+ *             if start < stop:             # <<<<<<<<<<<<<<
+ *                 total += _kern(a, dx, start, stop)
+ * 
+*/
+                            __pyx_t_2 = (__pyx_v_start < __pyx_v_stop);
+                            if (__pyx_t_2) {
+
+                              /* "integrate_nogil.pyx":90
+ *             stop = min(start + block, n_iter)
+ *             if start < stop:
+ *                 total += _kern(a, dx, start, stop)             # <<<<<<<<<<<<<<
+ * 
+ *     return total * dx
+*/
+                              __pyx_v_total = (__pyx_v_total + _kern(__pyx_v_a, __pyx_v_dx, __pyx_v_start, __pyx_v_stop));
+
+                              /* "integrate_nogil.pyx":89
+ *             start = k * block
+ *             stop = min(start + block, n_iter)
+ *             if start < stop:             # <<<<<<<<<<<<<<
+ *                 total += _kern(a, dx, start, stop)
+ * 
+*/
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+            #undef likely
+            #undef unlikely
+            #define likely(x)   __builtin_expect(!!(x), 1)
+            #define unlikely(x) __builtin_expect(!!(x), 0)
+        #endif
+      }
+
+      /* "integrate_nogil.pyx":85
+ *         int k
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for k in prange(n_blocks, num_threads=n_threads, schedule='static'):
+ *             start = k * block
+*/
+      /*finally:*/ {
+        /*normal exit:*/{
+          __Pyx_FastGIL_Forget();
+          PyEval_RestoreThread(_save);
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "integrate_nogil.pyx":92
+ *                 total += _kern(a, dx, start, stop)
+ * 
+ *     return total * dx             # <<<<<<<<<<<<<<
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_8 = PyFloat_FromDouble((__pyx_v_total * __pyx_v_dx)); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 92, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_r = __pyx_t_8;
+  __pyx_t_8 = 0;
+  goto __pyx_L0;
+
+  /* "integrate_nogil.pyx":58
+ * 
+ * 
+ * @cython.boundscheck(False)             # <<<<<<<<<<<<<<
+ * @cython.wraparound(False)
+ * @cython.nonecheck(False)
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("integrate_nogil.integrate_sin_simd", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 /* #### Code section: module_exttypes ### */
 
 static PyMethodDef __pyx_methods[] = {
@@ -3022,40 +3402,70 @@ __Pyx_RefNannySetupContext("PyInit_integrate_nogil", 0);
   (void)__Pyx_modinit_function_import_code(__pyx_mstate);
   /*--- Execution code ---*/
 
-  /* "integrate_nogil.pyx":12
+  /* "integrate_nogil.pyx":30
  * @cython.wraparound(False)
  * @cython.nonecheck(False)
  * def integrate_sin_threaded(double a, double b, long n_iter, int n_threads=0):             # <<<<<<<<<<<<<<
  *     """
  *       sin(x)  a  b     prange.
 */
-  __pyx_t_2 = __Pyx_PyLong_From_int(((int)0)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 12, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyLong_From_int(((int)0)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 30, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
 
-  /* "integrate_nogil.pyx":9
+  /* "integrate_nogil.pyx":27
  * 
  * # Nogil
  * @cython.boundscheck(False)             # <<<<<<<<<<<<<<
  * @cython.wraparound(False)
  * @cython.nonecheck(False)
 */
-  __pyx_t_3 = PyTuple_Pack(1, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 9, __pyx_L1_error)
+  __pyx_t_3 = PyTuple_Pack(1, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 27, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_15integrate_nogil_1integrate_sin_threaded, 0, __pyx_mstate_global->__pyx_n_u_integrate_sin_threaded, NULL, __pyx_mstate_global->__pyx_n_u_integrate_nogil, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[0])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 27, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_t_3);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_integrate_sin_threaded, __pyx_t_2) < (0)) __PYX_ERR(0, 27, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "integrate_nogil.pyx":61
+ * @cython.wraparound(False)
+ * @cython.nonecheck(False)
+ * def integrate_sin_simd(double a, double b, long n_iter, int n_threads=0):             # <<<<<<<<<<<<<<
+ *     """
+ *       sin(x)  a  b   (SIMD + prange).
+*/
+  __pyx_t_2 = __Pyx_PyLong_From_int(((int)0)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 61, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+
+  /* "integrate_nogil.pyx":58
+ * 
+ * 
+ * @cython.boundscheck(False)             # <<<<<<<<<<<<<<
+ * @cython.wraparound(False)
+ * @cython.nonecheck(False)
+*/
+  __pyx_t_3 = PyTuple_Pack(1, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 58, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_15integrate_nogil_1integrate_sin_threaded, 0, __pyx_mstate_global->__pyx_n_u_integrate_sin_threaded, NULL, __pyx_mstate_global->__pyx_n_u_integrate_nogil, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[0])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 9, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_15integrate_nogil_3integrate_sin_simd, 0, __pyx_mstate_global->__pyx_n_u_integrate_sin_simd, NULL, __pyx_mstate_global->__pyx_n_u_integrate_nogil, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[1])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 58, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
   #endif
   __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_t_3);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_integrate_sin_threaded, __pyx_t_2) < (0)) __PYX_ERR(0, 9, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_integrate_sin_simd, __pyx_t_2) < (0)) __PYX_ERR(0, 58, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
   /* "integrate_nogil.pyx":1
  * import cython             # <<<<<<<<<<<<<<
  * from libc.math cimport sin
- * 
+ * cimport openmp
 */
   __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
@@ -3123,31 +3533,31 @@ static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
 static int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate) {
   CYTHON_UNUSED_VAR(__pyx_mstate);
   {
-    const struct { const unsigned int length: 7; } index[] = {{1},{19},{20},{1},{18},{1},{18},{2},{8},{1},{15},{22},{13},{5},{8},{10},{6},{9},{8},{3},{12},{12},{10},{8},{5},{6},{1},{77}};
-    #if (CYTHON_COMPRESS_STRINGS) == 2 /* compression: bz2 (304 bytes) */
-const char* const cstring = "BZh91AY&SY\314\301-\207\000\000\023\377\363\365|{\304\010\005!\003\264\001X\000\277\357\377`@@@@@@@@@\000@\0000\000\354\314\"5L\030\243F@\r\000\320\000\003@\331#\332\240\324\320!\251\246\232y#@\320\000\000\000\000\002\032\211\223I\243CM\000\000\000\000\0002z$p=\224\026\311\330\322%\t\341S\206\2150\034O\020\304Iz\377\231\2516\031s\024%h\337Pa\001\231\006\001}\356\236\315H\022\007I.\222|\261&\247\t\006\002H\017M\366\242\375,\3170\343a\275\013\324\020\265\200\374\376\215b\237\026\345\245p\023\353:%\025I\003\206\240@E\tG\001S\200\220e\217)\370(\276\210\326<9\021\251\204t\3179\340A\004\221\255\255I&\223\350\017L\223 \020\0224W\204D\300\327\345)\202\234o\2427\202\2042\304\246\260\034:\315\t)\252\022Y\234f\010\rd\016\004\212\217\341H9l\035U6\234\367+w\232\217\036\247b\330\031\300\227(PO\355\375$\204\212\355\027K\370\273\222)\302\204\206f\tl8";
-    PyObject *data = __Pyx_DecompressString(cstring, 304, 2);
+    const struct { const unsigned int length: 8; } index[] = {{1},{19},{20},{1},{18},{1},{5},{18},{2},{8},{1},{15},{18},{22},{13},{5},{1},{8},{10},{8},{6},{9},{8},{3},{12},{12},{10},{5},{4},{8},{5},{6},{1},{131},{77}};
+    #if (CYTHON_COMPRESS_STRINGS) == 2 /* compression: bz2 (428 bytes) */
+const char* const cstring = "BZh91AY&SY\260u\253\022\000\000*\177\373\375~\377\344\034\00593\264\221x \277\357\377\342@@@@@@@\000@@@\000@\0000\001[Rf\"\236\224\001\2104h\032\006\200\320\321\240\000\003L\232h2dz\203S@j\221\372OT\375'\2521\r\032\000\310\031\031\032d\006\200\006\232\033PJ\231\t<\224\304\310\362\230\206\200\000\000\000\000\000\311\352zL\226\355\313\030\234'\345\t|\242\234&&b\n\342\241\220V\034\306I:\244\261\020Q\t\205D\021@\256\365\023\241\261\353\346\225\205\315\230G\214\237s\206\212S\214\305\237]\006n\312`;\255&a\230U\210\205\377v\373^m)B$*:\003\376\234\326=\302\261\252*\210\237t\336y\373\203\3720A}\230\024\247\222*h\330\2320\3203p\231\345e%'v\376\275\261\222L\325\262C9\240T\025\252\344%\200\302\004U\244>\251\210\323\t\002\253\207\303?\001\316AQh\367\222\241\026\274\215Hl\025e\2709I\034\254\324\203]\005&Lg\020\323s\032#\007\031S\231\366q\304\224\234\215\304\315`\371\303\001f\241\223#'\260\371\245\013\031\216\252$n\350\331\264\372\352\262\004\301X\252\313D\204\t\310\375\"\021\2238 \250\214\272A\026Q\357\010\245\022j\233\203\202\336C\1770]V\001\246H\353F,\"e2>\253\t\203b\3303 \363\200M::O\025\302\270\356\215%)\240\353\370\301\345\320\010\010\020\242\220\\\006\1779a\213\242\217\361w$S\205\t\013\007Z\261 ";
+    PyObject *data = __Pyx_DecompressString(cstring, 428, 2);
     if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
     const char* const bytes = __Pyx_PyBytes_AsString(data);
     #if !CYTHON_ASSUME_SAFE_MACROS
     if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
     #endif
-    #elif (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (253 bytes) */
-const char* const cstring = "x\332]N\273N\0031\020\314!\204 \271\202\207\002\024t\264(\022\r\035 \0205\212\302\007\254\366|\233`\341\263/\366\032\335u\224\224.]R\3629\224W\362\t\367\t8<%\266\230\235\335\235\031\355\245\324L\013\213L\240\315B\252I\3356\000\323\004\323\366F\n\206[jxFsD\327j!\315D\030k<KM\256\020*5\220\032\330\242\240\002\305C\231\274s\257\005\200\374\227\3737\272\225\341\336\022\226T\202t\360\033(\231*\007Pa\022\244\252L\351\025\001hH\007\373\343I\002\215UZ\327\246\006XzT_#\200#\376>%V\246\217\275b\000&\267B\303\250\036Qyr\315S\326o\014\316/\372\243\301\326~\230\005\033\367\342u\304n\363 ,\373\341`8\352\362\304\336\016O^\257\272|;\254\205\343O\3218\026/Y\227\217\303]\314\342\316\373\372\350\371,\354\206\323\0173R}\225";
-    PyObject *data = __Pyx_DecompressString(cstring, 253, 1);
+    #elif (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (360 bytes) */
+const char* const cstring = "x\332eO=O\002A\020\0055\006\341\214\370\001jb\245\226\206DML4A#11\2610\200\225\325d\356n\301\r\367\001\267{\010\205\211%\345\226[^y%?\205\362J\177\302\375\004\007T\210\272\305\313\314\2337\357\315\336pO\262v\200\222\201\347\267\271S\351\016\007\000u\202\372\360\216[\022\036\331@6Y\013Q\014=\213\373\025\313\017\374Pr\217\t\323t|\253c9T\003\367@\006h1\023\255\216M\006\255\320\263\000\370\037\363E+hAp\327\376\315\310\227\200\241\315l\340\002\3469\\2Wt\000\\$\005=\327\267C\207\001x0\313\027\036\220\"\370Y\0264@\227\306]\277\013\320\013\321\371j\001\004\223\337#\252l\372Q\350H!1 \230J%\023\222\320\227\350\364\321\t\231\030\274g\323\325\314\345Uz\230Y+\253\246\n\364\266\256iLr\273\2527\205\267\350!6\307\353\223jc\322h&\271\003}\037\235E\317D-\217\317\307\230\3462\371Bb\220v\262W\21111vTM\231:\233\030e\205\252\257\233\3725\"vc\324'\353^R\334\327%\215ZD\307Q;n|\254\024F\027jK\235\316N\250^\247\007\377OH\363\213\200\223\37061\212jI\035\315D%mF\024TRO:\2537\347f\237\247\374\302\326";
+    PyObject *data = __Pyx_DecompressString(cstring, 360, 1);
     if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
     const char* const bytes = __Pyx_PyBytes_AsString(data);
     #if !CYTHON_ASSUME_SAFE_MACROS
     if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
     #endif
-    #else /* compression: none (319 bytes) */
-const char* const bytes = "?integrate_nogil.pyx__Pyx_PyDict_NextRefaasyncio.coroutinesbcline_in_tracebackdx__func__iintegrate_nogilintegrate_sin_threaded_is_coroutineitems__main____module__n_itern_threads__name__pop__qualname____set_name__setdefault__test__totalvaluesx\200\001\360\006\000=>\360\034\000\t\026\220R\220r\230\023\230B\230a\330\010\027\220q\360\n\000\n\013\330\014\027\220q\320\030,\250A\330\014\020\220\002\220#\220R\220r\230\025\230b\240\001\330\014\025\220S\230\001\230\021\340\004\013\2106\220\022\2201";
+    #else /* compression: none (491 bytes) */
+const char* const bytes = "?integrate_nogil.pyx__Pyx_PyDict_NextRefaasyncio.coroutinesbblockcline_in_tracebackdx__func__iintegrate_nogilintegrate_sin_simdintegrate_sin_threaded_is_coroutineitemsk__main____module__n_blocksn_itern_threads__name__pop__qualname____set_name__setdefaultstartstop__test__totalvaluesx\200\001\360\006\0009:\360\"\000\t\026\220R\220r\230\023\230B\230a\330\010\027\220q\330\010\027\220}\240J\250b\260\r\320=Q\320QR\330\010\034\230G\2402\240Y\250b\260\003\2603\260a\360\010\000\n\013\330\014\027\220q\320\030.\250a\330\014\024\220B\220b\230\001\330\014\026\220a\220v\230R\230w\240a\330\014\017\210v\220R\220q\330\020\031\230\025\230a\230s\240$\240g\250Q\340\004\013\2106\220\022\2201\200\001\360\006\000=>\360\034\000\t\026\220R\220r\230\023\230B\230a\330\010\027\220q\360\n\000\n\013\330\014\027\220q\320\030,\250A\330\014\020\220\002\220#\220R\220r\230\025\230b\240\001\330\014\025\220S\230\001\230\021\340\004\013\2106\220\022\2201";
     PyObject *data = NULL;
     CYTHON_UNUSED_VAR(__Pyx_DecompressString);
     #endif
     PyObject **stringtab = __pyx_mstate->__pyx_string_tab;
     Py_ssize_t pos = 0;
-    for (int i = 0; i < 27; i++) {
+    for (int i = 0; i < 33; i++) {
       Py_ssize_t bytes_length = index[i].length;
       PyObject *string = PyUnicode_DecodeUTF8(bytes + pos, bytes_length, NULL);
       if (likely(string) && i >= 2) PyUnicode_InternInPlace(&string);
@@ -3158,7 +3568,7 @@ const char* const bytes = "?integrate_nogil.pyx__Pyx_PyDict_NextRefaasyncio.coro
       stringtab[i] = string;
       pos += bytes_length;
     }
-    for (int i = 27; i < 28; i++) {
+    for (int i = 33; i < 35; i++) {
       Py_ssize_t bytes_length = index[i].length;
       PyObject *string = PyBytes_FromStringAndSize(bytes + pos, bytes_length);
       stringtab[i] = string;
@@ -3169,15 +3579,15 @@ const char* const bytes = "?integrate_nogil.pyx__Pyx_PyDict_NextRefaasyncio.coro
       }
     }
     Py_XDECREF(data);
-    for (Py_ssize_t i = 0; i < 28; i++) {
+    for (Py_ssize_t i = 0; i < 35; i++) {
       if (unlikely(PyObject_Hash(stringtab[i]) == -1)) {
         __PYX_ERR(0, 1, __pyx_L1_error)
       }
     }
     #if CYTHON_IMMORTAL_CONSTANTS
     {
-      PyObject **table = stringtab + 27;
-      for (Py_ssize_t i=0; i<1; ++i) {
+      PyObject **table = stringtab + 33;
+      for (Py_ssize_t i=0; i<2; ++i) {
         #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
         #if PY_VERSION_HEX < 0x030E0000
         if (_Py_IsOwnedByCurrentThread(table[i]) && Py_REFCNT(table[i]) == 1)
@@ -3205,7 +3615,7 @@ typedef struct {
     unsigned int num_kwonly_args : 1;
     unsigned int nlocals : 4;
     unsigned int flags : 10;
-    unsigned int first_line : 4;
+    unsigned int first_line : 6;
 } __Pyx_PyCode_New_function_description;
 /* NewCodeObj.proto */
 static PyObject* __Pyx_PyCode_New(
@@ -3222,10 +3632,15 @@ static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
   PyObject* tuple_dedup_map = PyDict_New();
   if (unlikely(!tuple_dedup_map)) return -1;
   {
-    const __Pyx_PyCode_New_function_description descr = {4, 0, 0, 8, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 9};
+    const __Pyx_PyCode_New_function_description descr = {4, 0, 0, 8, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 27};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_a, __pyx_mstate->__pyx_n_u_b, __pyx_mstate->__pyx_n_u_n_iter, __pyx_mstate->__pyx_n_u_n_threads, __pyx_mstate->__pyx_n_u_dx, __pyx_mstate->__pyx_n_u_total, __pyx_mstate->__pyx_n_u_i, __pyx_mstate->__pyx_n_u_x};
     __pyx_mstate_global->__pyx_codeobj_tab[0] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_integrate_nogil_pyx, __pyx_mstate->__pyx_n_u_integrate_sin_threaded, __pyx_mstate->__pyx_kp_b_iso88591_Rr_Ba_q_q_A_Rr_b_S_6_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[0])) goto bad;
   }
+  {
+    const __Pyx_PyCode_New_function_description descr = {4, 0, 0, 11, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 58};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_a, __pyx_mstate->__pyx_n_u_b, __pyx_mstate->__pyx_n_u_n_iter, __pyx_mstate->__pyx_n_u_n_threads, __pyx_mstate->__pyx_n_u_dx, __pyx_mstate->__pyx_n_u_total, __pyx_mstate->__pyx_n_u_n_blocks, __pyx_mstate->__pyx_n_u_block, __pyx_mstate->__pyx_n_u_start, __pyx_mstate->__pyx_n_u_stop, __pyx_mstate->__pyx_n_u_k};
+    __pyx_mstate_global->__pyx_codeobj_tab[1] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_integrate_nogil_pyx, __pyx_mstate->__pyx_n_u_integrate_sin_simd, __pyx_mstate->__pyx_kp_b_iso88591_9_Rr_Ba_q_Jb_QQR_G2Yb_3a_q_a_Bb, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[1])) goto bad;
+  }
   Py_DECREF(tuple_dedup_map);
   return 0;
   bad:
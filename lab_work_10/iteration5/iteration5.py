@@ -1,6 +1,18 @@
+import math
 import iteration5.integrate_nogil as ng # type: ignore
-import concurrent.futures as ftres
-from functools import partial
+
+def sin_nogil(x: float) -> float:
+  """
+  sin(x) с привязанным nogil-ядром.
+  
+  integrate_threaded из iteration2 видит атрибут __nogil__ и считает
+  интеграл целиком в ядре integrate_sin_threaded вместо пула потоков.
+  """
+  return math.sin(x)
+
+
+sin_nogil.__nogil__ = ng.integrate_sin_threaded
+
 
 def integrate_nogil_threaded_sin(
   a: float,
@@ -10,17 +22,10 @@ def integrate_nogil_threaded_sin(
   n_iter: int = 10000
   ) -> float:
   """
-  Многопоточная nogil версия интеграции синуса
+  Многопоточная nogil версия интеграции синуса.
+
+  Потоки создает OpenMP внутри ядра integrate_sin_threaded (prange),
+  поэтому пул потоков на стороне Python и лишние вызовы через GIL
+  не нужны: весь интеграл считается за один вызов.
   """
-  executor = ftres.ThreadPoolExecutor(max_workers=n_jobs)
-  spawn = partial(executor.submit, ng.integrate_nogil_sin, n_iter=n_iter // n_jobs)
-  step = (b - a) / n_jobs
-  fs = []
-  
-  
-  for i in range(n_jobs):
-    a_i = a + i *step
-    b_i = a + (i+1) * step
-    fs.append(spawn(a_i, b_i))
-    results = [f.result() for f in ftres.as_completed(fs)]
-  return sum(results)
\ No newline at end of file
+  return ng.integrate_sin_threaded(a, b, n_iter, n_jobs)
\ No newline at end of file
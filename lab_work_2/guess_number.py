@@ -1,10 +1,21 @@
-def guess_number(number: int, numbers_list: list[int], method: str) -> tuple[int, int]:
+from collections.abc import Sequence
+
+
+def guess_number(
+    number: int,
+    numbers_list: Sequence[int],
+    method: str,
+    is_sorted: bool = False) -> tuple[int, int]:
   """Угадывает число из списка с использованием указанного алгоритма поиска.
   
   Args:
     number (int): Число, которое нужно найти в списке
-    numbers_list (list[int]): Отсортированный список целых чисел для поиска
+    numbers_list (Sequence[int]): Последовательность целых чисел
+      (список, кортеж и т.п.) для поиска
     method (str): Метод поиска - 'binary' для бинарного или 'linear' для линейного
+    is_sorted (bool): Последовательность уже отсортирована по возрастанию.
+      Если False, для бинарного поиска создается отсортированная копия
+      (O(n log n)); передайте True, чтобы пропустить сортировку.
   
   Returns:
     tuple[int, int]: Кортеж содержащий:
@@ -17,8 +28,8 @@ def guess_number(number: int, numbers_list: list[int], method: str) -> tuple[int
   
   Example:
     >>> numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-    >>> guess_number(5, numbers, 'binary')
-    (5, 3)
+    >>> guess_number(5, numbers, 'binary', is_sorted=True)
+    (5, 1)
     >>> guess_number(5, numbers, 'linear')
     (5, 5)
   """
@@ -26,11 +37,13 @@ def guess_number(number: int, numbers_list: list[int], method: str) -> tuple[int
     raise ValueError("Метод должен быть 'binary' или 'linear'")
   
   if method == 'binary':
+    if not is_sorted:
+      numbers_list = sorted(numbers_list)
     return _binary_search(number, numbers_list)
   else:
     return _linear_search(number, numbers_list)
 
-def _linear_search(target: int, numbers: list[int]) -> tuple[int, int]:
+def _linear_search(target: int, numbers: Sequence[int]) -> tuple[int, int]:
   """Выполняет линейный поиск числа в списке.
     
   Проходит по всем элементам списка последовательно до нахождения целевого числа.
@@ -38,7 +51,7 @@ def _linear_search(target: int, numbers: list[int]) -> tuple[int, int]:
   
   Args:
     target (int): Число для поиска
-    numbers (list[int]): Список чисел для поиска (может быть неотсортированным)
+    numbers (Sequence[int]): Последовательность чисел для поиска (может быть неотсортированной)
   
   Returns:
     tuple[int, int]: Кортеж содержащий:
@@ -56,7 +69,7 @@ def _linear_search(target: int, numbers: list[int]) -> tuple[int, int]:
   
   raise ValueError(f"Число {target} нет в списке")
   
-def _binary_search(target: int, numbers: list[int]) -> tuple[int, int]:
+def _binary_search(target: int, numbers: Sequence[int]) -> tuple[int, int]:
   """Выполняет бинарный поиск числа в отсортированном списке.
   
   Делит область поиска пополам на каждой итерации.
@@ -64,7 +77,7 @@ def _binary_search(target: int, numbers: list[int]) -> tuple[int, int]:
   
   Args:
     target (int): Число для поиска
-    numbers (list[int]): Список чисел для поиска (будет отсортирован)
+    numbers (Sequence[int]): Отсортированная по возрастанию последовательность чисел
   
   Returns:
     tuple[int, int]: Кортеж содержащий:
@@ -75,11 +88,10 @@ def _binary_search(target: int, numbers: list[int]) -> tuple[int, int]:
     ValueError: Если целевое число не найдено в списке
   
   Note:
-    Функция сортирует переданный список перед выполнением поиска.
-    Исходный порядок элементов не сохраняется.
+    Список не сортируется и не изменяется: сортировка за O(n log n)
+    на каждый вызов свела бы на нет выигрыш от O(log n) поиска.
   """
   attempts = 0
-  numbers.sort()
   left, right = 0, len(numbers) - 1
 
   while left <= right:
@@ -159,7 +171,8 @@ def main():
   """
   try:
     target, numbers_list, method = input_helper()
-    result, attempts = guess_number(target, numbers_list, method)
+    # range уже отсортирован, сортировка не нужна
+    result, attempts = guess_number(target, numbers_list, method, is_sorted=True)
     
     print(f"\nРезультат:")
     print(f"Угаданное число: {result}")
@@ -14,6 +14,14 @@ class TestGuessNumber(unittest.TestCase):
     - Обработка некорректных входных данных
   """
 
+  @classmethod
+  def setUpClass(cls):
+    """Общий для всех тестов отсортированный список.
+
+    Кортеж неизменяем, поэтому его можно безопасно разделять между тестами.
+    """
+    cls.NUMS = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10)
+
   def test_binary_search_found(self):
     """Тест бинарного поиска: число найдено в середине списка.
 
@@ -22,8 +30,7 @@ class TestGuessNumber(unittest.TestCase):
       - Количество попыток больше нуля
       - Возвращается корректное найденное число
     """
-    numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-    result, attempts = guess_number(5, numbers, 'binary')
+    result, attempts = guess_number(5, self.NUMS, 'binary', is_sorted=True)
     self.assertEqual(result, 5)
     self.assertGreater(attempts, 0)
 
@@ -35,8 +42,7 @@ class TestGuessNumber(unittest.TestCase):
       - Количество попыток соответствует позиции элемента (3)
       - Возвращается корректное найденное число
     """
-    numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-    result, attempts = guess_number(3, numbers, 'linear')
+    result, attempts = guess_number(3, self.NUMS, 'linear')
     self.assertEqual(result, 3)
     self.assertEqual(attempts, 3)
 
@@ -46,8 +52,7 @@ class TestGuessNumber(unittest.TestCase):
     Проверяет что алгоритм корректно находит элемент
     в начале отсортированного списка.
     """
-    numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-    result, attempts = guess_number(1, numbers, 'binary')
+    result, attempts = guess_number(1, self.NUMS, 'binary', is_sorted=True)
     self.assertEqual(result, 1)
     self.assertGreater(attempts, 0)
 
@@ -59,8 +64,7 @@ class TestGuessNumber(unittest.TestCase):
       - Количество попыток равно длине списка (10)
       - Возвращается корректное найденное число
     """
-    numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-    result, attempts = guess_number(10, numbers, 'linear')
+    result, attempts = guess_number(10, self.NUMS, 'linear')
     self.assertEqual(result, 10)
     self.assertEqual(attempts, 10)
 
@@ -71,9 +75,8 @@ class TestGuessNumber(unittest.TestCase):
       - При отсутствии числа выбрасывается ValueError
       - Сообщение об ошибке содержит информацию о ненайденном числе
     """
-    numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
     with self.assertRaises(ValueError) as context:
-      guess_number(15, numbers, 'binary')
+      guess_number(15, self.NUMS, 'binary', is_sorted=True)
     self.assertIn("Числа 15 нет в списке", str(context.exception))
 
   def test_linear_search_not_found(self):
@@ -92,14 +95,16 @@ class TestGuessNumber(unittest.TestCase):
     """Тест бинарного поиска с несортированным списком.
 
     Проверяет что:
-      - Функция корректно работает с несортированным списком
-      - Число успешно находится после внутренней сортировки
+      - Несортированный список корректно обрабатывается (is_sorted=False)
+      - Число успешно находится
       - Количество попыток больше нуля
+      - Исходный список не изменяется
     """
     numbers = [5, 2, 8, 1, 9, 3, 7, 4, 6, 10]
     result, attempts = guess_number(7, numbers, 'binary')
     self.assertEqual(result, 7)
     self.assertGreater(attempts, 0)
+    self.assertEqual(numbers, [5, 2, 8, 1, 9, 3, 7, 4, 6, 10])
 
   def test_linear_search_unsorted_list(self):
     """Тест линейного поиска с несортированным списком.
@@ -133,7 +138,7 @@ class TestGuessNumber(unittest.TestCase):
     """
     numbers = []
     with self.assertRaises(ValueError) as context:
-      guess_number(5, numbers, 'binary')
+      guess_number(5, numbers, 'binary', is_sorted=True)
     self.assertIn("Числа 5 нет в списке", str(context.exception))
 
   def test_single_element_binary(self):
@@ -144,7 +149,7 @@ class TestGuessNumber(unittest.TestCase):
       - Количество попыток равно 1
     """
     numbers = [5]
-    result, attempts = guess_number(5, numbers, 'binary')
+    result, attempts = guess_number(5, numbers, 'binary', is_sorted=True)
     self.assertEqual(result, 5)
     self.assertEqual(attempts, 1)
 
@@ -1,8 +1,39 @@
-from typing import Optional, Dict, Any
-import pprint
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple
+import json
+
+
+# Число кэшируемых пар (height, root). Кэш ограничен: кортежи хранят
+# быстро растущие длинные числа и при height около 15 занимают десятки
+# мегабайт. Освободить память сразу можно через _heap_values.cache_clear()
+_HEAP_CACHE_SIZE = 32
+
+
+@lru_cache(maxsize=_HEAP_CACHE_SIZE)
+def _heap_values(height: int, root: int) -> Tuple[int, ...]:
+  """Вычисляет значения узлов дерева в порядке обхода в ширину.
+
+  Дерево полное, поэтому хранится как куча: потомки узла i находятся
+  по индексам 2*i + 1 и 2*i + 2. Список заполняется одним циклом
+  по индексу без рекурсии. Результат кэшируется по паре (height, root),
+  в кэше хранится не больше _HEAP_CACHE_SIZE последних пар.
+  """
+  if height < 1:
+    return ()
+  values = [root]
+  # Число внутренних узлов (у которых есть потомки)
+  internal = (1 << (height - 1)) - 1
+  i = 0
+  while i < internal:
+    square = values[i] ** 2
+    values.append(square)
+    values.append(2 + square)
+    i += 1
+  return tuple(values)
+
 
 def gen_bin_tree(height: int = 3, root: int = 11) -> Optional[Dict[str, Any]]:
-  """Рекурсивно строит бинарное дерево заданной высоты и корневого значения.
+  """Строит бинарное дерево заданной высоты и корневого значения.
   
   Генерирует бинарное дерево, где каждый узел содержит числовое значение,
   а левый и правый потомки вычисляются по формулам:
@@ -27,10 +58,6 @@ def gen_bin_tree(height: int = 3, root: int = 11) -> Optional[Dict[str, Any]]:
         }
       Возвращает None если height < 1.
   
-  Raises:
-      RecursionError: Если высота дерева слишком большая и превышает
-                      максимальную глубину рекурсии Python.
-  
   Examples:
     >>> tree = gen_bin_tree(height=2, root=2)
     >>> tree
@@ -54,22 +81,24 @@ def gen_bin_tree(height: int = 3, root: int = 11) -> Optional[Dict[str, Any]]:
   Note:
     Значения узлов растут экспоненциально с увеличением высоты,
     что может привести к очень большим числам при height > 5.
+    Значения вычисляются один раз для каждой пары (height, root)
+    и кэшируются; при каждом вызове возвращаются новые словари.
+    Дерево строится итеративно, поэтому глубина не ограничена
+    лимитом рекурсии Python.
   """
-  if height < 1:
-    return None
-
-  left_value = root ** 2
-  right_value = 2 + root ** 2
-
-  tree = {
-    "value": root,
-    "left": gen_bin_tree(height - 1, left_value),
-    "right": gen_bin_tree(height - 1, right_value)
-  }
-
-  return tree
+  values = _heap_values(height, root)
+  n = len(values)
+  # Узлы собираются снизу вверх; индексы >= n соответствуют None
+  nodes: list = [None] * (2 * n + 1)
+  for i in range(n - 1, -1, -1):
+    nodes[i] = {
+      "value": values[i],
+      "left": nodes[2 * i + 1],
+      "right": nodes[2 * i + 2],
+    }
+  return nodes[0]
 
 
 if __name__ == "__main__":
   tree = gen_bin_tree(height=3, root=11)
-  pprint.pprint(tree)
\ No newline at end of file
+  print(json.dumps(tree, indent=2))
\ No newline at end of file
@@ -5,6 +5,8 @@
 - рекурсивной (fact_recursive)
 - нерекурсивной (fact_iterative)
 
+Для сравнения замеряется и встроенная math.factorial, реализованная на C.
+
 Для оценки производительности используется модуль `timeit`, а результаты
 визуализируются с помощью `matplotlib`.
 
@@ -14,7 +16,7 @@
 
 import timeit
 import matplotlib.pyplot as plt
-from typing import List
+from typing import List, Optional
 
 
 def fact_recursive(n: int) -> int:
@@ -58,7 +60,12 @@ def fact_iterative(n: int) -> int:
     return result
 
 
-def benchmark_factorial(func_name: str, numbers: List[int], repeat: int = 5) -> List[float]:
+def benchmark_factorial(
+    func_name: str,
+    numbers: List[int],
+    repeat: int = 5,
+    setup: Optional[str] = None,
+) -> List[float]:
     """
     Измеряет среднее время выполнения функции вычисления факториала.
 
@@ -66,6 +73,8 @@ def benchmark_factorial(func_name: str, numbers: List[int], repeat: int = 5) ->
         func_name (str): Имя функции ('fact_recursive' или 'fact_iterative').
         numbers (List[int]): Список чисел для тестирования.
         repeat (int): Количество повторов для усреднения.
+        setup (Optional[str]): Код импорта функции. По умолчанию функция
+            импортируется из __main__.
 
     Returns:
         List[float]: Среднее время выполнения для каждого числа.
@@ -73,9 +82,9 @@ def benchmark_factorial(func_name: str, numbers: List[int], repeat: int = 5) ->
     results = []
     for n in numbers:
         stmt = f"{func_name}({n})"
-        setup = f"from __main__ import {func_name}"
+        import_stmt = setup or f"from __main__ import {func_name}"
         # timeit.timeit возвращает общее время выполнения указанного количества прогонов.
-        time_taken = timeit.timeit(stmt, setup=setup, number=repeat)
+        time_taken = timeit.timeit(stmt, setup=import_stmt, number=repeat)
         avg_time = time_taken / repeat
         results.append(avg_time)
     return results
@@ -89,11 +98,17 @@ def main() -> None:
     # Измерение времени выполнения
     recursive_times = benchmark_factorial("fact_recursive", numbers)
     iterative_times = benchmark_factorial("fact_iterative", numbers)
+    math_times = benchmark_factorial(
+        "math_factorial",
+        numbers,
+        setup="from math import factorial as math_factorial",
+    )
 
     # Визуализация результатов
     plt.figure(figsize=(10, 6))
     plt.plot(numbers, recursive_times, marker="o", label="Рекурсивный способ")
     plt.plot(numbers, iterative_times, marker="s", label="Итеративный способ")
+    plt.plot(numbers, math_times, marker="^", label="math.factorial (C)")
     plt.title("Сравнение времени вычисления факториала")
     plt.xlabel("Входное число n")
     plt.ylabel("Среднее время выполнения (секунды)")
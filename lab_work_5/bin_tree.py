@@ -2,11 +2,22 @@ from typing import Callable, Any, Dict, Optional
 from collections import deque
 import pprint
 
+
+def _default_left(x: Any) -> Any:
+    """Левый потомок по умолчанию: x²."""
+    return x ** 2
+
+
+def _default_right(x: Any) -> Any:
+    """Правый потомок по умолчанию: 2 + x²."""
+    return 2 + x ** 2
+
+
 def gen_bin_tree(
     height: int = 3,
     root: Any = 11,
-    left_branch: Callable[[Any], Any] = lambda x: x ** 2,
-    right_branch: Callable[[Any], Any] = lambda x: 2 + x ** 2
+    left_branch: Callable[[Any], Any] = _default_left,
+    right_branch: Callable[[Any], Any] = _default_right
 ) -> Dict[str, Any]:
     """
     Генерация бинарного дерева в виде словаря (нерекурсивно).
@@ -17,6 +28,10 @@ def gen_bin_tree(
         left_branch (Callable[[Any], Any]): Функция для вычисления левого потомка.
         right_branch (Callable[[Any], Any]): Функция для вычисления правого потомка.
 
+    Note:
+        Если переданы функции по умолчанию, значения потомков считаются
+        прямо в цикле (v * v и 2 + v * v) без вызова функций на каждый узел.
+
     Returns:
         tree (Dict[str, Any]): Бинарное дерево в виде вложенных словарей формата:
             {"value": <root>, "left": <левое поддерево>, "right": <правое поддерево>}
@@ -31,13 +46,21 @@ def gen_bin_tree(
 
     tree: Dict[str, Optional[Any]] = {"value": root, "left": None, "right": None}
     queue = deque([(tree, 1)])  # Очередь для обхода уровней: (узел, текущая_высота)
+    # Проверка по идентичности: пользовательские функции с тем же
+    # поведением идут по общему пути
+    fast_path = left_branch is _default_left and right_branch is _default_right
 
     while queue:
         node, level = queue.popleft()
 
         if level < height:
-            left_val = left_branch(node["value"])
-            right_val = right_branch(node["value"])
+            value = node["value"]
+            if fast_path:
+                left_val = value * value
+                right_val = 2 + left_val
+            else:
+                left_val = left_branch(value)
+                right_val = right_branch(value)
 
             # Создаём потомков
             node["left"] = {"value": left_val, "left": None, "right": None}
@@ -10,6 +10,55 @@ class TestGenBinTree(unittest.TestCase):
     корректность структуры дерева и правильность вычисления значений узлов.
     """
     
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Строит деревья и ожидаемые структуры один раз для всех тестов.
+        
+        gen_bin_tree — чистая функция, а тесты только читают результат,
+        поэтому деревья можно разделять между тестами.
+        """
+        cls.tree_h3 = gen_bin_tree(height=3, root=2)
+        cls.tree_h4 = gen_bin_tree(height=4, root=2)
+        
+        root_val = 2
+        left_val = root_val ** 2  # 4
+        right_val = 2 + root_val ** 2  # 6
+        
+        left_left_val = left_val ** 2  # 16
+        left_right_val = 2 + left_val ** 2  # 18
+        right_left_val = right_val ** 2  # 36
+        right_right_val = 2 + right_val ** 2  # 38
+        
+        cls.expected_h3 = {
+          "value": root_val,
+          "left": {
+            "value": left_val,
+            "left": {
+              "value": left_left_val,
+              "left": None,
+              "right": None
+            },
+            "right": {
+              "value": left_right_val,
+              "left": None,
+              "right": None
+            }
+          },
+          "right": {
+            "value": right_val,
+            "left": {
+              "value": right_left_val,
+              "left": None,
+              "right": None
+            },
+            "right": {
+              "value": right_right_val,
+              "left": None,
+              "right": None
+            }
+          }
+        }
+    
     def test_height_zero_returns_none(self) -> None:
         """Тестирует случай, когда высота дерева равна 0.
         
@@ -74,48 +123,7 @@ class TestGenBinTree(unittest.TestCase):
       Проверяет корректность многоуровневой структуры дерева
       и правильность вычисления значений на всех уровнях.
       """
-      root_val = 2
-      left_val = root_val ** 2  # 4
-      right_val = 2 + root_val ** 2  # 6
-      
-      left_left_val = left_val ** 2  # 16
-      left_right_val = 2 + left_val ** 2  # 18
-      right_left_val = right_val ** 2  # 36
-      right_right_val = 2 + right_val ** 2  # 38
-      
-      result = gen_bin_tree(height=3, root=root_val)
-      
-      expected = {
-        "value": root_val,
-        "left": {
-          "value": left_val,
-          "left": {
-            "value": left_left_val,
-            "left": None,
-            "right": None
-          },
-          "right": {
-            "value": left_right_val,
-            "left": None,
-            "right": None
-          }
-        },
-        "right": {
-          "value": right_val,
-          "left": {
-            "value": right_left_val,
-            "left": None,
-            "right": None
-          },
-          "right": {
-            "value": right_right_val,
-            "left": None,
-            "right": None
-          }
-        }
-      }
-      
-      self.assertEqual(result, expected)
+      self.assertEqual(self.tree_h3, self.expected_h3)
     
     def test_different_root_values(self) -> None:
       """Тестирует построение деревьев с различными корневыми значениями.
@@ -172,8 +180,6 @@ class TestGenBinTree(unittest.TestCase):
         
         Рекурсивно проверяет, что значения потомков вычислены по заданным формулам.
         """
-        result = gen_bin_tree(height=4, root=2)
-        
         def validate_values_calculation(node: Dict[str, Any]) -> bool:
           """Рекурсивно проверяет корректность вычисления значений."""
           if node["left"] is not None:
@@ -192,7 +198,7 @@ class TestGenBinTree(unittest.TestCase):
           
           return True
         
-        self.assertTrue(validate_values_calculation(result))
+        self.assertTrue(validate_values_calculation(self.tree_h4))
     
     def test_default_parameters(self) -> None:
       """Тестирует работу функции с параметрами по умолчанию.
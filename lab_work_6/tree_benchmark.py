@@ -19,11 +19,15 @@
 Дата: 2025-10-25
 """
 
-from typing import Any, Dict, Optional, Callable
+from typing import Any, Dict, Optional, Callable, Tuple
 from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+import json
 import timeit
 import matplotlib.pyplot as plt
-import pprint
+import numpy as np
+from numba import config, njit
 
 
 
@@ -100,30 +104,297 @@ def build_tree_iterative(height: int, root: int) -> Optional[Dict[str, Any]]:
     return tree
 
 
+@dataclass(slots=True)
+class Node:
+    """
+    Узел бинарного дерева с фиксированным набором полей.
+
+    Благодаря slots=True у экземпляра нет собственного __dict__:
+    узел занимает в несколько раз меньше памяти, чем словарь
+    с тремя ключами, а доступ к полям быстрее поиска по ключу.
+    """
+    value: int
+    left: Optional["Node"] = None
+    right: Optional["Node"] = None
+
+
+def build_tree_nodes(height: int, root: int) -> Optional[Node]:
+    """
+    Итеративно строит бинарное дерево из объектов Node.
+
+    Алгоритм совпадает с build_tree_iterative, отличается только
+    представление узла.
+
+    Args:
+        height (int): Высота дерева (>= 1).
+        root (int): Значение корня.
+
+    Returns:
+        Optional[Node]: Корень дерева или None, если height < 1.
+
+    Example:
+        >>> build_tree_nodes(2, 11)
+        Node(value=11, left=Node(value=121, left=None, right=None), right=Node(value=123, left=None, right=None))
+    """
+    if height < 1:
+        return None
+
+    tree = Node(root)
+    queue = deque([(tree, 1)])  # очередь узлов и уровня
+
+    while queue:
+        node, level = queue.popleft()
+        if level < height:
+            sq = node.value ** 2
+            node.left = Node(sq)
+            node.right = Node(2 + sq)
+
+            queue.append((node.left, level + 1))
+            queue.append((node.right, level + 1))
+
+    return tree
+
+
+
+
+def build_tree_array(height: int, root: int) -> Optional[np.ndarray]:
+    """
+    Строит бинарное дерево в виде одного массива значений (кучи).
+
+    Вместо словаря на каждый узел значения хранятся в одном массиве
+    длины 2**height - 1: потомки узла i находятся по индексам 2i+1
+    (левый) и 2i+2 (правый). Массив заполняется по уровням: все потомки
+    уровня вычисляются одной векторной операцией NumPy. Пока значения
+    помещаются в 64 бита, используется int64, иначе тип object
+    (целые Python произвольной длины).
+
+    Args:
+        height (int): Высота дерева (>= 1).
+        root (int): Значение корня.
+
+    Returns:
+        Optional[np.ndarray]: Массив значений узлов в порядке обхода
+        по уровням или None, если height < 1.
+
+    Example:
+        >>> build_tree_array(2, 11)
+        array([ 11, 121, 123])
+    """
+    if height < 1:
+        return None
+
+    dtype = np.int64 if _fits_int64(height, root) else object
+    arr = np.empty(2 ** height - 1, dtype=dtype)
+    arr[0] = root
+    # Уровень занимает срез [start, start + width), его потомки —
+    # следующие 2 * width элементов, левые и правые через один
+    start, width = 0, 1
+    for _ in range(height - 1):
+        parents = arr[start:start + width]
+        sq = parents * parents
+        child = start + width
+        arr[child:child + 2 * width:2] = sq
+        arr[child + 1:child + 2 * width:2] = sq + 2
+        start, width = child, 2 * width
+    return arr
+
+
+def tree_array_to_dict(arr: Optional[np.ndarray], i: int = 0) -> Optional[Dict[str, Any]]:
+    """
+    Преобразует дерево-массив из build_tree_array в словарь.
+
+    Args:
+        arr (Optional[np.ndarray]): Массив значений узлов.
+        i (int): Индекс корня поддерева.
+
+    Returns:
+        Optional[Dict[str, Any]]: Поддерево в формате build_tree_recursive.
+    """
+    if arr is None or i >= len(arr):
+        return None
+    return {
+        "value": arr[i],
+        "left": tree_array_to_dict(arr, 2 * i + 1),
+        "right": tree_array_to_dict(arr, 2 * i + 2)
+    }
+
+
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+@njit(cache=True, boundscheck=False)
+def _fill_tree_njit(out, root):
+    """Заполняет массив-кучу значениями узлов (компилируется Numba)."""
+    out[0] = root
+    for i in range(out.shape[0] // 2):
+        v = out[i]
+        out[2 * i + 1] = v * v
+        out[2 * i + 2] = 2 + v * v
+
+
+def warmup() -> None:
+    """
+    Заранее компилирует _fill_tree_njit, чтобы компиляция не попала в замеры.
+
+    Благодаря cache=True машинный код сохраняется на диск, и при повторных
+    запусках скрипта прогрев сводится к загрузке из кэша. При
+    NUMBA_DISABLE_JIT=1 функция выполняется как обычный Python,
+    и прогревать нечего.
+    """
+    if config.DISABLE_JIT:
+        return
+    _fill_tree_njit(np.empty(1, dtype=np.int64), 11)
+
+
+def _fits_int64(height: int, root: int) -> bool:
+    """Проверяет, что все значения дерева помещаются в int64."""
+    # Наибольшее значение на каждом уровне дает правая ветка 2 + v**2
+    v = abs(root)
+    for _ in range(height - 1):
+        v = 2 + v * v
+        if v > _INT64_MAX:
+            return False
+    return v <= _INT64_MAX
+
+
+def build_tree_numba(height: int, root: int) -> Optional[np.ndarray]:
+    """
+    Строит дерево-массив скомпилированным Numba циклом.
+
+    Работает с массивом int64, поэтому применяется, только пока значения
+    помещаются в 64 бита (для root=11 — до height=5 включительно);
+    иначе используется build_tree_array с типом object.
+
+    Args:
+        height (int): Высота дерева (>= 1).
+        root (int): Значение корня.
+
+    Returns:
+        Optional[np.ndarray]: Массив значений узлов или None, если height < 1.
+    """
+    if height < 1:
+        return None
+    if not _fits_int64(height, root):
+        return build_tree_array(height, root)
+
+    out = np.empty(2 ** height - 1, dtype=np.int64)
+    _fill_tree_njit(out, root)
+    return out
+
+
+# Число кэшируемых поддеревьев. Кэш ограничен: кортежи хранят быстро
+# растущие длинные числа и без ограничения жили бы до конца процесса.
+# Корень дерева попадает в кэш последним, поэтому повторный вызов
+# build_tree_memoized с теми же аргументами все равно берется из кэша
+_TREE_CACHE_SIZE = 32
+
+
+@lru_cache(maxsize=_TREE_CACHE_SIZE)
+def _build_tree_cached(height: int, root: int) -> Optional[Tuple[Any, ...]]:
+    """
+    Строит дерево из неизменяемых кортежей (value, left, right)
+    с кэшированием по паре (height, root).
+    """
+    if height < 1:
+        return None
+    return (
+        root,
+        _build_tree_cached(height - 1, root ** 2),
+        _build_tree_cached(height - 1, 2 + root ** 2),
+    )
+
+
+def _tuple_to_dict(node: Optional[Tuple[Any, ...]]) -> Optional[Dict[str, Any]]:
+    """Преобразует дерево из кортежей в словари формата build_tree_recursive."""
+    if node is None:
+        return None
+    value, left, right = node
+    return {
+        "value": value,
+        "left": _tuple_to_dict(left),
+        "right": _tuple_to_dict(right)
+    }
+
+
+def build_tree_memoized(height: int, root: int) -> Optional[Dict[str, Any]]:
+    """
+    Строит бинарное дерево с мемоизацией вычисления значений узлов.
+
+    Значения считаются один раз на пару (height, root) и кэшируются
+    (functools.lru_cache), повторные вызовы только создают словари.
+    Кэш ограничен _TREE_CACHE_SIZE записями; освободить его целиком
+    можно через _build_tree_cached.cache_clear().
+
+    Args:
+        height (int): Высота дерева (>= 1).
+        root (int): Значение корня.
+
+    Returns:
+        Optional[Dict[str, Any]]: Бинарное дерево в виде словаря.
+    """
+    return _tuple_to_dict(_build_tree_cached(height, root))
+
+
+
+
+def _best_time(builder: Callable[[int, int], Any], height: int) -> float:
+    """
+    Возвращает лучшее из 5 измерений времени 100 построений дерева.
+
+    Оператор передается строкой с globals, поэтому цикл timeit вызывает
+    builder напрямую, без промежуточной lambda на каждой итерации.
+    """
+    timer = timeit.Timer(
+        stmt="builder(height, 11)",
+        globals={"builder": builder, "height": height},
+    )
+    return min(timer.repeat(repeat=5, number=100))
 
 
 def measure_time():
     """
     Измеряет и сравнивает время построения дерева для разных высот
-    между рекурсивной и итеративной реализациями.
+    между рекурсивной, итеративной (словари и Node), мемоизированной реализациями
+    и деревом-массивом (в том числе заполняемым Numba).
     """
     heights = range(1, 12)  # тестируем от 1 до 11 уровней
     rec_times = []
     iter_times = []
+    node_times = []
+    memo_times = []
+    arr_times = []
+    numba_times = []
+
+    warmup()
 
     for h in heights:
-        rec_t = timeit.timeit(lambda: build_tree_recursive(h, 11), number=100)
-        iter_t = timeit.timeit(lambda: build_tree_iterative(h, 11), number=100)
+        rec_t = _best_time(build_tree_recursive, h)
+        iter_t = _best_time(build_tree_iterative, h)
+        node_t = _best_time(build_tree_nodes, h)
+        memo_t = _best_time(build_tree_memoized, h)
+        arr_t = _best_time(build_tree_array, h)
+        numba_t = _best_time(build_tree_numba, h)
 
         rec_times.append(rec_t)
         iter_times.append(iter_t)
+        node_times.append(node_t)
+        memo_times.append(memo_t)
+        arr_times.append(arr_t)
+        numba_times.append(numba_t)
 
-        print(f"Высота={h}: рекурсивно={rec_t:.6f} с, итеративно={iter_t:.6f} с")
+        print(f"Высота={h}: рекурсивно={rec_t:.6f} с, итеративно={iter_t:.6f} с, "
+              f"Node={node_t:.6f} с, "
+              f"с мемоизацией={memo_t:.6f} с, массивом={arr_t:.6f} с, "
+              f"Numba={numba_t:.6f} с")
 
     # Построение графика
     plt.figure(figsize=(8, 5))
     plt.plot(heights, rec_times, marker='o', label='Рекурсивная версия')
     plt.plot(heights, iter_times, marker='s', label='Итеративная версия')
+    plt.plot(heights, node_times, marker='v', label='Итеративная версия (Node)')
+    plt.plot(heights, memo_times, marker='^', label='Мемоизированная версия')
+    plt.plot(heights, arr_times, marker='d', label='Дерево-массив')
+    plt.plot(heights, numba_times, marker='x', label='Дерево-массив (Numba, h ≤ 5)')
     plt.title('Сравнение времени построения бинарного дерева')
     plt.xlabel('Высота дерева')
     plt.ylabel('Время (сек)')
@@ -136,6 +407,7 @@ def measure_time():
 
 if __name__ == "__main__":
     print("Пример дерева (высота=3, root=11):")
-    pprint.pprint(build_tree_recursive(3, 11))
+    # json печатает через C-кодировщик; int произвольной длины поддерживаются
+    print(json.dumps(build_tree_recursive(3, 11), indent=2))
     print("\n--- Сравнение времени ---")
     measure_time()
\ No newline at end of file
@@ -2,15 +2,161 @@
 Модуль для работы с курсами валют ЦБ РФ.
 
 Содержит функцию для получения курсов валют через API Центрального банка.
+Если установлен httpx, запросы идут через один общий клиент с пулом
+соединений (keep-alive), иначе через urllib.
+Ответ API кэшируется в памяти на _CACHE_TTL секунд: курсы на
+daily_json.js обновляются раз в сутки, поэтому повторные вызовы
+в пределах нескольких минут не ходят в сеть.
 """
 
+import asyncio
+import gzip
 import json
 import sys
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from logger import logger
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from urllib import request
 from urllib.error import URLError
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    # orjson разбирает JSON в несколько раз быстрее и принимает bytes напрямую
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Время жизни закэшированного ответа (в секундах) и размер кэша
+_CACHE_TTL = 600
+_CACHE_MAXSIZE = 4
+
+# url -> (момент истечения по time.monotonic(), разобранный JSON)
+_cache: Dict[str, Tuple[float, Any]] = {}
+# get_currencies_async обращается к кэшу из нескольких потоков сразу
+_cache_lock = threading.Lock()
+
+# Общий httpx.Client, создается при первом запросе
+_client: Optional["httpx.Client"] = None
+_client_lock = threading.Lock()
+
+
+def clear_cache() -> None:
+    """Очищает кэш ответов API."""
+    with _cache_lock:
+        _cache.clear()
+
+
+def _get_client() -> "httpx.Client":
+    """Возвращает общий httpx.Client, создавая его при первом вызове."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            # Повторная проверка: другой поток мог создать клиент,
+            # пока этот ждал блокировку
+            if _client is None:
+                # httpx по умолчанию не следует редиректам, в отличие
+                # от urllib; без этого ответ 3xx стал бы ошибкой
+                _client = httpx.Client(follow_redirects=True)
+    return _client
+
+
+def _download(url: str, timeout: float) -> bytes:
+    """
+    Скачивает тело ответа по адресу url.
+
+    Через httpx соединение с сервером переиспользуется между вызовами,
+    и повторные запросы не тратят время на TCP и TLS рукопожатие.
+    Ответ запрашивается сжатым gzip (httpx делает это сам, для urllib
+    заголовок Accept-Encoding добавляется явно) — JSON сжимается в разы.
+
+    Args:
+        url: Адрес API
+        timeout: Таймаут запроса в секундах
+
+    Returns:
+        Тело ответа в байтах.
+
+    Raises:
+        ConnectionError: Если API недоступен, произошла ошибка сети
+            или сжатое тело ответа повреждено
+    """
+    if httpx is not None:
+        try:
+            response = _get_client().get(url, timeout=timeout)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise ConnectionError(f"Ошибка подключения к API: {e}")
+        return response.content
+
+    try:
+        # Выполнение запроса к API
+        req = request.Request(url, headers={"Accept-Encoding": "gzip"})
+        with request.urlopen(req, timeout=timeout) as response:
+            # bytes передаются парсеру как есть, без отдельного decode()
+            data = response.read()
+            encoding = response.headers.get("Content-Encoding")
+    except (URLError, TimeoutError) as e:
+        raise ConnectionError(f"Ошибка подключения к API: {e}")
+
+    if encoding == "gzip":
+        try:
+            data = gzip.decompress(data)
+        except (gzip.BadGzipFile, EOFError, zlib.error) as e:
+            # Поврежденное или обрезанное при передаче тело — та же
+            # сетевая ошибка, что и обрыв соединения
+            raise ConnectionError(f"Поврежденный gzip-ответ API: {e}")
+    return data
+
+
+def _fetch_json(url: str, timeout: float) -> Any:
+    """
+    Загружает и разбирает JSON по адресу url с кэшированием на _CACHE_TTL секунд.
+
+    В кэш попадают только успешно разобранные ответы, ошибки сети
+    и некорректный JSON не кэшируются.
+
+    Args:
+        url: Адрес API
+        timeout: Таймаут запроса в секундах
+
+    Returns:
+        Разобранный JSON-ответ.
+
+    Raises:
+        ConnectionError: Если API недоступен или произошла ошибка сети
+        ValueError: Если получен некорректный JSON
+    """
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _cache.get(url)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    data = _download(url, timeout)
+    
+    try:
+        # Парсинг JSON
+        json_data = _loads(data)
+    except ValueError as e:
+        # Ошибки разбора JSON (в т.ч. orjson) и декодирования UTF-8
+        # наследуются от ValueError
+        raise ValueError(f"Некорректный JSON от API: {e}")
+
+    with _cache_lock:
+        if url not in _cache and len(_cache) >= _CACHE_MAXSIZE:
+            # Вытесняем самую старую запись
+            del _cache[next(iter(_cache))]
+        _cache[url] = (now + _CACHE_TTL, json_data)
+    return json_data
+
 
 def get_currencies(
     currency_codes: List[str],
@@ -19,6 +165,9 @@ def get_currencies(
 ) -> Dict[str, float]:
     """
     Получает курсы валют от API Центрального банка РФ.
+
+    Ответ API берется из кэша, если он был получен не раньше
+    _CACHE_TTL секунд назад.
     
     Args:
         currency_codes: Список кодов валют для получения (например, ["USD", "EUR"])
@@ -38,43 +187,105 @@ def get_currencies(
         >>> get_currencies(["USD", "EUR"])
         {'USD': 93.25, 'EUR': 101.7}
     """
-    
-    try:
-        # Выполнение запроса к API
-        with request.urlopen(url, timeout=timeout) as response:
-            data = response.read().decode('utf-8')
-    except (URLError, TimeoutError) as e:
-        raise ConnectionError(f"Ошибка подключения к API: {e}")
-    
-    try:
-        # Парсинг JSON
-        json_data = json.loads(data)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Некорректный JSON от API: {e}")
-    
+    return _extract_rates(_fetch_json(url, timeout), currency_codes)
+
+
+def _extract_rates(json_data: Any, currency_codes: List[str]) -> Dict[str, float]:
+    """
+    Извлекает курсы запрошенных валют из ответа API.
+
+    Args:
+        json_data: Разобранный JSON-ответ API
+        currency_codes: Список кодов валют
+
+    Returns:
+        Словарь с кодами валют и их курсами, округленными до 2 знаков.
+
+    Raises:
+        KeyError: Если в ответе отсутствует ключ "Valute" или запрашиваемая валюта
+        TypeError: Если курс валюты имеет неверный тип (не число)
+    """
     # Проверка наличия ключа "Valute"
     if "Valute" not in json_data:
         raise KeyError("В ответе API отсутствует ключ 'Valute'")
     
     valute_data = json_data["Valute"]
-    result = {}
     
-    # Извлечение курсов для запрошенных валют
+    # Коды проверяются по одному в порядке запроса: первой сообщается
+    # ошибка (отсутствие валюты или неверный тип курса) для самого
+    # раннего кода в списке. Поэтому проверка не заменяется разностью
+    # множеств — та теряет порядок и разделяет два вида ошибок
     for code in currency_codes:
-        if code not in valute_data:
+        currency_info = valute_data.get(code)
+        if currency_info is None:
             raise KeyError(f"Валюта {code} отсутствует в данных API")
         
-        currency_info = valute_data[code]
-        
         # Проверка типа значения курса
-        if not isinstance(currency_info.get("Value"), (int, float)):
+        value = currency_info.get("Value")
+        if not isinstance(value, (int, float)):
             raise TypeError(
-                f"Курс валюты {code} имеет неверный тип: {type(currency_info.get('Value'))}"
+                f"Курс валюты {code} имеет неверный тип: {type(value)}"
             )
-        
-        result[code] = round(currency_info["Value"], 2)
     
-    return result
+    # После проверки результат собирается одним генератором словаря
+    return {c: round(valute_data[c]["Value"], 2) for c in currency_codes}
+
+
+async def get_currencies_async(
+    currency_codes: List[str],
+    urls: Sequence[str] = ("https://www.cbr-xml-daily.ru/daily_json.js",),
+    timeout: float = 10.0
+) -> Dict[str, float]:
+    """
+    Получает курсы валют, опрашивая несколько адресов (зеркал) API параллельно.
+
+    Запросы ко всем адресам выполняются одновременно в отдельном пуле
+    потоков, и используется первый успешно полученный ответ. После него
+    пул закрывается без ожидания (shutdown(wait=False)), поэтому ни
+    корутина, ни asyncio.run не ждут более медленные зеркала: время
+    ожидания определяется самым быстрым из них. Уже начатые запросы
+    к остальным адресам завершаются в фоне, их результат отбрасывается.
+
+    Args:
+        currency_codes: Список кодов валют для получения (например, ["USD", "EUR"])
+        urls: Адреса API, возвращающие ответ в формате daily_json.js
+        timeout: Таймаут каждого запроса в секундах
+
+    Returns:
+        Словарь с кодами валют и их курсами, например: {"USD": 93.25, "EUR": 101.7}
+
+    Raises:
+        ConnectionError: Если ни один адрес не вернул корректный ответ
+        KeyError: Если в ответе отсутствует ключ "Valute" или запрашиваемая валюта
+        TypeError: Если курс валюты имеет неверный тип (не число)
+
+    Examples:
+        >>> asyncio.run(get_currencies_async(["USD"], urls=[url1, url2]))
+        {'USD': 93.25}
+    """
+    loop = asyncio.get_running_loop()
+    # Собственный пул вместо пула по умолчанию (asyncio.to_thread):
+    # asyncio.run при завершении дожидается пула по умолчанию, то есть
+    # самого медленного зеркала
+    executor = ThreadPoolExecutor(max_workers=max(len(urls), 1))
+    tasks = [
+        loop.run_in_executor(executor, _fetch_json, url, timeout)
+        for url in urls
+    ]
+    try:
+        errors = []
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                json_data = await next_done
+            except (ConnectionError, ValueError) as e:
+                errors.append(e)
+                continue
+            return _extract_rates(json_data, currency_codes)
+        raise ConnectionError(f"Ни один из адресов API не ответил: {errors}")
+    finally:
+        for task in tasks:
+            task.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 # Обертываем функцию декоратором
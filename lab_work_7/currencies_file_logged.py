@@ -16,11 +16,13 @@ def setup_file_logging() -> logging.Logger:
     """
     # Создаем логгер
     logger = logging.getLogger("currency_file")
-    logger.setLevel(logging.DEBUG)
+    # Декоратор пишет только INFO и ERROR; уровень DEBUG лишь раздувал бы
+    # файл журнала и отключал отсечение сообщений по уровню
+    logger.setLevel(logging.INFO)
     
     # Создаем обработчик для записи в файл
     file_handler = logging.FileHandler("currency.log", encoding='utf-8')
-    file_handler.setLevel(logging.DEBUG)
+    file_handler.setLevel(logging.INFO)
     
     # Настраиваем формат сообщений
     formatter = logging.Formatter(
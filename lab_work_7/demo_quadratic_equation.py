@@ -4,10 +4,23 @@
 Показывает использование логирующего декоратора с разными уровнями логирования.
 """
 
-import math
+import warnings
+from functools import lru_cache
 from logger import logger
+from quadratic_core import solve_quadratic_core
 from typing import Tuple, Optional, Union
 
+# Кортеж типов создается один раз, а не при каждом вызове
+_NUMERIC = (int, float)
+
+
+# Числовое ядро вынесено в quadratic_core, чтобы его можно было
+# скомпилировать mypyc, оставив логирование и warnings в Python.
+# Ядро — чистая функция, поэтому результат кэшируется по (a, b, c);
+# коэффициенты приводятся к float, чтобы (1, -3, 2) и (1.0, -3.0, 2.0)
+# попадали в одну запись кэша
+_solve_quadratic_impl = lru_cache(maxsize=1024)(solve_quadratic_core)
+
 
 @logger
 def solve_quadratic(
@@ -18,53 +31,48 @@ def solve_quadratic(
     """
     Решает квадратное уравнение ax² + bx + c = 0.
     
+    Вычисления выполняет _solve_quadratic_impl, результаты которой
+    кэшируются, поэтому повторные вызовы с теми же коэффициентами
+    не пересчитывают корни. Проверки и предупреждение выполняются
+    при каждом вызове.
+    
     Args:
         a: Коэффициент при x²
         b: Коэффициент при x
         c: Свободный член
     
     Returns:
-        Кортеж с корнями уравнения или None, если корней нет.
+        Кортеж с корнями уравнения или None, если корней нет
+        (в этом случае выдается RuntimeWarning).
     
     Raises:
         TypeError: Если коэффициенты не числовые
         ValueError: Если a = 0 и b = 0 (бессмысленное уравнение)
     """
     # Проверка типов
-    if not all(isinstance(coef, (int, float)) for coef in (a, b, c)):
+    if not (isinstance(a, _NUMERIC) and isinstance(b, _NUMERIC)
+            and isinstance(c, _NUMERIC)):
         raise TypeError("Все коэффициенты должны быть числами")
     
     # Проверка на критическую ситуацию
     if a == 0 and b == 0:
         raise ValueError("Уравнение 0 = c не имеет смысла при c ≠ 0")
     
-    # Если a = 0, это линейное уравнение
-    if a == 0:
-        if b == 0:
-            return None
-        x = -c / b
-        return (x,)
-    
-    # Вычисление дискриминанта
-    discriminant = b**2 - 4*a*c
-    
-    # Обработка отрицательного дискриминанта
-    if discriminant < 0:
-        # Генерируем предупреждение через исключение
-        # (в реальном коде использовали бы warnings.warn)
-        print(f"WARNING: Дискриминант отрицательный: D = {discriminant}")
-        return None
-    
-    # Вычисление корней
-    sqrt_d = math.sqrt(discriminant)
-    x1 = (-b + sqrt_d) / (2*a)
-    x2 = (-b - sqrt_d) / (2*a)
-    
-    # Если корни совпадают, возвращаем один корень
-    if math.isclose(x1, x2):
-        return (x1,)
-    
-    return (x1, x2)
+    discriminant, roots = _solve_quadratic_impl(float(a), float(b), float(c))
+    
+    # Обработка отрицательного дискриминанта. Предупреждение проходит через
+    # фильтры warnings: одинаковые сообщения из одного места выводятся
+    # один раз, а warnings.simplefilter("ignore", RuntimeWarning) вокруг
+    # цикла вычислений отключает их полностью. stacklevel=3 указывает
+    # на код, вызвавший solve_quadratic (уровень 2 — обертка logger)
+    if roots is None:
+        warnings.warn(
+            f"Дискриминант отрицательный: D = {discriminant}",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+    
+    return roots
 
 
 # Пример использования с разными сценариями
@@ -6,10 +6,64 @@
 
 import sys
 import io
+import itertools
 import logging
+import reprlib
 from functools import wraps
 from typing import Any, Callable, Optional, Union, TextIO, Type
-from datetime import datetime
+import time
+
+# Формат времени в сообщениях, которые пишутся в поток
+_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Шаблоны сообщений декоратора
+_CALL_MSG = "Вызов функции %s с %s"
+_SUCCESS_MSG = "Функция %s успешно завершилась. Результат: %s"
+_ERROR_MSG = "В функции %s возникло исключение %s: %s"
+
+
+class _ArgsRepr(reprlib.Repr):
+    """reprlib.Repr, выводящий словари в порядке вставки ключей.
+    
+    Стандартный repr_dict сортирует ключи, и kwargs в журнале
+    оказывались не в том порядке, в котором их передали.
+    """
+    
+    def repr_dict(self, x: dict, level: int) -> str:
+        if not x:
+            return '{}'
+        if level <= 0:
+            return '{...}'
+        pieces = [
+            f"{self.repr1(key, level - 1)}: {self.repr1(x[key], level - 1)}"
+            for key in itertools.islice(x, self.maxdict)
+        ]
+        if len(x) > self.maxdict:
+            pieces.append('...')
+        return '{' + ', '.join(pieces) + '}'
+
+
+# repr аргументов с ограничением длины: большие коллекции, строки
+# и числа в журнале обрезаются, а не выводятся целиком. Предел для
+# чисел (maxlong) поднят со стандартных 40 до 200 символов: числа
+# до 200 цифр выводятся полностью, более длинные сокращаются до
+# вида 1000...000
+_args_repr = _ArgsRepr()
+_args_repr.maxstring = _args_repr.maxother = _args_repr.maxlong = 200
+_args_repr.maxtuple = _args_repr.maxlist = _args_repr.maxdict = 20
+
+
+class _LazyArgs:
+    """Аргументы вызова, которые форматируются только при выводе сообщения."""
+    
+    __slots__ = ("args", "kwargs")
+    
+    def __init__(self, args: tuple, kwargs: dict) -> None:
+        self.args = args
+        self.kwargs = kwargs
+    
+    def __str__(self) -> str:
+        return f"args={_args_repr.repr(self.args)}, kwargs={_args_repr.repr(self.kwargs)}"
 
 
 def logger(
@@ -50,42 +104,51 @@ def logger(
     """
     
     def decorator(inner_func: Callable) -> Callable:
+        func_name = inner_func.__name__
+        # Тип handle известен уже при декорировании, поэтому способ вывода
+        # и шаблоны сообщений выбираются здесь один раз, а не на каждом вызове.
+        # Сообщения передаются в %-стиле: logging.Logger форматирует их
+        # лениво и сам добавляет время и уровень (%(asctime)s, %(levelname)s).
+        # Для потока шаблоны заранее дополняются префиксом "[время] УРОВЕНЬ:"
+        # и переводом строки, и каждая запись — одно форматирование и
+        # один вызов write()
+        is_logger = isinstance(handle, logging.Logger)
+        if is_logger:
+            emit_info = handle.info
+            emit_error = handle.error
+            call_fmt, success_fmt, error_fmt = _CALL_MSG, _SUCCESS_MSG, _ERROR_MSG
+        else:
+            def emit_info(fmt: str, *msg_args: Any) -> None:
+                handle.write(fmt % (time.strftime(_TIME_FORMAT), *msg_args))
+            
+            emit_error = emit_info
+            call_fmt = "[%s] INFO: " + _CALL_MSG + "\n"
+            success_fmt = "[%s] INFO: " + _SUCCESS_MSG + "\n"
+            error_fmt = "[%s] ERROR: " + _ERROR_MSG + "\n"
+        
         @wraps(inner_func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Подготовка информации о вызове
-            func_name = inner_func.__name__
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            # Уровень INFO проверяется один раз на вызов: если он выключен,
+            # сообщения о вызове и результате не форматируются вовсе
+            info_enabled = not is_logger or handle.isEnabledFor(logging.INFO)
             
             # Логирование начала вызова
-            start_message = f"[{timestamp}] INFO: Вызов функции {func_name} с args={args}, kwargs={kwargs}"
-            
-            if isinstance(handle, logging.Logger):
-                handle.info(start_message)
-            else:
-                handle.write(start_message + "\n")
+            if info_enabled:
+                emit_info(call_fmt, func_name, _LazyArgs(args, kwargs))
             
             try:
                 # Выполнение функции
                 result = inner_func(*args, **kwargs)
                 
                 # Логирование успешного завершения
-                success_message = f"[{timestamp}] INFO: Функция {func_name} успешно завершилась. Результат: {result}"
-                
-                if isinstance(handle, logging.Logger):
-                    handle.info(success_message)
-                else:
-                    handle.write(success_message + "\n")
+                if info_enabled:
+                    emit_info(success_fmt, func_name, result)
                 
                 return result
                 
             except Exception as e:
-                # Логирование ошибки
-                error_message = f"[{timestamp}] ERROR: В функции {func_name} возникло исключение {type(e).__name__}: {str(e)}"
-                
-                if isinstance(handle, logging.Logger):
-                    handle.error(error_message)
-                else:
-                    handle.write(error_message + "\n")
+                # Логирование ошибки (logging.Logger сам проверяет уровень ERROR)
+                emit_error(error_fmt, func_name, type(e).__name__, e)
                 
                 # Пробрасываем исключение дальше
                 raise
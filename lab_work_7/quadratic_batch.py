@@ -0,0 +1,101 @@
+"""
+Пакетное решение квадратных уравнений ax² + bx + c = 0.
+
+Числовое ядро компилируется Numba и распараллеливается по уравнениям,
+поэтому на больших массивах коэффициентов нет накладных расходов
+интерпретатора, проверок типов и логирования на каждое уравнение.
+Для одиночных вызовов используется solve_quadratic из
+demo_quadratic_equation.
+"""
+
+from typing import Tuple
+
+import numpy as np
+from numba import njit, prange
+
+# Коды количества корней в массиве status
+NO_ROOTS = 0
+ONE_ROOT = 1
+TWO_ROOTS = 2
+
+
+# fastmath не включается: ядро записывает NaN, а флаг nnan из fastmath
+# разрешает компилятору считать, что NaN не бывает
+@njit(parallel=True, cache=True)
+def _solve_batch(a, b, c, x1, x2, status):
+    for i in prange(a.shape[0]):
+        ai = a[i]
+        bi = b[i]
+        ci = c[i]
+        x1[i] = np.nan
+        x2[i] = np.nan
+        status[i] = NO_ROOTS
+
+        # Линейное уравнение bx + c = 0
+        if ai == 0.0:
+            if bi != 0.0:
+                x1[i] = -ci / bi
+                status[i] = ONE_ROOT
+            continue
+
+        d = bi * bi - 4.0 * ai * ci
+        if d < 0.0:
+            continue
+
+        inv_2a = 0.5 / ai
+        sqrt_d = np.sqrt(d)
+        r1 = (-bi + sqrt_d) * inv_2a
+        r2 = (-bi - sqrt_d) * inv_2a
+        x1[i] = r1
+        # Совпадение корней проверяется так же, как math.isclose
+        # (rel_tol=1e-9) в скалярном solve_quadratic_core
+        if r1 == r2 or abs(r1 - r2) <= 1e-9 * max(abs(r1), abs(r2)):
+            status[i] = ONE_ROOT
+        else:
+            x2[i] = r2
+            status[i] = TWO_ROOTS
+
+
+def solve_quadratic_batch(
+    a: np.ndarray,
+    b: np.ndarray,
+    c: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Решает массив квадратных уравнений a[i]x² + b[i]x + c[i] = 0.
+
+    Args:
+        a: Коэффициенты при x² (массив или число, приводится к float64)
+        b: Коэффициенты при x
+        c: Свободные члены
+
+    Returns:
+        Кортеж (x1, x2, status) массивов одинаковой длины:
+            - x1, x2: корни (NaN, если соответствующего корня нет)
+            - status: количество корней (NO_ROOTS, ONE_ROOT, TWO_ROOTS).
+              При a = 0 и b = 0 уравнение считается не имеющим корней.
+              Корни, равные с точностью math.isclose, считаются одним,
+              как и в solve_quadratic.
+
+    Raises:
+        ValueError: Если формы массивов коэффициентов несовместимы
+
+    Examples:
+        >>> x1, x2, status = solve_quadratic_batch([1, 1], [-3, -4], [2, 4])
+        >>> x1, x2, status
+        (array([2., 2.]), array([ 1., nan]), array([2, 1], dtype=uint8))
+    """
+    a, b, c = (
+        np.ascontiguousarray(v, dtype=np.float64).ravel()
+        for v in np.broadcast_arrays(
+            np.asarray(a, dtype=np.float64),
+            np.asarray(b, dtype=np.float64),
+            np.asarray(c, dtype=np.float64),
+        )
+    )
+    n = a.shape[0]
+    x1 = np.empty(n, dtype=np.float64)
+    x2 = np.empty(n, dtype=np.float64)
+    status = np.empty(n, dtype=np.uint8)
+    _solve_batch(a, b, c, x1, x2, status)
+    return x1, x2, status
@@ -0,0 +1,54 @@
+"""
+Числовое ядро решения квадратного уравнения ax² + bx + c = 0.
+
+Модуль содержит только арифметику над float без логирования, warnings
+и проверок типов, поэтому его можно скомпилировать mypyc в C-расширение:
+
+    mypyc quadratic_core.py
+
+После сборки рядом появляется quadratic_core.*.so, и import подхватывает
+скомпилированную версию без изменений в вызывающем коде. Без сборки
+используется этот же файл как обычный Python-модуль.
+"""
+
+import math
+from typing import Optional, Tuple
+
+
+def solve_quadratic_core(
+    a: float,
+    b: float,
+    c: float
+) -> Tuple[float, Optional[Tuple[float, ...]]]:
+    """
+    Вычисляет корни уравнения ax² + bx + c = 0 для проверенных коэффициентов.
+
+    Args:
+        a: Коэффициент при x² (float)
+        b: Коэффициент при x (float, не равен 0 при a = 0)
+        c: Свободный член (float)
+
+    Returns:
+        Кортеж (дискриминант, корни); корни равны None, если их нет.
+        Для линейного уравнения (a = 0) дискриминант равен 0.0.
+    """
+    # Если a = 0, это линейное уравнение
+    if a == 0:
+        return 0.0, (-c / b,)
+
+    # Вычисление дискриминанта
+    discriminant = b * b - 4 * a * c
+    if discriminant < 0:
+        return discriminant, None
+
+    # Вычисление корней
+    sqrt_d = math.sqrt(discriminant)
+    inv_2a = 0.5 / a
+    x1 = (-b + sqrt_d) * inv_2a
+    x2 = (-b - sqrt_d) * inv_2a
+
+    # Если корни совпадают, возвращаем один корень
+    if math.isclose(x1, x2):
+        return discriminant, (x1,)
+
+    return discriminant, (x1, x2)
@@ -3,10 +3,11 @@
 """
 
 import sys
+import asyncio
 import logging
 from typing import NoReturn
 from demo_quadratic_equation import demonstrate_quadratic
-from currencies import get_currencies_logged
+from currencies import get_currencies_logged, get_currencies_async
 from currencies_file_logged import get_currencies_file_logged
 
 def main() -> NoReturn:
@@ -33,6 +34,13 @@ def main() -> NoReturn:
     except Exception as e:
         print(f"\nОшибка при получении курсов валют: {e}")
     
+    # Асинхронная версия: один запрос на все коды валют сразу
+    try:
+        result = asyncio.run(get_currencies_async(["USD", "EUR", "GBP"]))
+        print(f"Курсы валют (asyncio): {result}")
+    except Exception as e:
+        print(f"Ошибка при асинхронном получении курсов валют: {e}")
+    
     # Демонстрация логирования в файл
     print("\n" + "=" * 60)
     print("Логирование в файл")
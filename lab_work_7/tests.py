@@ -3,20 +3,52 @@
 """
 
 import unittest
+import asyncio
+import gzip
 import io
+import threading
+import time
 from unittest.mock import patch, Mock
 import json
 from urllib.error import URLError
 
-from currencies import get_currencies
+from currencies import clear_cache, get_currencies, get_currencies_async
 from logger import logger
 from demo_quadratic_equation import solve_quadratic
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 class TestGetCurrencies(unittest.TestCase):
     """Тесты для функции get_currencies."""
     
-    @patch('urllib.request.urlopen')
-    def test_successful_request(self, mock_urlopen):
+    @classmethod
+    def setUpClass(cls):
+        """Подменяем urllib.request.urlopen один раз для всех тестов класса.
+        
+        Тесты подменяют urlopen, поэтому httpx отключается.
+        """
+        cls.patchers = [
+            patch('urllib.request.urlopen'),
+            patch('currencies.httpx', None),
+        ]
+        cls.mock_urlopen = cls.patchers[0].start()
+        cls.patchers[1].start()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Снимаем подмены."""
+        for patcher in reversed(cls.patchers):
+            patcher.stop()
+    
+    def setUp(self):
+        """Сбрасываем мок urlopen и кэш ответов API между тестами."""
+        self.mock_urlopen.reset_mock(return_value=True, side_effect=True)
+        clear_cache()
+    
+    def test_successful_request(self):
         """Тест успешного получения курсов валют."""
         # Мокаем ответ API
         mock_response = Mock()
@@ -26,14 +58,13 @@ class TestGetCurrencies(unittest.TestCase):
                 "EUR": {"Value": 101.70}
             }
         }).encode('utf-8')
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        self.mock_urlopen.return_value.__enter__.return_value = mock_response
         
         result = get_currencies(["USD", "EUR"])
         
         self.assertEqual(result, {"USD": 93.25, "EUR": 101.70})
     
-    @patch('urllib.request.urlopen')
-    def test_currency_not_found(self, mock_urlopen):
+    def test_currency_not_found(self):
         """Тест случая, когда валюта не найдена."""
         mock_response = Mock()
         mock_response.read.return_value = json.dumps({
@@ -41,33 +72,30 @@ class TestGetCurrencies(unittest.TestCase):
                 "USD": {"Value": 93.25}
             }
         }).encode('utf-8')
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        self.mock_urlopen.return_value.__enter__.return_value = mock_response
         
         with self.assertRaises(KeyError):
             get_currencies(["GBP"])
     
-    @patch('urllib.request.urlopen')
-    def test_invalid_json(self, mock_urlopen):
+    def test_invalid_json(self):
         """Тест некорректного JSON."""
         mock_response = Mock()
         mock_response.read.return_value = b"invalid json"
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        self.mock_urlopen.return_value.__enter__.return_value = mock_response
         
         with self.assertRaises(ValueError):
             get_currencies(["USD"])
     
-    @patch('urllib.request.urlopen')
-    def test_missing_valute_key(self, mock_urlopen):
+    def test_missing_valute_key(self):
         """Тест отсутствия ключа 'Valute'."""
         mock_response = Mock()
         mock_response.read.return_value = json.dumps({"other": "data"}).encode('utf-8')
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        self.mock_urlopen.return_value.__enter__.return_value = mock_response
         
         with self.assertRaises(KeyError):
             get_currencies(["USD"])
     
-    @patch('urllib.request.urlopen')
-    def test_invalid_currency_type(self, mock_urlopen):
+    def test_invalid_currency_type(self):
         """Тест некорректного типа курса валюты."""
         mock_response = Mock()
         mock_response.read.return_value = json.dumps({
@@ -75,10 +103,136 @@ class TestGetCurrencies(unittest.TestCase):
                 "USD": {"Value": "not a number"}
             }
         }).encode('utf-8')
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        self.mock_urlopen.return_value.__enter__.return_value = mock_response
         
         with self.assertRaises(TypeError):
             get_currencies(["USD"])
+    
+    def test_response_is_cached(self):
+        """Тест повторного вызова без обращения к API."""
+        mock_response = Mock()
+        mock_response.read.return_value = json.dumps({
+            "Valute": {
+                "USD": {"Value": 93.25},
+                "EUR": {"Value": 101.70}
+            }
+        }).encode('utf-8')
+        self.mock_urlopen.return_value.__enter__.return_value = mock_response
+        
+        self.assertEqual(get_currencies(["USD"]), {"USD": 93.25})
+        self.assertEqual(get_currencies(["EUR"]), {"EUR": 101.70})
+        self.mock_urlopen.assert_called_once()
+    
+    def test_gzip_response(self):
+        """Тест распаковки ответа, сжатого gzip."""
+        mock_response = Mock()
+        mock_response.read.return_value = gzip.compress(json.dumps({
+            "Valute": {"USD": {"Value": 93.25}}
+        }).encode('utf-8'))
+        mock_response.headers = {"Content-Encoding": "gzip"}
+        self.mock_urlopen.return_value.__enter__.return_value = mock_response
+        
+        result = get_currencies(["USD"])
+        
+        self.assertEqual(result, {"USD": 93.25})
+        req = self.mock_urlopen.call_args[0][0]
+        self.assertEqual(req.get_header("Accept-encoding"), "gzip")
+
+    def test_bad_gzip_response(self):
+        """Тест что поврежденный gzip не прерывает перебор зеркал."""
+        good = json.dumps({"Valute": {"USD": {"Value": 93.25}}}).encode('utf-8')
+        payloads = {
+            "https://bad.test": b"not gzip at all",
+            "https://cut.test": gzip.compress(good)[:-10],
+            "https://up.test": gzip.compress(good),
+        }
+
+        def fake_urlopen(req, timeout):
+            mock_response = Mock()
+            mock_response.read.return_value = payloads[req.full_url]
+            mock_response.headers = {"Content-Encoding": "gzip"}
+            mock_response.__enter__ = Mock(return_value=mock_response)
+            mock_response.__exit__ = Mock(return_value=False)
+            return mock_response
+
+        self.mock_urlopen.side_effect = fake_urlopen
+        for url in ("https://bad.test", "https://cut.test"):
+            with self.assertRaises(ConnectionError):
+                get_currencies(["USD"], url=url)
+
+        result = asyncio.run(get_currencies_async(
+            ["USD"], urls=["https://bad.test", "https://up.test"]
+        ))
+        self.assertEqual(result, {"USD": 93.25})
+
+    def test_errors_reported_in_request_order(self):
+        """Тест что ошибка более раннего кода сообщается первой."""
+        mock_response = Mock()
+        mock_response.read.return_value = json.dumps({
+            "Valute": {"USD": {"Value": "93,25"}}
+        }).encode('utf-8')
+        mock_response.headers = {}
+        self.mock_urlopen.return_value.__enter__.return_value = mock_response
+        
+        with self.assertRaises(TypeError):
+            get_currencies(["USD", "XXX"])
+        with self.assertRaises(KeyError):
+            get_currencies(["XXX", "USD"])
+    
+    def test_async_uses_working_mirror(self):
+        """Тест асинхронного запроса к нескольким адресам, один из которых недоступен."""
+        mock_response = Mock()
+        mock_response.read.return_value = json.dumps({
+            "Valute": {"USD": {"Value": 93.25}}
+        }).encode('utf-8')
+        
+        def fake_urlopen(req, timeout):
+            if req.full_url == "https://down.test":
+                raise URLError("Connection failed")
+            return mock_response
+        
+        self.mock_urlopen.side_effect = fake_urlopen
+        mock_response.__enter__ = Mock(return_value=mock_response)
+        mock_response.__exit__ = Mock(return_value=False)
+        
+        result = asyncio.run(get_currencies_async(
+            ["USD"], urls=["https://down.test", "https://up.test"]
+        ))
+        
+        self.assertEqual(result, {"USD": 93.25})
+        
+        self.mock_urlopen.side_effect = URLError("Connection failed")
+        with self.assertRaises(ConnectionError):
+            asyncio.run(get_currencies_async(["USD"], urls=["https://down.test"]))
+
+    def test_async_does_not_wait_for_slow_mirror(self):
+        """Тест что asyncio.run не ждет медленное зеркало после первого ответа."""
+        mock_response = Mock()
+        mock_response.read.return_value = json.dumps({
+            "Valute": {"USD": {"Value": 93.25}}
+        }).encode('utf-8')
+        mock_response.headers = {}
+        mock_response.__enter__ = Mock(return_value=mock_response)
+        mock_response.__exit__ = Mock(return_value=False)
+        release = threading.Event()
+        
+        def fake_urlopen(req, timeout):
+            if req.full_url == "https://slow.test":
+                release.wait(5)
+            return mock_response
+        
+        self.mock_urlopen.side_effect = fake_urlopen
+        try:
+            start = time.monotonic()
+            result = asyncio.run(get_currencies_async(
+                ["USD"], urls=["https://slow.test", "https://fast.test"]
+            ))
+            elapsed = time.monotonic() - start
+        finally:
+            release.set()
+        
+        self.assertEqual(result, {"USD": 93.25})
+        self.assertLess(elapsed, 2)
 
 
 class TestLoggerDecorator(unittest.TestCase):
@@ -131,13 +285,29 @@ class TestLoggerDecorator(unittest.TestCase):
         
         self.assertEqual(result, 12)
         self.assertIn("kwargs={'b': 4}", logs)
+    
+    def test_logger_keeps_kwargs_order(self):
+        """Тест порядка kwargs и предела длины чисел (200 символов)."""
+        @logger(handle=self.stream)
+        def test_func(**kwargs: int) -> int:
+            return len(kwargs)
+        
+        test_func(z=1, a=10 ** 50)
+        test_func(big=10 ** 300)
+        
+        output = self.stream.getvalue()
+        self.assertIn(f"kwargs={{'z': 1, 'a': {10 ** 50}}}", output)
+        self.assertNotIn(str(10 ** 300), output)
+        self.assertIn("...", output)
 
 
+@patch('currencies.httpx', None)
 class TestStreamWrite(unittest.TestCase):
     """Тесты для работы с StringIO."""
     
     def setUp(self):
         """Настройка тестового окружения."""
+        clear_cache()
         self.stream = io.StringIO()
         
         @logger(handle=self.stream)
@@ -175,8 +345,11 @@ class TestQuadraticEquation(unittest.TestCase):
     
     def test_no_roots(self):
         """Тест уравнения без действительных корней."""
-        result = solve_quadratic(1, 2, 5)
+        with self.assertWarns(RuntimeWarning) as context:
+            result = solve_quadratic(1, 2, 5)
         self.assertIsNone(result)
+        self.assertIn("D = -16", str(context.warning))
+        self.assertEqual(context.filename, __file__)
     
     def test_invalid_type(self):
         """Тест с некорректным типом данных."""
@@ -189,5 +362,40 @@ class TestQuadraticEquation(unittest.TestCase):
             solve_quadratic(0, 0, 5)
 
 
+
+@unittest.skipUnless(numba, "требуется numba")
+class TestQuadraticBatch(unittest.TestCase):
+    """Тесты для пакетного решения квадратных уравнений."""
+    
+    def test_batch_matches_scalar(self):
+        """Тест совпадения результатов с solve_quadratic."""
+        import math
+        import warnings
+        from quadratic_batch import solve_quadratic_batch
+        
+        coefs = [
+            (1, -3, 2), (1, -4, 4), (1, 2, 5), (0, 2, -4),
+            # d > 0, но корни совпадают по math.isclose
+            (7.54150754e-316, -1.2685683742340105e-136, 4.0256001675192547e+30),
+        ]
+        x1, x2, status = solve_quadratic_batch(*zip(*coefs))
+        
+        for i, coef in enumerate(coefs):
+            with self.subTest(coef=coef):
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", RuntimeWarning)
+                    roots = solve_quadratic(*coef) or ()
+                self.assertEqual(status[i], len(roots))
+                found = tuple(x for x in (x1[i], x2[i]) if not math.isnan(x))
+                self.assertEqual(found, roots)
+    
+    def test_degenerate_equation(self):
+        """Тест уравнения с a = 0 и b = 0: корней нет, исключение не выбрасывается."""
+        from quadratic_batch import NO_ROOTS, solve_quadratic_batch
+        
+        _, _, status = solve_quadratic_batch([0.0], [0.0], [5.0])
+        self.assertEqual(status[0], NO_ROOTS)
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
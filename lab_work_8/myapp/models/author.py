@@ -12,6 +12,9 @@ class Author:
         _group: Учебная группа автора (приватный атрибут).
     """
 
+    # Без __dict__ на экземпляр: меньше памяти и быстрее доступ к атрибутам
+    __slots__ = ('_name', '_group')
+
     def __init__(self, name: str, group: str) -> None:
         """Инициализирует объект Author.
         
@@ -48,9 +51,10 @@ class Author:
         """
         if not isinstance(value, str):
             raise TypeError(f"Имя должно быть строкой, получено: {type(value).__name__}")
-        if not value.strip():
+        stripped = value.strip()
+        if not stripped:
             raise ValueError("Имя не может быть пустым")
-        self._name = value.strip()
+        self._name = stripped
 
     @property
     def group(self) -> str:
@@ -74,9 +78,10 @@ class Author:
         """
         if not isinstance(value, str):
             raise TypeError(f"Группа должна быть строкой, получено: {type(value).__name__}")
-        if not value.strip():
+        stripped = value.strip()
+        if not stripped:
             raise ValueError("Группа не может быть пустой")
-        self._group = value.strip()
+        self._group = stripped
 
     def __repr__(self) -> str:
         """Возвращает строковое представление объекта для отладки.
@@ -18,6 +18,8 @@ class Currency:
         _nominal: Номинал валюты (приватный атрибут).
     """
 
+    __slots__ = ('_id', '_num_code', '_char_code', '_name', '_value', '_nominal')
+
     def __init__(
         self,
         currency_id: str,
@@ -10,8 +10,12 @@ class User:
     Атрибуты:
         _id: Уникальный идентификатор пользователя (приватный атрибут).
         _name: Имя пользователя (приватный атрибут).
+        _hash: Закэшированный хэш _id (обновляется вместе с id).
     """
 
+    # Без __dict__ на экземпляр: меньше памяти и быстрее доступ к атрибутам
+    __slots__ = ('_id', '_name', '_hash')
+
     def __init__(self, user_id: int, name: str) -> None:
         """Инициализирует объект User.
         
@@ -23,8 +27,20 @@ class User:
             TypeError: Если параметры имеют неверные типы.
             ValueError: Если user_id отрицательный или name пустой.
         """
-        self.id = user_id
-        self.name = name
+        # Проверки сеттеров id и name повторены здесь, чтобы при создании
+        # объекта не вызывать дескрипторы свойств
+        if not isinstance(user_id, int):
+            raise TypeError(f"ID должен быть целым числом, получено: {type(user_id).__name__}")
+        if user_id <= 0:
+            raise ValueError(f"ID должен быть положительным числом, получено: {user_id}")
+        if not isinstance(name, str):
+            raise TypeError(f"Имя должно быть строкой, получено: {type(name).__name__}")
+        name = name.strip()
+        if not name:
+            raise ValueError("Имя не может быть пустым")
+        self._id = user_id
+        self._hash = hash(user_id)
+        self._name = name
 
     @property
     def id(self) -> int:
@@ -51,6 +67,7 @@ class User:
         if value <= 0:
             raise ValueError(f"ID должен быть положительным числом, получено: {value}")
         self._id = value
+        self._hash = hash(value)
 
     @property
     def name(self) -> str:
@@ -74,9 +91,10 @@ class User:
         """
         if not isinstance(value, str):
             raise TypeError(f"Имя должно быть строкой, получено: {type(value).__name__}")
-        if not value.strip():
+        stripped = value.strip()
+        if not stripped:
             raise ValueError("Имя не может быть пустым")
-        self._name = value.strip()
+        self._name = stripped
 
     def __repr__(self) -> str:
         """Возвращает строковое представление объекта для отладки.
@@ -110,7 +128,9 @@ class User:
     def __hash__(self) -> int:
         """Возвращает хэш пользователя для использования в хэш-таблицах.
         
+        Хэш вычисляется при установке id, а не при каждом обращении.
+        
         Returns:
             Хэш ID пользователя.
         """
-        return hash(self._id)
+        return self._hash
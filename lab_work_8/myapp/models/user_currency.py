@@ -22,6 +22,9 @@ class UserCurrency:
         _currency_id: ID валюты (внешний ключ) (приватный атрибут).
     """
 
+    # Подписок больше, чем других объектов, поэтому экземпляры без __dict__
+    __slots__ = ('_id', '_user_id', '_currency_id')
+
     def __init__(self, uc_id: int, user_id: int, currency_id: str) -> None:
         """Инициализирует объект UserCurrency.
         
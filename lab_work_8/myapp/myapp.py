@@ -4,22 +4,39 @@
 Содержит контроллер для обработки HTTP запросов и рендеринга Jinja2 шаблонов.
 """
 
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from typing import Dict, List, Any, Optional
-from urllib.parse import parse_qs, urlparse
-from jinja2 import Environment, PackageLoader, select_autoescape
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Callable, Dict, List, Any, Optional, Tuple
+from jinja2 import (
+    Environment, FileSystemBytecodeCache, PackageLoader, select_autoescape,
+)
+import html
 import json
+import os
 import threading
+import time
 from datetime import datetime
 
 from myapp.models import Author, App, User, Currency, UserCurrency
 from myapp.utils import get_currencies
 
 
-# Инициализация Jinja2 окружения один раз при старте приложения
+# Инициализация Jinja2 окружения один раз при старте приложения.
+# Шаблоны не меняются во время работы сервера, поэтому проверка
+# изменений файлов (auto_reload) отключена, а кэш шаблонов не ограничен.
+# Скомпилированный байткод шаблонов сохраняется на диск, поэтому
+# при следующих запусках шаблоны не разбираются заново. Каталог
+# задается переменной JINJA_CACHE; по умолчанию Jinja2 использует
+# личный каталог пользователя во временной директории
+_jinja_cache_dir: Optional[str] = os.environ.get("JINJA_CACHE")
+if _jinja_cache_dir:
+    os.makedirs(_jinja_cache_dir, exist_ok=True)
+
 env: Environment = Environment(
     loader=PackageLoader("myapp", "templates"),
     autoescape=select_autoescape(),
+    bytecode_cache=FileSystemBytecodeCache(_jinja_cache_dir, "%s.cache"),
+    auto_reload=False,
+    cache_size=-1,
 )
 
 # Загрузка шаблонов один раз
@@ -29,6 +46,141 @@ template_currencies: Any = env.get_template("currencies.html")
 template_user_detail: Any = env.get_template("user_detail.html")
 template_author: Any = env.get_template("author.html")
 
+# Период фонового обновления курсов валют (секунды)
+CURRENCIES_REFRESH_INTERVAL: float = 600.0
+
+# Страница 404 не зависит от данных приложения
+_NOT_FOUND_HTML: str = """
+        <!DOCTYPE html>
+        <html lang="ru">
+        <head>
+            <meta charset="UTF-8">
+            <title>Ошибка 404</title>
+            <style>
+                body {
+                    font-family: Arial, sans-serif;
+                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                    display: flex;
+                    align-items: center;
+                    justify-content: center;
+                    min-height: 100vh;
+                    margin: 0;
+                }
+                .error-container {
+                    background: white;
+                    padding: 40px;
+                    border-radius: 10px;
+                    text-align: center;
+                    box-shadow: 0 10px 40px rgba(0,0,0,0.2);
+                }
+                h1 { color: #c62828; font-size: 3em; margin: 0; }
+                p { color: #666; font-size: 1.2em; margin: 20px 0; }
+                a { color: #667eea; text-decoration: none; font-weight: 600; }
+                a:hover { text-decoration: underline; }
+            </style>
+        </head>
+        <body>
+            <div class="error-container">
+                <h1>404</h1>
+                <p>Страница не найдена</p>
+                <p><a href="/">← Вернуться на главную</a></p>
+            </div>
+        </body>
+        </html>
+        """
+
+# Тело страницы 404 кодируется один раз при импорте (готовый ответ
+# с заголовками — _NOT_FOUND_RESPONSE ниже)
+_NOT_FOUND_BODY: bytes = _NOT_FOUND_HTML.encode("utf-8")
+
+# Страница ошибки (5xx) разбита на неизменные части, закодированные
+# заранее: при ошибке кодируются только код статуса и сообщение
+_ERROR_HTML_PARTS: Tuple[bytes, ...] = tuple(
+    part.encode("utf-8") for part in (
+        """
+        <!DOCTYPE html>
+        <html lang="ru">
+        <head>
+            <meta charset="UTF-8">
+            <title>Ошибка """,
+        """</title>
+            <style>
+                body {
+                    font-family: Arial, sans-serif;
+                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                    display: flex;
+                    align-items: center;
+                    justify-content: center;
+                    min-height: 100vh;
+                    margin: 0;
+                }
+                .error-container {
+                    background: white;
+                    padding: 40px;
+                    border-radius: 10px;
+                    text-align: center;
+                    box-shadow: 0 10px 40px rgba(0,0,0,0.2);
+                }
+                h1 { color: #c62828; font-size: 3em; margin: 0; }
+                p { color: #666; font-size: 1.2em; margin: 20px 0; }
+            </style>
+        </head>
+        <body>
+            <div class="error-container">
+                <h1>""",
+        """</h1>
+                <p>""",
+        """</p>
+            </div>
+        </body>
+        </html>
+        """,
+    )
+)
+
+# Префикс ETag, уникальный для процесса: счетчик версий данных
+# начинается заново при перезапуске, и без префикса браузер мог бы
+# получить 304 для страницы, построенной по другим данным
+_ETAG_PREFIX: str = "%x" % time.time_ns()
+
+# Страницы, содержимое которых не меняется между запросами
+# (зависят только от app_config). Рендерятся один раз функцией
+# prerender_static_pages и хранятся в виде _prebuilt_response
+_STATIC_PAGES: Dict[str, bytes] = {}
+
+
+def _prebuilt_response(body: bytes) -> bytes:
+    """Собирает постоянные заголовки и тело ответа в один буфер.
+    
+    Статусная строка и заголовки Server/Date добавляются при отправке
+    (_send_prebuilt), так как Date меняется с каждым ответом.
+    
+    Args:
+        body: HTML содержимое ответа в UTF-8.
+        
+    Returns:
+        Заголовки Content-Type и Content-Length, пустая строка и тело.
+    """
+    return (
+        "Content-Type: text/html; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n"
+    ).encode("latin-1") + body
+
+
+_NOT_FOUND_RESPONSE: bytes = _prebuilt_response(_NOT_FOUND_BODY)
+
+
+def _now_str() -> str:
+    """Возвращает текущее локальное время в формате "ГГГГ-ММ-ДД чч:мм:сс".
+    
+    Форматирование целых чисел оператором % вместо strftime: не нужен
+    разбор строки формата с учетом локали.
+    """
+    n = datetime.now()
+    return "%04d-%02d-%02d %02d:%02d:%02d" % (
+        n.year, n.month, n.day, n.hour, n.minute, n.second,
+    )
+
 
 class CurrenciesServer(BaseHTTPRequestHandler):
     """Обработчик HTTP запросов для приложения.
@@ -42,8 +194,30 @@ class CurrenciesServer(BaseHTTPRequestHandler):
     users: Dict[int, User] = {}
     user_currencies: List[UserCurrency] = []
     currencies_cache: List[Dict[str, Any]] = []
+    # Валюты каждого пользователя (user_id -> валюты из currencies_cache),
+    # пересчитывается при изменении подписок или кэша валют
+    user_to_currencies: Dict[int, List[Dict[str, Any]]] = {}
     currencies_cache_lock: threading.Lock = threading.Lock()
+    # Число завершенных неудачных загрузок валют и ошибка последней.
+    # Потоки, ждавшие блокировку во время неудачной загрузки, получают
+    # ту же ошибку, а не повторяют запрос к API по очереди
+    currencies_fetch_attempt: int = 0
+    currencies_fetch_error: Optional[str] = None
     last_update: Optional[str] = None
+    # Версия данных (пользователи, подписки, валюты) и отрендеренные по
+    # ней страницы: (путь, user_id) -> (версия, HTML в UTF-8). Кэш
+    # заменяется пустым при каждой публикации новых данных
+    data_version: int = 0
+    _render_cache: Dict[Tuple[str, Optional[int]], Tuple[int, bytes]] = {}
+
+    # Маршруты без параметров: путь -> имя метода-обработчика.
+    # Имена строками, чтобы не зависеть от порядка определения методов
+    _ROUTES: Dict[str, str] = {
+        "/": "_handle_index",
+        "/users": "_handle_users",
+        "/currencies": "_handle_currencies",
+        "/author": "_handle_author",
+    }
 
     def do_GET(self) -> None:
         """Обрабатывает GET запросы.
@@ -58,26 +232,20 @@ class CurrenciesServer(BaseHTTPRequestHandler):
         - GET /currencies — список валют
         - GET /author — информация об авторе
         """
-        # Парсим URL
-        parsed_url = urlparse(self.path)
-        path = parsed_url.path
-        query_params = parse_qs(parsed_url.query)
+        # Разделяем путь и query строку без urlparse/parse_qs:
+        # параметр есть только у /user, и это одно целое число
+        path, _, query = self.path.partition("?")
 
         try:
-            if path == "/":
-                self._handle_index()
-            elif path == "/users":
-                self._handle_users()
+            handler_name = self._ROUTES.get(path)
+            if handler_name is not None:
+                getattr(self, handler_name)()
             elif path == "/user":
-                user_id = self._get_query_param(query_params, "id", int)
+                user_id = self._parse_id(query)
                 if user_id is not None:
                     self._handle_user_detail(user_id)
                 else:
                     self._handle_not_found()
-            elif path == "/currencies":
-                self._handle_currencies()
-            elif path == "/author":
-                self._handle_author()
             else:
                 self._handle_not_found()
         except Exception as e:
@@ -85,21 +253,18 @@ class CurrenciesServer(BaseHTTPRequestHandler):
 
     def _handle_index(self) -> None:
         """Обрабатывает главную страницу (/)."""
-        html_content = template_index.render(
-            app_name=self.app_config.app.name,
-            version=self.app_config.app.version,
-            author_name=self.app_config.app.author.name,
-            group=self.app_config.app.author.group,
-        )
-        self._send_response(html_content, 200)
+        self._send_static("/", 200)
 
     def _handle_users(self) -> None:
         """Обрабатывает страницу со списком пользователей (/users)."""
-        html_content = template_users.render(
-            app_name=self.app_config.app.name,
-            users=list(self.users.values()),
+        self._send_cached(
+            ("/users", None),
+            self.data_version,
+            lambda: template_users.render(
+                app_name=self.app_config.app.name,
+                users=list(self.users.values()),
+            ),
         )
-        self._send_response(html_content, 200)
 
     def _handle_user_detail(self, user_id: int) -> None:
         """Обрабатывает страницу деталей пользователя (/user?id=...).
@@ -116,157 +281,186 @@ class CurrenciesServer(BaseHTTPRequestHandler):
             self._send_response(html_content, 404)
             return
 
+        # Версия читается до снимка данных: если данные изменятся между
+        # ними, страница сохранится со старой версией и будет
+        # перерисована при следующем запросе
+        version = self.data_version
         user = self.users[user_id]
 
-        # Получаем валюты, на которые подписан пользователь
-        user_currency_ids = [
-            uc.currency_id
-            for uc in self.user_currencies
-            if uc.user_id == user_id
-        ]
-
-        user_currencies = [
-            c for c in self.currencies_cache
-            if c["id"] in user_currency_ids
-        ]
-
-        html_content = template_user_detail.render(
-            app_name=self.app_config.app.name,
-            user=user,
-            user_currencies=user_currencies,
+        # Валюты, на которые подписан пользователь, из готового индекса
+        user_currencies = self.user_to_currencies.get(user_id, [])
+
+        self._send_cached(
+            ("/user", user_id),
+            version,
+            lambda: template_user_detail.render(
+                app_name=self.app_config.app.name,
+                user=user,
+                user_currencies=user_currencies,
+            ),
         )
-        self._send_response(html_content, 200)
 
     def _handle_currencies(self) -> None:
         """Обрабатывает страницу со списком валют (/currencies)."""
         error = None
 
-        # Если кэш пуст, пытаемся получить валюты
-        if not self.currencies_cache:
-            try:
-                with self.currencies_cache_lock:
-                    currencies_data = get_currencies()
-                    self.currencies_cache = currencies_data
-                    self.last_update = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            except Exception as e:
-                error = f"Не удаётся получить данные о валютах: {str(e)}"
+        # Если кэш пуст, пытаемся получить валюты. Запросы обрабатываются
+        # в разных потоках, поэтому кэш проверяется повторно под
+        # блокировкой: пока один поток загружает валюты, остальные ждут
+        # и затем используют результат его попытки — заполненный кэш
+        # или ту же ошибку.
+        # Чтение без блокировки: писатели не изменяют опубликованный
+        # список, а заменяют ссылку на новый, поэтому локальной копии
+        # ссылки достаточно, чтобы вся страница строилась по одним данным.
+        # Версия читается до снимка (см. _handle_user_detail)
+        version = self.data_version
+        currencies = self.currencies_cache
+        if not currencies:
+            error = self._fetch_currencies_once(self.currencies_fetch_attempt)
+            version = self.data_version
+            currencies = self.currencies_cache
+
+        def render() -> str:
+            return template_currencies.render(
+                app_name=self.app_config.app.name,
+                currencies=currencies,
+                error=error,
+                last_updated=self.last_update,
+            )
 
-        html_content = template_currencies.render(
-            app_name=self.app_config.app.name,
-            currencies=self.currencies_cache,
-            error=error,
-            last_updated=self.last_update,
-        )
-        self._send_response(html_content, 200)
+        # Страница с ошибкой загрузки не кэшируется
+        if error is not None:
+            self._send_response(render(), 200)
+        else:
+            self._send_cached(("/currencies", None), version, render)
 
     def _handle_author(self) -> None:
         """Обрабатывает страницу с информацией об авторе (/author)."""
-        html_content = template_author.render(
-            app_name=self.app_config.app.name,
-            version=self.app_config.app.version,
-            author_name=self.app_config.app.author.name,
-            group=self.app_config.app.author.group,
-        )
-        self._send_response(html_content, 200)
+        self._send_static("/author", 200)
 
     def _handle_not_found(self) -> None:
         """Обрабатывает несуществующие маршруты (404)."""
-        error_html = """
-        <!DOCTYPE html>
-        <html lang="ru">
-        <head>
-            <meta charset="UTF-8">
-            <title>Ошибка 404</title>
-            <style>
-                body {
-                    font-family: Arial, sans-serif;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    min-height: 100vh;
-                    margin: 0;
-                }
-                .error-container {
-                    background: white;
-                    padding: 40px;
-                    border-radius: 10px;
-                    text-align: center;
-                    box-shadow: 0 10px 40px rgba(0,0,0,0.2);
-                }
-                h1 { color: #c62828; font-size: 3em; margin: 0; }
-                p { color: #666; font-size: 1.2em; margin: 20px 0; }
-                a { color: #667eea; text-decoration: none; font-weight: 600; }
-                a:hover { text-decoration: underline; }
-            </style>
-        </head>
-        <body>
-            <div class="error-container">
-                <h1>404</h1>
-                <p>Страница не найдена</p>
-                <p><a href="/">← Вернуться на главную</a></p>
-            </div>
-        </body>
-        </html>
+        self._send_prebuilt(_NOT_FOUND_RESPONSE, 404)
+
+    def _send_static(self, page: str, status_code: int) -> None:
+        """Отправляет заранее отрендеренную страницу из _STATIC_PAGES.
+        
+        Если страницы еще не отрендерены (сервер запущен не через main()),
+        они рендерятся при первом обращении.
+        
+        Args:
+            page: Ключ страницы в _STATIC_PAGES ("/" или "/author").
+            status_code: HTTP статус код.
+        """
+        response = _STATIC_PAGES.get(page)
+        if response is None:
+            prerender_static_pages(self.app_config)
+            response = _STATIC_PAGES[page]
+        self._send_prebuilt(response, status_code)
+
+    def _send_prebuilt(self, response: bytes, status_code: int) -> None:
+        """Отправляет готовый ответ из _prebuilt_response одной записью.
+        
+        Статусная строка и заголовки Server/Date формируются теми же
+        методами, что и в send_response, но вместе с заготовленными
+        заголовками и телом уходят одним вызовом wfile.write.
+        
+        Args:
+            response: Результат _prebuilt_response.
+            status_code: HTTP статус код.
         """
-        self._send_response(error_html, 404)
+        self.log_request(status_code)
+        head = (
+            f"{self.protocol_version} {status_code} "
+            f"{self.responses[status_code][0]}\r\n"
+            f"Server: {self.version_string()}\r\n"
+            f"Date: {self.date_time_string()}\r\n"
+        ).encode("latin-1")
+        self.wfile.write(head + response)
+
+    def _send_cached(
+        self,
+        key: Tuple[str, Optional[int]],
+        version: int,
+        render: Callable[[], str],
+    ) -> None:
+        """Отправляет страницу, зависящую от данных, через кэш рендеринга.
+        
+        Пока data_version не изменилась, шаблон повторно не выполняется.
+        Версия передается в ETag; если клиент прислал тот же ETag
+        в If-None-Match, отправляется 304 без тела.
+        
+        Версию вызывающий код читает до того, как снимет данные для
+        render: тогда страница, собранная по устаревшему снимку,
+        не попадет в кэш и ETag под новой версией.
+        
+        Args:
+            key: Ключ страницы в _render_cache (путь, user_id или None).
+            version: Значение data_version, прочитанное до снимка данных.
+            render: Функция, рендерящая страницу при промахе кэша.
+        """
+        etag = f'W/"{_ETAG_PREFIX}-{version}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
 
-    def _send_response(self, content: str, status_code: int = 200) -> None:
-        """Отправляет HTTP ответ с HTML контентом.
+        cached = self._render_cache.get(key)
+        if cached is not None and cached[0] == version:
+            body = cached[1]
+        else:
+            body = render().encode("utf-8")
+            self._render_cache[key] = (version, body)
+        self._send_bytes(body, 200, etag)
+
+    def _send_bytes(
+        self,
+        body: bytes,
+        status_code: int = 200,
+        etag: Optional[str] = None,
+    ) -> None:
+        """Отправляет HTTP ответ с уже закодированным HTML.
         
         Args:
-            content: HTML содержимое ответа.
+            body: HTML содержимое ответа в UTF-8.
             status_code: HTTP статус код (по умолчанию 200).
+            etag: Значение заголовка ETag (не отправляется, если None).
         """
         self.send_response(status_code)
         self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.send_header("Content-Length", len(content.encode("utf-8")))
+        self.send_header("Content-Length", str(len(body)))
+        if etag is not None:
+            self.send_header("ETag", etag)
         self.end_headers()
-        self.wfile.write(content.encode("utf-8"))
+        self.wfile.write(body)
+
+    def _send_response(self, content: str, status_code: int = 200) -> None:
+        """Отправляет HTTP ответ с HTML контентом.
+        
+        Args:
+            content: HTML содержимое ответа.
+            status_code: HTTP статус код (по умолчанию 200).
+        """
+        # Кодируем один раз: те же байты дают Content-Length и тело ответа
+        self._send_bytes(content.encode("utf-8"), status_code)
 
     def _send_error_response(self, status_code: int, message: str) -> None:
         """Отправляет HTTP ошибку.
         
+        Сообщение экранируется, так как может содержать текст исключения.
+        
         Args:
             status_code: HTTP статус код ошибки.
             message: Сообщение об ошибке.
         """
-        error_html = f"""
-        <!DOCTYPE html>
-        <html lang="ru">
-        <head>
-            <meta charset="UTF-8">
-            <title>Ошибка {status_code}</title>
-            <style>
-                body {{
-                    font-family: Arial, sans-serif;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    min-height: 100vh;
-                    margin: 0;
-                }}
-                .error-container {{
-                    background: white;
-                    padding: 40px;
-                    border-radius: 10px;
-                    text-align: center;
-                    box-shadow: 0 10px 40px rgba(0,0,0,0.2);
-                }}
-                h1 {{ color: #c62828; font-size: 3em; margin: 0; }}
-                p {{ color: #666; font-size: 1.2em; margin: 20px 0; }}
-            </style>
-        </head>
-        <body>
-            <div class="error-container">
-                <h1>{status_code}</h1>
-                <p>{message}</p>
-            </div>
-        </body>
-        </html>
-        """
-        self._send_response(error_html, status_code)
+        head, after_title, after_code, tail = _ERROR_HTML_PARTS
+        code = str(status_code).encode("utf-8")
+        body = b"".join((
+            head, code, after_title, code, after_code,
+            html.escape(message).encode("utf-8"), tail,
+        ))
+        self._send_bytes(body, status_code)
 
     def log_message(self, format: str, *args: Any) -> None:
         """Переопределяет логирование для подавления вывода в консоль.
@@ -277,6 +471,124 @@ class CurrenciesServer(BaseHTTPRequestHandler):
         """
         pass  # Подавляем логирование
 
+    @classmethod
+    def _fetch_currencies_once(cls, seen_attempt: int) -> Optional[str]:
+        """Загружает валюты в кэш, если этого не сделал другой поток.
+        
+        Args:
+            seen_attempt: Значение currencies_fetch_attempt, прочитанное
+                до ожидания блокировки. Если за время ожидания другой
+                поток завершил загрузку с ошибкой, возвращается его ошибка.
+            
+        Returns:
+            Сообщение об ошибке загрузки или None при успехе.
+        """
+        with cls.currencies_cache_lock:
+            if cls.currencies_cache:
+                return None
+            if cls.currencies_fetch_attempt != seen_attempt:
+                # Пока поток ждал, загрузка уже была и завершилась ошибкой
+                return cls.currencies_fetch_error
+
+            try:
+                currencies_data = get_currencies()
+            except Exception as e:
+                # Счетчик меняется по завершении попытки: потоки, пришедшие
+                # во время нее, увидят новое значение и возьмут ошибку
+                cls.currencies_fetch_attempt += 1
+                cls.currencies_fetch_error = (
+                    f"Не удаётся получить данные о валютах: {str(e)}"
+                )
+                return cls.currencies_fetch_error
+
+            cls._store_currencies(currencies_data)
+            return None
+
+    @classmethod
+    def _store_currencies(cls, currencies_data: List[Dict[str, Any]]) -> None:
+        """Сохраняет загруженные валюты и пересчитывает индекс подписок.
+        
+        Вызывается под currencies_cache_lock. Индекс строится заранее,
+        после чего новые объекты публикуются присваиванием ссылок, так что
+        читатели без блокировки видят либо старые, либо новые данные
+        целиком. Присваивание выполняется атрибутам класса, а не
+        экземпляра: обработчик создается заново на каждый запрос.
+        
+        Args:
+            currencies_data: Список валют от get_currencies().
+        """
+        index = cls._build_user_currency_index(currencies_data)
+        cls.currencies_cache = currencies_data
+        cls.user_to_currencies = index
+        cls.currencies_fetch_error = None
+        cls.last_update = _now_str()
+        cls._bump_data_version()
+
+    @classmethod
+    def _rebuild_user_currency_index(cls) -> None:
+        """Пересчитывает индекс user_to_currencies по текущему кэшу.
+        
+        Вызывается после изменения пользователей, подписок или кэша валют.
+        """
+        cls.user_to_currencies = cls._build_user_currency_index(
+            cls.currencies_cache
+        )
+        cls._bump_data_version()
+
+    @classmethod
+    def _bump_data_version(cls) -> None:
+        """Отмечает изменение данных: меняет ETag и сбрасывает кэш страниц."""
+        cls.data_version += 1
+        cls._render_cache = {}
+
+    @classmethod
+    def _build_user_currency_index(
+        cls,
+        currencies: List[Dict[str, Any]],
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """Строит индекс user_id -> валюты пользователя.
+        
+        Подписки и список валют обходятся по одному разу, поэтому страница
+        пользователя получает свои валюты одним поиском в словаре вместо
+        двух просмотров списков на каждый запрос. Порядок валют
+        совпадает с порядком в currencies.
+        
+        Args:
+            currencies: Список валют в формате get_currencies().
+            
+        Returns:
+            Новый словарь индекса (существующий не изменяется).
+        """
+        subscribers: Dict[str, set] = {}
+        for uc in cls.user_currencies:
+            subscribers.setdefault(uc.currency_id, set()).add(uc.user_id)
+
+        index: Dict[int, List[Dict[str, Any]]] = {}
+        for currency in currencies:
+            for user_id in subscribers.get(currency["id"], ()):
+                index.setdefault(user_id, []).append(currency)
+        return index
+
+    @staticmethod
+    def _parse_id(query: str) -> Optional[int]:
+        """Извлекает целочисленный параметр id из query строки.
+        
+        Args:
+            query: Query строка без "?" (например, "id=3&x=1").
+            
+        Returns:
+            Значение первого параметра id или None, если его нет
+            или оно не является целым числом.
+        """
+        for param in query.split("&"):
+            name, _, value = param.partition("=")
+            if name == "id":
+                try:
+                    return int(value)
+                except ValueError:
+                    return None
+        return None
+
     @staticmethod
     def _get_query_param(
         query_params: Dict[str, List[str]],
@@ -321,6 +633,30 @@ class AppConfig:
         self.app = app
 
 
+def prerender_static_pages(config: AppConfig) -> None:
+    """Рендерит страницы, не зависящие от запроса, в _STATIC_PAGES.
+    
+    Главная страница и страница автора зависят только от конфигурации
+    приложения, поэтому шаблоны выполняются один раз, а обработчики
+    отдают готовые байты ответа вместе с заголовками.
+    
+    Args:
+        config: Конфигурация приложения.
+    """
+    context = {
+        "app_name": config.app.name,
+        "version": config.app.version,
+        "author_name": config.app.author.name,
+        "group": config.app.author.group,
+    }
+    _STATIC_PAGES["/"] = _prebuilt_response(
+        template_index.render(**context).encode("utf-8")
+    )
+    _STATIC_PAGES["/author"] = _prebuilt_response(
+        template_author.render(**context).encode("utf-8")
+    )
+
+
 def init_sample_data() -> None:
     """Инициализирует примеры данных для демонстрации.
     
@@ -355,6 +691,54 @@ def init_sample_data() -> None:
             UserCurrency(uc_id, user_id, currency_id)
         )
 
+    CurrenciesServer._rebuild_user_currency_index()
+
+
+def refresh_currencies() -> bool:
+    """Загружает свежие курсы валют и заменяет ими кэш сервера.
+    
+    Запрос к API выполняется без блокировки, поэтому обработчики
+    продолжают отдавать прежние данные, пока идет загрузка.
+    
+    Returns:
+        True, если кэш обновлен, иначе False (старые данные сохраняются).
+    """
+    try:
+        currencies_data = get_currencies()
+    except Exception as e:
+        print(f"Не удаётся обновить валюты: {e}")
+        return False
+
+    with CurrenciesServer.currencies_cache_lock:
+        CurrenciesServer._store_currencies(currencies_data)
+    return True
+
+
+def start_currencies_refresher(
+    interval: float = CURRENCIES_REFRESH_INTERVAL,
+) -> threading.Thread:
+    """Запускает фоновый поток, периодически обновляющий курсы валют.
+    
+    Загрузка валют выполняется вне обработки запросов, поэтому
+    время ответа /currencies не зависит от задержек API ЦБ РФ.
+    
+    Args:
+        interval: Период обновления в секундах.
+        
+    Returns:
+        Запущенный поток-демон.
+    """
+    def refresher() -> None:
+        while True:
+            time.sleep(interval)
+            refresh_currencies()
+
+    thread = threading.Thread(
+        target=refresher, name="currencies-refresher", daemon=True
+    )
+    thread.start()
+    return thread
+
 
 def main() -> None:
     """Главная функция для запуска сервера.
@@ -370,25 +754,22 @@ def main() -> None:
     # Создаём конфигурацию приложения и устанавливаем её в класс
     config = AppConfig(app)
     CurrenciesServer.app_config = config
+    prerender_static_pages(config)
 
     # Инициализируем примеры данных
     init_sample_data()
 
     # Загружаем валюты при старте (опционально)
-    try:
-        with CurrenciesServer.currencies_cache_lock:
-            currencies_data = get_currencies()
-            CurrenciesServer.currencies_cache = currencies_data
-            CurrenciesServer.last_update = datetime.now().strftime(
-                "%Y-%m-%d %H:%M:%S"
-            )
+    if refresh_currencies():
         print("Валюты успешно загружены")
-    except Exception as e:
-        print(f"Не удаётся загрузить валюты при старте: {e}")
 
-    # Создаём HTTP сервер
+    # Дальше курсы обновляются в фоне, а не во время запросов
+    start_currencies_refresher()
+
+    # Создаём HTTP сервер: каждый запрос обрабатывается в своём потоке,
+    # поэтому медленная загрузка валют не блокирует остальные страницы
     server_address = ("", 8000)
-    httpd = HTTPServer(server_address, CurrenciesServer)
+    httpd = ThreadingHTTPServer(server_address, CurrenciesServer)
 
 
     print(f"Сервер запущен на http://localhost:8000")
@@ -5,11 +5,64 @@
 """
 
 import xml.etree.ElementTree as ET
-from typing import List, Dict, Any
+from io import BytesIO
+from typing import List, Dict, Any, Tuple
 import urllib.request
 import urllib.error
 
 
+# Последний результат get_currencies() и его индекс по символьному коду
+# (в верхнем регистре). Хранятся одним кортежем и заменяются одним
+# присваиванием, чтобы другой поток не увидел новый список со старым индексом
+_by_code_index: Tuple[
+    List[Dict[str, Any]] | None, Dict[str, Dict[str, Any]]
+] = (None, {})
+
+
+def _parse_valute(valute: ET.Element) -> Dict[str, Any]:
+    """Преобразует элемент Valute из XML ЦБ РФ в словарь валюты.
+    
+    Args:
+        valute: Элемент Valute с дочерними элементами NumCode, CharCode,
+            Name, Value и Nominal.
+        
+    Returns:
+        Словарь валюты в формате get_currencies().
+        
+    Raises:
+        ValueError: Если не хватает полей или курс/номинал не являются числами.
+    """
+    # Дочерние элементы читаются за один проход вместо findtext на каждое поле
+    fields = {child.tag: child.text for child in valute}
+    valute_id = valute.get('ID')
+    num_code = fields.get('NumCode')
+    char_code = fields.get('CharCode')
+    name = fields.get('Name')
+    value = fields.get('Value')
+    nominal = fields.get('Nominal')
+    
+    # Проверяем наличие всех необходимых полей
+    if not all([valute_id, num_code, char_code, name, value, nominal]):
+        raise ValueError(f"Неполные данные для валюты {valute_id}")
+    
+    # Числа разбираются один раз при загрузке, а не при каждом
+    # использовании. ЦБ РФ использует запятую как разделитель
+    value_f = float(value.replace(',', '.'))
+    nominal_i = int(nominal)
+    if nominal_i <= 0:
+        raise ValueError(f"Некорректный номинал для валюты {valute_id}: {nominal}")
+    
+    return {
+        'id': valute_id,
+        'num_code': num_code,
+        'char_code': char_code,
+        'name': name,
+        'value': value_f,
+        'nominal': nominal_i,
+        'unit_value': value_f / nominal_i,
+    }
+
+
 def get_currencies() -> List[Dict[str, Any]]:
     """Получает список валют от Центрального банка РФ.
     
@@ -22,8 +75,9 @@ def get_currencies() -> List[Dict[str, Any]]:
         - 'num_code': цифровой код (NumCode)
         - 'char_code': символьный код (CharCode)
         - 'name': название валюты (Name)
-        - 'value': текущий курс (Value)
-        - 'nominal': номинал (Nominal)
+        - 'value': текущий курс (Value), float
+        - 'nominal': номинал (Nominal), int
+        - 'unit_value': курс за одну единицу валюты (value / nominal), float
         
     Raises:
         urllib.error.URLError: Если не удаётся подключиться к API.
@@ -40,17 +94,9 @@ def get_currencies() -> List[Dict[str, Any]]:
     
     try:
         with urllib.request.urlopen(url, timeout=10) as response:
+            # Байты передаются парсеру без декодирования: кодировку
+            # (windows-1251 у ЦБ РФ) он берёт из XML-декларации
             xml_bytes = response.read()
-            # Пытаемся декодировать с разными кодировками
-            for encoding in ['windows-1251', 'utf-8', 'cp1251', 'iso-8859-5']:
-                try:
-                    xml_data = xml_bytes.decode(encoding)
-                    break
-                except (UnicodeDecodeError, AttributeError):
-                    continue
-            else:
-                # Если ничего не подошло, используем utf-8 с игнорированием ошибок
-                xml_data = xml_bytes.decode('utf-8', errors='ignore')
     except urllib.error.URLError as e:
         raise urllib.error.URLError(f"Не удаётся подключиться к API валют: {e}") from e
     except urllib.error.HTTPError as e:
@@ -62,44 +108,35 @@ def get_currencies() -> List[Dict[str, Any]]:
             e.fp,
         ) from e
     
+    currencies = []
+    
+    # Потоковый разбор: каждый элемент Valute обрабатывается сразу
+    # после закрывающего тега и очищается, дерево целиком не хранится
     try:
-        root = ET.fromstring(xml_data)
+        for _, elem in ET.iterparse(BytesIO(xml_bytes), events=('end',)):
+            if elem.tag != 'Valute':
+                continue
+            try:
+                currencies.append(_parse_valute(elem))
+            except (AttributeError, ValueError) as e:
+                # Логируем ошибку для конкретной валюты и продолжаем обработку
+                print(f"Предупреждение: Не удаётся обработать валюту {elem.get('ID')}: {e}")
+            finally:
+                elem.clear()
     except ET.ParseError as e:
         raise ET.ParseError(f"Ошибка при разборе XML: {e}") from e
     
-    currencies = []
-    
-    # Ищем все элементы Valute в XML
-    for valute in root.findall('Valute'):
-        try:
-            # Извлекаем данные из элементов
-            valute_id = valute.get('ID')
-            num_code = valute.findtext('NumCode')
-            char_code = valute.findtext('CharCode')
-            name = valute.findtext('Name')
-            value = valute.findtext('Value')
-            nominal = valute.findtext('Nominal')
-            
-            # Проверяем наличие всех необходимых полей
-            if not all([valute_id, num_code, char_code, name, value, nominal]):
-                raise ValueError(f"Неполные данные для валюты {valute_id}")
-            
-            currencies.append({
-                'id': valute_id,
-                'num_code': num_code,
-                'char_code': char_code,
-                'name': name,
-                'value': value,
-                'nominal': nominal,
-            })
-        except (AttributeError, ValueError) as e:
-            # Логируем ошибку для конкретной валюты и продолжаем обработку
-            print(f"Предупреждение: Не удаётся обработать валюту {valute.get('ID')}: {e}")
-            continue
-    
     if not currencies:
         raise ValueError("В полученном XML не найдены валюты")
     
+    # Индекс по коду строится один раз на загрузку; при совпадающих
+    # кодах остается первая валюта, как при линейном поиске
+    global _by_code_index
+    by_code: Dict[str, Dict[str, Any]] = {}
+    for currency in currencies:
+        by_code.setdefault(currency['char_code'].upper(), currency)
+    _by_code_index = (currencies, by_code)
+    
     return currencies
 
 
@@ -112,6 +149,8 @@ def get_currencies_by_code(
     Args:
         code: Символьный код валюты (например, 'USD', 'EUR').
         currencies: Список валют. Если None, будет выполнен запрос к API.
+            Для списка, возвращенного get_currencies(), поиск выполняется
+            по индексу, поэтому изменять такой список не следует.
         
     Returns:
         Словарь с информацией о валюте или None, если валюта не найдена.
@@ -130,6 +169,12 @@ def get_currencies_by_code(
     
     code_upper = code.upper()
     
+    # Для списка, полученного из get_currencies(), есть готовый индекс;
+    # кортеж читается один раз, поэтому список и индекс согласованы
+    source, by_code = _by_code_index
+    if currencies is source:
+        return by_code.get(code_upper)
+    
     for currency in currencies:
         if currency['char_code'].upper() == code_upper:
             return currency
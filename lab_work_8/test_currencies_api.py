@@ -59,9 +59,57 @@ class TestGetCurrencies(unittest.TestCase):
         # Проверяем результат
         self.assertEqual(len(currencies), 2)
         self.assertEqual(currencies[0]['char_code'], 'USD')
-        self.assertEqual(currencies[0]['value'], '75.5')
+        self.assertEqual(currencies[0]['value'], 75.5)
+        self.assertEqual(currencies[0]['nominal'], 1)
         self.assertEqual(currencies[1]['char_code'], 'EUR')
 
+    @patch('urllib.request.urlopen')
+    def test_get_currencies_comma_decimal(self, mock_urlopen) -> None:
+        """Тест разбора курса с запятой и номинала в числа."""
+        xml = self.valid_xml.replace('<Value>75.5</Value>', '<Value>75,5</Value>')
+        xml = xml.replace('<Nominal>1</Nominal>', '<Nominal>100</Nominal>', 1)
+        mock_response = MagicMock()
+        mock_response.read.return_value = xml.encode('utf-8')
+        mock_response.__enter__.return_value = mock_response
+        mock_response.__exit__.return_value = False
+        mock_urlopen.return_value = mock_response
+
+        currencies = get_currencies()
+
+        self.assertEqual(currencies[0]['value'], 75.5)
+        self.assertEqual(currencies[0]['nominal'], 100)
+        self.assertAlmostEqual(currencies[0]['unit_value'], 0.755)
+
+    @patch('urllib.request.urlopen')
+    def test_get_currencies_windows_1251(self, mock_urlopen) -> None:
+        """Тест что кодировка берётся из XML-декларации."""
+        xml = self.valid_xml.replace('encoding="UTF-8"', 'encoding="windows-1251"')
+        mock_response = MagicMock()
+        mock_response.read.return_value = xml.encode('windows-1251')
+        mock_response.__enter__.return_value = mock_response
+        mock_response.__exit__.return_value = False
+        mock_urlopen.return_value = mock_response
+
+        currencies = get_currencies()
+
+        self.assertEqual(currencies[0]['name'], 'Доллар США')
+        self.assertEqual(currencies[1]['name'], 'Евро')
+
+    @patch('urllib.request.urlopen')
+    def test_get_currencies_by_code_uses_index(self, mock_urlopen) -> None:
+        """Тест поиска по индексу для списка из get_currencies."""
+        mock_response = MagicMock()
+        mock_response.read.return_value = self.valid_xml.encode('utf-8')
+        mock_response.__enter__.return_value = mock_response
+        mock_response.__exit__.return_value = False
+        mock_urlopen.return_value = mock_response
+
+        currencies = get_currencies()
+
+        self.assertIs(get_currencies_by_code('eur', currencies), currencies[1])
+        self.assertIsNone(get_currencies_by_code('GBP', currencies))
+        self.assertEqual(mock_urlopen.call_count, 1)
+
     @patch('urllib.request.urlopen')
     def test_get_currencies_url_error(self, mock_urlopen) -> None:
         """Тест обработки ошибки подключения."""
@@ -114,7 +162,7 @@ class TestGetCurrencies(unittest.TestCase):
         currencies = get_currencies()
 
         # Проверяем, что все необходимые поля присутствуют
-        required_fields = ['id', 'num_code', 'char_code', 'name', 'value', 'nominal']
+        required_fields = ['id', 'num_code', 'char_code', 'name', 'value', 'nominal', 'unit_value']
         for currency in currencies:
             for field in required_fields:
                 self.assertIn(field, currency)
@@ -131,16 +179,16 @@ class TestGetCurrenciesByCode(unittest.TestCase):
                 'num_code': '840',
                 'char_code': 'USD',
                 'name': 'Доллар США',
-                'value': '75.5',
-                'nominal': '1',
+                'value': 75.5,
+                'nominal': 1,
             },
             {
                 'id': 'R01239',
                 'num_code': '978',
                 'char_code': 'EUR',
                 'name': 'Евро',
-                'value': '82.3',
-                'nominal': '1',
+                'value': 82.3,
+                'nominal': 1,
             },
         ]
 
@@ -8,11 +8,17 @@ from unittest.mock import patch, MagicMock
 from io import BytesIO
 import sys
 import os
+import threading
+import time
+from datetime import datetime
 
 # Добавляем путь для импортов
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from myapp.myapp import CurrenciesServer, AppConfig, init_sample_data
+from myapp.myapp import (
+    CurrenciesServer, AppConfig, init_sample_data, prerender_static_pages,
+    refresh_currencies, _now_str, _ETAG_PREFIX,
+)
 from myapp.models import Author, App, User, Currency, UserCurrency
 
 
@@ -25,6 +31,7 @@ class TestCurrenciesServer(unittest.TestCase):
         author = Author(name="Тест Тестов", group="TEST")
         app = App(name="TestApp", version="1.0.0", author=author)
         CurrenciesServer.app_config = AppConfig(app)
+        prerender_static_pages(CurrenciesServer.app_config)
 
         # Инициализируем примеры данных
         init_sample_data()
@@ -36,18 +43,40 @@ class TestCurrenciesServer(unittest.TestCase):
                 'num_code': '840',
                 'char_code': 'USD',
                 'name': 'Доллар США',
-                'value': '75.5',
-                'nominal': '1',
+                'value': 75.5,
+                'nominal': 1,
+                'unit_value': 75.5,
             },
             {
                 'id': 'R01239',
                 'num_code': '978',
                 'char_code': 'EUR',
                 'name': 'Евро',
-                'value': '82.3',
-                'nominal': '1',
+                'value': 82.3,
+                'nominal': 1,
+                'unit_value': 82.3,
             },
         ]
+        CurrenciesServer._rebuild_user_currency_index()
+
+    def _get(self, path: str, headers: dict = None) -> bytes:
+        """Выполняет GET запрос к обработчику без сокета.
+        
+        Args:
+            path: Путь запроса вместе с query строкой.
+            headers: Заголовки запроса.
+            
+        Returns:
+            Полный HTTP ответ (заголовки и тело).
+        """
+        handler = CurrenciesServer.__new__(CurrenciesServer)
+        handler.path = path
+        handler.request_version = "HTTP/1.1"
+        handler.requestline = f"GET {path} HTTP/1.1"
+        handler.headers = headers or {}
+        handler.wfile = BytesIO()
+        handler.do_GET()
+        return handler.wfile.getvalue()
 
     def test_server_has_app_config(self) -> None:
         """Тест что сервер имеет конфигурацию приложения."""
@@ -66,6 +95,171 @@ class TestCurrenciesServer(unittest.TestCase):
         """Тест что сервер имеет кэш валют."""
         self.assertEqual(len(CurrenciesServer.currencies_cache), 2)
 
+    def test_static_pages_prerendered(self) -> None:
+        """Тест что главная страница и страница автора отдаются готовыми."""
+        for path in ("/", "/author"):
+            response = self._get(path)
+            self.assertTrue(response.startswith(b"HTTP/1.0 200"))
+            self.assertIn("TestApp".encode("utf-8"), response)
+
+    def test_user_detail_page(self) -> None:
+        """Тест страницы пользователя с его валютами."""
+        response = self._get("/user?id=1")
+        self.assertTrue(response.startswith(b"HTTP/1.0 200"))
+        self.assertIn(b"USD", response)
+        self.assertIn(b"EUR", response)
+
+    def test_currencies_fetched_once_concurrently(self) -> None:
+        """Тест что при пустом кэше валюты загружает только один поток."""
+        cached = CurrenciesServer.currencies_cache
+        CurrenciesServer.currencies_cache = []
+
+        def slow_fetch():
+            time.sleep(0.05)
+            return cached
+
+        with patch('myapp.myapp.get_currencies', side_effect=slow_fetch) as mock_fetch:
+            threads = [
+                threading.Thread(target=self._get, args=("/currencies",))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(mock_fetch.call_count, 1)
+        self.assertIs(CurrenciesServer.currencies_cache, cached)
+
+    def test_currencies_fetch_error_shared(self) -> None:
+        """Тест что ждавшие потоки не повторяют неудачную загрузку."""
+        CurrenciesServer.currencies_cache = []
+
+        def failing_fetch():
+            time.sleep(0.05)
+            raise ConnectionError("API недоступен")
+
+        responses = []
+        with patch('myapp.myapp.get_currencies', side_effect=failing_fetch) as mock_fetch:
+            threads = [
+                threading.Thread(
+                    target=lambda: responses.append(self._get("/currencies"))
+                )
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(mock_fetch.call_count, 1)
+        for response in responses:
+            self.assertIn("API недоступен".encode("utf-8"), response)
+
+    def test_refresh_currencies(self) -> None:
+        """Тест фонового обновления кэша валют и индекса подписок."""
+        fresh = [dict(c, value=90.0) for c in CurrenciesServer.currencies_cache]
+        with patch('myapp.myapp.get_currencies', return_value=fresh):
+            self.assertTrue(refresh_currencies())
+
+        self.assertIs(CurrenciesServer.currencies_cache, fresh)
+        self.assertEqual(CurrenciesServer.user_to_currencies[1][0]['value'], 90.0)
+
+    def test_refresh_currencies_keeps_cache_on_error(self) -> None:
+        """Тест что ошибка обновления не очищает кэш."""
+        cached = CurrenciesServer.currencies_cache
+        with patch('myapp.myapp.get_currencies', side_effect=ConnectionError):
+            self.assertFalse(refresh_currencies())
+
+        self.assertIs(CurrenciesServer.currencies_cache, cached)
+
+    def test_error_response(self) -> None:
+        """Тест страницы 500 с экранированным сообщением об ошибке."""
+        with patch.object(
+            CurrenciesServer, '_handle_users', side_effect=ValueError("<b>сбой</b>")
+        ):
+            response = self._get("/users")
+
+        self.assertTrue(response.startswith(b"HTTP/1.0 500"))
+        self.assertIn(b"<h1>500</h1>", response)
+        self.assertIn("&lt;b&gt;сбой&lt;/b&gt;".encode("utf-8"), response)
+
+    def test_now_str_format(self) -> None:
+        """Тест формата времени последнего обновления."""
+        fixed = datetime(2024, 3, 5, 7, 8, 9)
+        with patch('myapp.myapp.datetime') as mock_datetime:
+            mock_datetime.now.return_value = fixed
+            self.assertEqual(_now_str(), fixed.strftime("%Y-%m-%d %H:%M:%S"))
+
+    def test_render_cache_reused_until_data_changes(self) -> None:
+        """Тест что страница не рендерится заново при неизменных данных."""
+        self._get("/users")
+        with patch('myapp.myapp.template_users') as mock_template:
+            self._get("/users")
+            mock_template.render.assert_not_called()
+
+            CurrenciesServer._rebuild_user_currency_index()
+            mock_template.render.return_value = "<p>new</p>"
+            self.assertTrue(self._get("/users").endswith(b"<p>new</p>"))
+            mock_template.render.assert_called_once()
+
+    def test_render_cache_keeps_version_of_snapshot(self) -> None:
+        """Тест что данные, измененные после снимка, не теряются."""
+        version = CurrenciesServer.data_version
+
+        class ChangingIndex(dict):
+            """Индекс, данные которого меняются сразу после чтения."""
+
+            def get(self, *args):
+                value = super().get(*args)
+                CurrenciesServer._bump_data_version()
+                return value
+
+        CurrenciesServer.user_to_currencies = ChangingIndex(
+            CurrenciesServer.user_to_currencies
+        )
+        response = self._get("/user?id=1")
+        self.assertIn(f'ETag: W/"{_ETAG_PREFIX}-{version}"'.encode(), response)
+
+        CurrenciesServer.user_to_currencies = {}
+        with patch('myapp.myapp.template_user_detail') as mock_template:
+            mock_template.render.return_value = "<p>new</p>"
+            self.assertTrue(self._get("/user?id=1").endswith(b"<p>new</p>"))
+            mock_template.render.assert_called_once()
+
+    def test_etag_not_modified(self) -> None:
+        """Тест ответа 304 при совпадении ETag."""
+        response = self._get("/currencies")
+        etag = next(
+            line.split(b": ", 1)[1].decode()
+            for line in response.split(b"\r\n")
+            if line.startswith(b"ETag: ")
+        )
+
+        response = self._get("/currencies", {"If-None-Match": etag})
+        self.assertTrue(response.startswith(b"HTTP/1.0 304"))
+        self.assertTrue(response.endswith(b"\r\n\r\n"))
+
+        CurrenciesServer._rebuild_user_currency_index()
+        response = self._get("/currencies", {"If-None-Match": etag})
+        self.assertTrue(response.startswith(b"HTTP/1.0 200"))
+
+    def test_not_found_page(self) -> None:
+        """Тест страницы 404 для неизвестного маршрута."""
+        response = self._get("/missing")
+        self.assertTrue(response.startswith(b"HTTP/1.0 404 Not Found\r\n"))
+        self.assertIn("Страница не найдена".encode("utf-8"), response)
+
+    def test_static_response_headers(self) -> None:
+        """Тест заголовков готового ответа статической страницы."""
+        response = self._get("/author")
+        head, body = response.split(b"\r\n\r\n", 1)
+        lines = head.split(b"\r\n")
+
+        self.assertEqual(lines[0], b"HTTP/1.0 200 OK")
+        self.assertIn(f"Content-Length: {len(body)}".encode(), lines)
+        self.assertTrue(any(line.startswith(b"Date: ") for line in lines))
+
     def test_get_query_param_string(self) -> None:
         """Тест извлечения строкового параметра."""
         query_params = {'id': ['123']}
@@ -91,6 +285,14 @@ class TestCurrenciesServer(unittest.TestCase):
         result = CurrenciesServer._get_query_param(query_params, 'id', int)
         self.assertIsNone(result)
 
+    def test_parse_id(self) -> None:
+        """Тест разбора параметра id из query строки."""
+        self.assertEqual(CurrenciesServer._parse_id("id=3"), 3)
+        self.assertEqual(CurrenciesServer._parse_id("x=1&id=42"), 42)
+        self.assertIsNone(CurrenciesServer._parse_id("uid=3"))
+        self.assertIsNone(CurrenciesServer._parse_id("id=abc"))
+        self.assertIsNone(CurrenciesServer._parse_id(""))
+
     def test_user_exists(self) -> None:
         """Тест что пользователь существует."""
         self.assertIn(1, CurrenciesServer.users)
@@ -133,18 +335,12 @@ class TestCurrenciesServer(unittest.TestCase):
     def test_get_user_currencies_data(self) -> None:
         """Тест получения данных валют для пользователя."""
         user_id = 1
-        user_currency_ids = [
-            uc.currency_id
-            for uc in CurrenciesServer.user_currencies
-            if uc.user_id == user_id
-        ]
+        user_currencies = CurrenciesServer.user_to_currencies[user_id]
         
-        user_currencies = [
-            c for c in CurrenciesServer.currencies_cache
-            if c["id"] in user_currency_ids
-        ]
-        
-        self.assertGreater(len(user_currencies), 0)
+        # Пользователь 1 подписан на USD и EUR, порядок как в кэше
+        self.assertEqual(
+            [c['char_code'] for c in user_currencies], ['USD', 'EUR']
+        )
         # Проверяем что получены валюты из кэша
         for currency in user_currencies:
             self.assertIn('char_code', currency)
@@ -5,7 +5,8 @@
 между контроллером базы данных и рендерером представлений.
 """
 
-from typing import List, Dict, Any, Optional
+import sqlite3
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Tuple
 from myapp.controllers.database_controller import CurrencyRatesCRUD
 
 
@@ -27,11 +28,11 @@ class CurrencyController:
         """
         self.db: CurrencyRatesCRUD = db_controller
 
-    def list_currencies(self) -> List[Dict[str, Any]]:
+    def list_currencies(self) -> List[sqlite3.Row]:
         """Получает все валюты из базы данных.
         
         Returns:
-            Список словарей валют с ключами: id, num_code, char_code,
+            Список строк валют (sqlite3.Row) с ключами: id, num_code, char_code,
             name, value, nominal.
         
         Raises:
@@ -53,6 +54,23 @@ class CurrencyController:
         """
         return self.db.read_currency(currency_id)
 
+    def get_currencies_by_ids(
+        self,
+        ids: Sequence[int]
+    ) -> Dict[int, Dict[str, Any]]:
+        """Получает несколько валют по списку ID одним запросом.
+        
+        Args:
+            ids: ID валют для получения.
+        
+        Returns:
+            Словарь {id: словарь валюты}; ненайденные ID пропускаются.
+        
+        Raises:
+            Exception: Если при запросе к базе данных произошла ошибка.
+        """
+        return self.db.read_currencies_by_ids(ids)
+
     def get_currency_by_code(self, char_code: str) -> Optional[Dict[str, Any]]:
         """Получает валюту по символьному коду.
         
@@ -92,6 +110,43 @@ class CurrencyController:
         """
         return self.db.create_currency(num_code, char_code, name, value, nominal)
 
+    def add_currencies_bulk(
+        self,
+        rows: Iterable[Tuple[str, str, str, float, int]]
+    ) -> int:
+        """Создаёт несколько валют одним пакетом.
+        
+        Args:
+            rows: Кортежи (num_code, char_code, name, value, nominal).
+        
+        Returns:
+            Количество добавленных валют.
+        
+        Raises:
+            Exception: Если операция с базой данных завершилась ошибкой.
+        """
+        return self.db.create_currencies_bulk(rows)
+
+    def refresh_rates(
+        self,
+        rows: Iterable[Tuple[str, str, str, float, int]]
+    ) -> int:
+        """Обновляет курсы валют из свежей выгрузки (например, ЦБ РФ).
+        
+        Отсутствующие в базе валюты добавляются, у существующих
+        обновляются курс и номинал — одним пакетным запросом.
+        
+        Args:
+            rows: Кортежи (num_code, char_code, name, value, nominal).
+        
+        Returns:
+            Количество добавленных или обновлённых валют.
+        
+        Raises:
+            Exception: Если операция с базой данных завершилась ошибкой.
+        """
+        return self.db.upsert_currency_rates(rows)
+
     def update_currency(self, currency_id: int, **kwargs: Any) -> bool:
         """Обновляет запись о валюте.
         
@@ -114,7 +169,8 @@ class CurrencyController:
     def update_currency_value(self, currency_id: int, new_value: float) -> bool:
         """Обновляет значение курса валюты.
         
-        Удобный метод для обновления только поля value.
+        Удобный метод для обновления только поля value: выполняет
+        заранее заданный UPDATE без сборки SQL из аргументов.
         
         Args:
             currency_id: ID валюты.
@@ -126,7 +182,7 @@ class CurrencyController:
         Raises:
             Exception: Если операция с базой данных завершилась ошибкой.
         """
-        return self.update_currency(currency_id, value=new_value)
+        return self.db.update_value(currency_id, new_value)
 
     def update_currency_value_by_code(
         self,
@@ -135,6 +191,9 @@ class CurrencyController:
     ) -> bool:
         """Обновляет курс по символьному коду.
         
+        Выполняется одним UPDATE ... WHERE char_code = ? без
+        предварительного поиска валюты.
+        
         Args:
             char_code: Символьный код валюты (например, "USD").
             new_value: Новое значение курса.
@@ -145,10 +204,7 @@ class CurrencyController:
         Raises:
             Exception: Если операция с базой данных завершилась ошибкой.
         """
-        currency = self.get_currency_by_code(char_code)
-        if not currency:
-            return False
-        return self.update_currency_value(currency['id'], new_value)
+        return self.db.update_value_by_code(char_code, new_value)
 
     def delete_currency(self, currency_id: int) -> bool:
         """Удаляет валюту из базы данных.
@@ -168,11 +224,11 @@ class CurrencyController:
 
     # ============= USER MANAGEMENT =============
     
-    def list_users(self) -> List[Dict[str, Any]]:
+    def list_users(self) -> List[sqlite3.Row]:
         """Получает всех пользователей из базы данных.
         
         Returns:
-            Список словарей пользователей с ключами: id, name.
+            Список строк пользователей (sqlite3.Row) с ключами: id, name.
         
         Raises:
             Exception: Если запрос к базе данных завершился ошибкой.
@@ -255,20 +311,46 @@ class CurrencyController:
         """
         return self.db.create_user_currency(user_id, currency_id)
 
-    def get_user_currencies(self, user_id: int) -> List[Dict[str, Any]]:
+    def subscribe_many(self, pairs: Iterable[Tuple[int, int]]) -> int:
+        """Подписывает пользователей на валюты одним пакетом.
+        
+        Args:
+            pairs: Пары (user_id, currency_id).
+        
+        Returns:
+            Количество созданных подписок.
+        
+        Raises:
+            Exception: Если операция с базой данных завершилась ошибкой
+                (пакет в этом случае не сохраняется целиком).
+        """
+        return self.db.subscribe_many(pairs)
+
+    def get_user_currencies(self, user_id: int) -> List[sqlite3.Row]:
         """Получает все валюты, на которые подписан пользователь.
         
         Args:
             user_id: ID пользователя.
         
         Returns:
-            Список словарей валют.
+            Список строк валют (sqlite3.Row).
         
         Raises:
             Exception: Если при запросе к базе данных произошла ошибка.
         """
         return self.db.read_user_currencies(user_id)
 
+    def get_subscriptions_grouped_by_user(self) -> Dict[int, List[Dict[str, Any]]]:
+        """Получает валюты всех пользователей, сгруппированные по user_id.
+        
+        Returns:
+            Словарь {user_id: список словарей валют}.
+        
+        Raises:
+            Exception: Если при запросе к базе данных произошла ошибка.
+        """
+        return self.db.read_all_subscriptions_expanded()
+
     def unsubscribe_user_from_currency(
         self,
         user_id: int,
@@ -288,13 +370,14 @@ class CurrencyController:
         """
         return self.db.delete_user_currency(user_id, currency_id)
 
-    def get_all_subscriptions(self) -> List[Dict[str, Any]]:
-        """Получает все подписки пользователей.
+    def get_all_subscriptions(self) -> List[sqlite3.Row]:
+        """Получает все подписки пользователей вместе с данными валют.
         
         Returns:
-            Список словарей подписок с ключами: id, user_id, currency_id.
+            Список строк подписок (sqlite3.Row) с ключами: subscription_id,
+            user_id, id (ID валюты), num_code, char_code, name, value, nominal.
         
         Raises:
             Exception: Если при запросе к базе данных произошла ошибка.
         """
-        return self.db.read_all_user_currencies()
+        return self.db.read_all_subscriptions()
@@ -13,8 +13,116 @@
     - Параметризованные запросы: Используйте ? или :name для предотвращения SQL-инъекций
 """
 
+import queue
 import sqlite3
-from typing import List, Dict, Any, Optional, Tuple
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Sequence, Set, Tuple
+
+try:
+    # numpy нужен только для read_currencies_array
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Настройки соединения, применяемые при открытии базы:
+# - foreign_keys: без него SQLite не проверяет внешние ключи
+#   и не выполняет ON DELETE CASCADE
+# - synchronous=NORMAL: в режиме WAL fsync выполняется при контрольной
+#   точке, а не при каждом COMMIT
+# - busy_timeout: ждать освобождения блокировки до 5 с вместо
+#   немедленной ошибки "database is locked"
+# - cache_size (64 МиБ), temp_store, mmap_size: кэш страниц, временные
+#   таблицы в памяти и чтение файла базы через mmap (256 МиБ)
+_PRAGMAS: Tuple[str, ...] = (
+    'PRAGMA foreign_keys = ON',
+    'PRAGMA synchronous = NORMAL',
+    'PRAGMA busy_timeout = 5000',
+    'PRAGMA cache_size = -65536',
+    'PRAGMA temp_store = MEMORY',
+    'PRAGMA mmap_size = 268435456',
+)
+
+# Сколько валют держать в кэше read_currency / read_currency_by_char_code
+_CURRENCY_CACHE_SIZE: int = 256
+
+# Тексты запросов вынесены в константы: одна и та же строка при каждом
+# вызове находит уже подготовленный оператор в кэше соединения
+# (cached_statements) вместо повторного разбора SQL
+# Явные списки колонок вместо SELECT *: результат не расширяется молча
+# при добавлении колонки, а планировщик может выбрать покрывающий индекс
+_CURRENCY_COLUMNS: str = 'id, num_code, char_code, name, value, nominal'
+_CURRENCY_COLUMNS_C: str = (
+    'c.id, c.num_code, c.char_code, c.name, c.value, c.nominal'
+)
+_USER_COLUMNS: str = 'id, name'
+
+_SQL_INSERT_CURRENCY: str = (
+    'INSERT INTO currency (num_code, char_code, name, value, nominal) '
+    'VALUES (?, ?, ?, ?, ?)'
+)
+# Пакетное обновление курсов: новая валюта вставляется, у существующей
+# (конфликт по уникальному индексу char_code) обновляются курс и номинал
+_SQL_UPSERT_CURRENCY: str = (
+    _SQL_INSERT_CURRENCY + ' '
+    'ON CONFLICT(char_code) DO UPDATE SET '
+    'value = excluded.value, nominal = excluded.nominal'
+)
+_SQL_SELECT_CURRENCIES: str = f'SELECT {_CURRENCY_COLUMNS} FROM currency'
+_SQL_SELECT_CURRENCY: str = _SQL_SELECT_CURRENCIES + ' WHERE id = ?'
+_SQL_SELECT_CURRENCY_BY_CODE: str = _SQL_SELECT_CURRENCIES + ' WHERE char_code = ?'
+# Курс и номинал в схеме допускают NULL; такие строки в массив не попадают
+_SQL_SELECT_CURRENCY_RATES: str = (
+    'SELECT id, value, nominal FROM currency '
+    'WHERE value IS NOT NULL AND nominal IS NOT NULL'
+)
+# Число плейсхолдеров в IN (...) подставляется при вызове
+_SQL_SELECT_CURRENCIES_BY_IDS: str = _SQL_SELECT_CURRENCIES + ' WHERE id IN ({})'
+# UPDATE и DELETE возвращают по строке на изменённую запись (RETURNING 1,
+# SQLite 3.35+), поэтому факт изменения проверяется через fetchone()
+_SQL_UPDATE_VALUE: str = 'UPDATE currency SET value = ? WHERE id = ? RETURNING 1'
+_SQL_UPDATE_VALUE_BY_CODE: str = (
+    'UPDATE currency SET value = ? WHERE char_code = ? RETURNING id'
+)
+_SQL_DELETE_CURRENCY: str = 'DELETE FROM currency WHERE id = ? RETURNING 1'
+_SQL_INSERT_USER: str = 'INSERT INTO user (name) VALUES (?)'
+_SQL_SELECT_USERS: str = f'SELECT {_USER_COLUMNS} FROM user'
+_SQL_SELECT_USER: str = _SQL_SELECT_USERS + ' WHERE id = ?'
+_SQL_UPDATE_USER: str = 'UPDATE user SET name = ? WHERE id = ? RETURNING 1'
+_SQL_DELETE_USER: str = 'DELETE FROM user WHERE id = ? RETURNING 1'
+_SQL_INSERT_USER_CURRENCY: str = (
+    'INSERT INTO user_currency (user_id, currency_id) VALUES (?, ?)'
+)
+_SQL_SELECT_USER_CURRENCIES: str = f'''
+    SELECT {_CURRENCY_COLUMNS_C}
+    FROM currency c
+    INNER JOIN user_currency uc ON c.id = uc.currency_id
+    WHERE uc.user_id = ?
+'''
+_SQL_SELECT_ALL_SUBSCRIPTIONS: str = f'''
+    SELECT uc.id AS subscription_id, uc.user_id, {_CURRENCY_COLUMNS_C}
+    FROM user_currency uc
+    INNER JOIN currency c ON c.id = uc.currency_id
+    ORDER BY uc.id
+'''
+_SQL_SELECT_SUBSCRIPTIONS_EXPANDED: str = f'''
+    SELECT uc.user_id, {_CURRENCY_COLUMNS_C}
+    FROM currency c
+    INNER JOIN user_currency uc ON c.id = uc.currency_id
+    ORDER BY uc.user_id
+'''
+_SQL_DELETE_USER_CURRENCY: str = (
+    'DELETE FROM user_currency WHERE user_id = ? AND currency_id = ? '
+    'RETURNING 1'
+)
+_SQL_DELETE_USER_CURRENCY_BY_ID: str = (
+    'DELETE FROM user_currency WHERE id = ? RETURNING 1'
+)
 
 
 class CurrencyRatesCRUD:
@@ -27,9 +135,13 @@ class CurrencyRatesCRUD:
     
     Использует SQLite с базой данных в памяти (:memory:) для хранения данных.
     Все операции используют параметризованные запросы для безопасности.
+    
+    Списочные методы чтения возвращают строки sqlite3.Row без копирования
+    в dict: они поддерживают доступ row['name'] и row[0], а шаблоны Jinja2
+    обращаются к ним как currency.name. Для настоящего dict используйте dict(row).
     """
 
-    def __init__(self, db_path: str = ':memory:') -> None:
+    def __init__(self, db_path: str = ':memory:', readers: int = 4) -> None:
         """Инициализирует соединение с базой данных и создаёт таблицы.
         
         Создаёт следующие таблицы:
@@ -37,16 +149,243 @@ class CurrencyRatesCRUD:
         - currency: Хранит данные о валютах
         - user_currency: Связь "многие ко многим" между пользователями и валютами
         
+        Все изменения выполняются через одно соединение-писатель (conn).
+        Для файловой базы дополнительно открывается пул из readers
+        соединений только для чтения: в режиме WAL они читают параллельно
+        друг с другом и с писателем. Для ':memory:' пул не создаётся —
+        каждое новое соединение видело бы свою отдельную пустую базу,
+        поэтому чтение идёт через писателя.
+        
         Args:
             db_path: Путь к файлу базы данных или ':memory:' для базы в памяти.
                     По умолчанию ':memory:' для целей тестирования.
+            readers: Размер пула соединений для чтения (для файловой базы).
         
         Raises:
             sqlite3.Error: Если инициализация базы данных не удалась.
         """
-        self.conn: sqlite3.Connection = sqlite3.connect(db_path)
+        # isolation_level=None: модуль sqlite3 не открывает транзакции
+        # неявно, границы транзакций задаёт transaction()
+        self.conn: sqlite3.Connection = sqlite3.connect(
+            db_path, isolation_level=None, cached_statements=256
+        )
         self.conn.row_factory = sqlite3.Row  # Включаем доступ к колонкам по имени
+        # Один курсор писателя вместо нового объекта на каждый вызов.
+        # Писатель рассчитан на использование из одного потока (сервер
+        # однопоточный, sqlite3 проверяет это через check_same_thread);
+        # из других потоков безопасно только чтение через пул
+        self._cur: sqlite3.Cursor = self.conn.cursor()
+        # LRU-кэш строк валют по id и отображение char_code -> id.
+        # Справочные поля валют меняются редко, поэтому повторные
+        # запросы одной валюты не доходят до SQLite; записи сбрасываются
+        # при изменении или удалении валюты и при откате транзакции
+        self._cur_by_id: OrderedDict[int, Dict[str, Any]] = OrderedDict()
+        self._cur_by_code: Dict[str, int] = {}
+        self._cache_lock: threading.Lock = threading.Lock()
+        # Поколение кэша: растёт при каждом сбросе. Чтение, начатое до
+        # сброса, не кладёт в кэш строку, которая могла уже устареть
+        self._cache_gen: int = 0
+        # Поток, открывший transaction(); None вне транзакции
+        self._tx_owner: Optional[int] = None
+        # ID валют, сброшенных из кэша внутри транзакции (None — сброшен
+        # весь кэш). После COMMIT сброс повторяется: до фиксации другие
+        # потоки читают через пул старые данные и могут снова их закэшировать
+        self._tx_invalidated: Optional[Set[int]] = set()
+        self._configure(db_path)
         self._create_tables()
+        self._readers: Optional[queue.Queue[sqlite3.Cursor]] = None
+        if db_path != ':memory:' and readers > 0:
+            self._readers = self._open_readers(db_path, readers)
+
+    def _configure(self, db_path: str) -> None:
+        """Применяет настройки соединения (PRAGMA).
+        
+        Для файловой базы включается журнал WAL: читатели не блокируют
+        запись, а запись — чтение. У базы в памяти журнала на диске нет,
+        поэтому для ':memory:' режим журнала не меняется.
+        
+        Args:
+            db_path: Путь к файлу базы данных или ':memory:'.
+        """
+        if db_path != ':memory:':
+            self.conn.execute('PRAGMA journal_mode = WAL')
+        for pragma in _PRAGMAS:
+            self.conn.execute(pragma)
+
+    @staticmethod
+    def _open_readers(
+        db_path: str,
+        count: int
+    ) -> 'queue.Queue[sqlite3.Cursor]':
+        """Открывает пул соединений только для чтения.
+        
+        Соединения открываются с mode=ro и check_same_thread=False:
+        курсор из пула в каждый момент использует один поток, но потоки
+        между выдачами могут быть разными.
+        
+        Args:
+            db_path: Путь к файлу базы данных (файл уже должен существовать).
+            count: Количество соединений в пуле.
+        
+        Returns:
+            Очередь курсоров, по одному на соединение.
+        """
+        uri: str = Path(db_path).resolve().as_uri() + '?mode=ro'
+        pool: queue.Queue[sqlite3.Cursor] = queue.Queue()
+        for _ in range(count):
+            conn: sqlite3.Connection = sqlite3.connect(
+                uri, uri=True, check_same_thread=False,
+                isolation_level=None, cached_statements=256
+            )
+            conn.row_factory = sqlite3.Row
+            for pragma in _PRAGMAS:
+                conn.execute(pragma)
+            pool.put(conn.cursor())
+        return pool
+
+    @contextmanager
+    def _read(self) -> Iterator[sqlite3.Cursor]:
+        """Выдаёт курсор для запроса на чтение.
+        
+        Берёт свободный курсор из пула и возвращает его после запроса.
+        Без пула (':memory:') и внутри открытой транзакции записи
+        используется курсор писателя — иначе чтение не увидело бы
+        ещё не зафиксированные изменения. Курсор писателя выдаётся
+        только потоку, открывшему транзакцию: остальные потоки читают
+        через пул и видят лишь зафиксированные данные.
+        
+        Yields:
+            Курсор, через который выполняется запрос.
+        """
+        if self._readers is None or self._tx_owner == threading.get_ident():
+            yield self._cur
+            return
+        
+        cursor: sqlite3.Cursor = self._readers.get()
+        try:
+            yield cursor
+        finally:
+            self._readers.put(cursor)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Выполняет вложенные операции записи в одной транзакции.
+        
+        Транзакция открывается через BEGIN IMMEDIATE: блокировка записи
+        берётся сразу, а не при первом изменении, поэтому не возникает
+        SQLITE_BUSY при повышении блокировки. Несколько изменений внутри
+        одного блока фиксируются одним COMMIT (одна синхронизация с диском
+        вместо одной на каждую операцию). При исключении выполняется ROLLBACK.
+        
+        Вложенный вызов внутри уже открытой транзакции присоединяется
+        к ней, поэтому одиночные методы CRUD можно группировать:
+        
+            with db.transaction():
+                db.create_user('Иван')
+                db.create_user('Анна')
+        
+        Raises:
+            sqlite3.Error: Если начать или зафиксировать транзакцию не удалось.
+        """
+        if self._tx_owner == threading.get_ident():
+            yield
+            return
+        
+        self.conn.execute('BEGIN IMMEDIATE')
+        self._tx_owner = threading.get_ident()
+        try:
+            yield
+            self.conn.execute('COMMIT')
+        except BaseException:
+            if self.conn.in_transaction:
+                self.conn.execute('ROLLBACK')
+            self._finish_transaction()
+            # Чтения внутри транзакции могли закэшировать откатанные данные
+            self._clear_currency_cache()
+            raise
+        
+        invalidated: Optional[Set[int]] = self._finish_transaction()
+        if invalidated is None:
+            self._clear_currency_cache()
+        else:
+            for currency_id in invalidated:
+                self._invalidate_currency(currency_id)
+
+    def _finish_transaction(self) -> Optional[Set[int]]:
+        """Снимает отметку владельца транзакции.
+        
+        Returns:
+            ID валют, сброшенных из кэша внутри транзакции,
+            или None, если сбрасывался весь кэш.
+        """
+        invalidated: Optional[Set[int]] = self._tx_invalidated
+        self._tx_invalidated = set()
+        self._tx_owner = None
+        return invalidated
+
+    def _cache_currency(self, currency: Dict[str, Any], gen: int) -> None:
+        """Кладёт строку валюты в кэш, вытесняя самую старую при переполнении.
+        
+        Если после начала чтения кэш сбрасывался (поколение изменилось),
+        строка не кэшируется: запись могла изменить её после чтения.
+        
+        Args:
+            currency: Словарь валюты с ключами id и char_code.
+            gen: Значение _cache_gen, прочитанное до запроса к базе.
+        """
+        with self._cache_lock:
+            if gen != self._cache_gen:
+                return
+            currency_id: int = currency['id']
+            self._cur_by_id[currency_id] = currency
+            self._cur_by_id.move_to_end(currency_id)
+            self._cur_by_code[currency['char_code']] = currency_id
+            if len(self._cur_by_id) > _CURRENCY_CACHE_SIZE:
+                old_id, old = self._cur_by_id.popitem(last=False)
+                if self._cur_by_code.get(old['char_code']) == old_id:
+                    del self._cur_by_code[old['char_code']]
+
+    def _cached_currency(self, currency_id: Optional[int]) -> Optional[Dict[str, Any]]:
+        """Возвращает копию закэшированной валюты или None при промахе.
+        
+        Args:
+            currency_id: ID валюты (None — заведомый промах).
+        """
+        if currency_id is None:
+            return None
+        with self._cache_lock:
+            currency: Optional[Dict[str, Any]] = self._cur_by_id.get(currency_id)
+            if currency is None:
+                return None
+            self._cur_by_id.move_to_end(currency_id)
+        return dict(currency)
+
+    def _invalidate_currency(self, currency_id: int) -> None:
+        """Удаляет валюту из кэша вместе с отображением её кода.
+        
+        Внутри транзакции ID запоминается, и после COMMIT валюта
+        сбрасывается ещё раз (см. transaction()).
+        
+        Args:
+            currency_id: ID изменённой или удалённой валюты.
+        """
+        if (self._tx_owner == threading.get_ident()
+                and self._tx_invalidated is not None):
+            self._tx_invalidated.add(currency_id)
+        with self._cache_lock:
+            self._cache_gen += 1
+            old: Optional[Dict[str, Any]] = self._cur_by_id.pop(currency_id, None)
+            if old is not None and self._cur_by_code.get(old['char_code']) == currency_id:
+                del self._cur_by_code[old['char_code']]
+
+    def _clear_currency_cache(self) -> None:
+        """Полностью очищает кэш валют (внутри транзакции — и после COMMIT)."""
+        if self._tx_owner == threading.get_ident():
+            self._tx_invalidated = None
+        with self._cache_lock:
+            self._cache_gen += 1
+            self._cur_by_id.clear()
+            self._cur_by_code.clear()
 
     def _create_tables(self) -> None:
         """Создаёт таблицы базы данных с корректной схемой.
@@ -61,43 +400,64 @@ class CurrencyRatesCRUD:
                           FOREIGN KEY(user_id) REFERENCES user(id),
                           FOREIGN KEY(currency_id) REFERENCES currency(id))
         
+        Индексы:
+        - idx_currency_char_code — уникальный по currency(char_code)
+        - idx_uc_user, idx_uc_currency — по user_currency(user_id) и (currency_id)
+        - idx_uc_pair — уникальный по user_currency(user_id, currency_id)
+        
         Raises:
             sqlite3.Error: Если создание таблиц не удалось.
         """
-        cursor: sqlite3.Cursor = self.conn.cursor()
-        
-        # Создаём таблицу user
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS user (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL
+        cursor: sqlite3.Cursor = self._cur
+        with self.transaction():
+            # Создаём таблицу user
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS user (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL
+                )
+            ''')
+        
+            # Создаём таблицу currency
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS currency (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    num_code TEXT NOT NULL,
+                    char_code TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    value FLOAT,
+                    nominal INTEGER
+                )
+            ''')
+        
+            # Создаём таблицу user_currency
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS user_currency (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user_id INTEGER NOT NULL,
+                    currency_id INTEGER NOT NULL,
+                    FOREIGN KEY(user_id) REFERENCES user(id) ON DELETE CASCADE,
+                    FOREIGN KEY(currency_id) REFERENCES currency(id) ON DELETE CASCADE
+                )
+            ''')
+        
+            # Индексы для поиска по коду и для соединений/каскадного удаления
+            # по user_currency; уникальные индексы заодно запрещают дубликаты
+            cursor.execute(
+                'CREATE UNIQUE INDEX IF NOT EXISTS idx_currency_char_code '
+                'ON currency(char_code)'
             )
-        ''')
-        
-        # Создаём таблицу currency
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS currency (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                num_code TEXT NOT NULL,
-                char_code TEXT NOT NULL,
-                name TEXT NOT NULL,
-                value FLOAT,
-                nominal INTEGER
+            cursor.execute(
+                'CREATE INDEX IF NOT EXISTS idx_uc_user ON user_currency(user_id)'
             )
-        ''')
-        
-        # Создаём таблицу user_currency
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS user_currency (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER NOT NULL,
-                currency_id INTEGER NOT NULL,
-                FOREIGN KEY(user_id) REFERENCES user(id) ON DELETE CASCADE,
-                FOREIGN KEY(currency_id) REFERENCES currency(id) ON DELETE CASCADE
+            cursor.execute(
+                'CREATE INDEX IF NOT EXISTS idx_uc_currency '
+                'ON user_currency(currency_id)'
+            )
+            cursor.execute(
+                'CREATE UNIQUE INDEX IF NOT EXISTS idx_uc_pair '
+                'ON user_currency(user_id, currency_id)'
             )
-        ''')
-        
-        self.conn.commit()
 
     # ============= CURRENCY CRUD OPERATIONS =============
     
@@ -124,39 +484,123 @@ class CurrencyRatesCRUD:
         Raises:
             sqlite3.Error: Если вставка записи не удалась.
         """
-        cursor: sqlite3.Cursor = self.conn.cursor()
+        cursor: sqlite3.Cursor = self._cur
+        with self.transaction():
+            cursor.execute(
+                _SQL_INSERT_CURRENCY, (num_code, char_code, name, value, nominal)
+            )
+        
+        return cursor.lastrowid
+
+    def create_currencies_bulk(
+        self,
+        rows: Iterable[Tuple[str, str, str, float, int]]
+    ) -> int:
+        """Создаёт несколько записей валют одним пакетом.
         
-        sql: str = '''
-            INSERT INTO currency (num_code, char_code, name, value, nominal)
-            VALUES (?, ?, ?, ?, ?)
-        '''
+        Все строки вставляются одним executemany в одной транзакции:
+        оператор подготавливается один раз, а фиксация выполняется одна
+        на весь пакет. При ошибке в любой строке пакет откатывается целиком.
         
-        cursor.execute(sql, (num_code, char_code, name, value, nominal))
-        self.conn.commit()
+        Args:
+            rows: Кортежи (num_code, char_code, name, value, nominal).
         
-        return cursor.lastrowid
+        Returns:
+            Количество вставленных записей.
+        
+        Raises:
+            sqlite3.Error: Если вставка не удалась.
+        """
+        cursor: sqlite3.Cursor = self._cur
+        with self.transaction():
+            cursor.executemany(_SQL_INSERT_CURRENCY, rows)
+        
+        return cursor.rowcount
+
+    def upsert_currency_rates(
+        self,
+        rows: Iterable[Tuple[str, str, str, float, int]]
+    ) -> int:
+        """Добавляет новые валюты и обновляет курсы существующих одним пакетом.
+        
+        Заменяет цикл «найти по коду → добавить или обновить» (два запроса
+        на валюту) одним INSERT ... ON CONFLICT(char_code) DO UPDATE через
+        executemany в одной транзакции. У существующих валют обновляются
+        value и nominal; num_code и name не меняются.
+        
+        Args:
+            rows: Кортежи (num_code, char_code, name, value, nominal).
+        
+        Returns:
+            Количество вставленных или обновлённых записей.
+        
+        Raises:
+            sqlite3.Error: Если запрос не удался (пакет откатывается целиком).
+        """
+        cursor: sqlite3.Cursor = self._cur
+        with self.transaction():
+            cursor.executemany(_SQL_UPSERT_CURRENCY, rows)
+        # Курсы могли измениться у любой из валют пакета
+        self._clear_currency_cache()
+        
+        return cursor.rowcount
 
-    def read_currencies(self) -> List[Dict[str, Any]]:
+    def read_currencies(self) -> List[sqlite3.Row]:
         """Читает все валюты из базы данных.
         
         Returns:
-            Список словарей с информацией о валютах.
-            Каждый словарь содержит ключи: id, num_code, char_code, name, value, nominal.
+            Список строк sqlite3.Row (доступ по имени и по индексу) с ключами:
+            id, num_code, char_code, name, value, nominal.
         
         Raises:
             sqlite3.Error: Если запрос не выполнен успешно.
         """
-        cursor: sqlite3.Cursor = self.conn.cursor()
+        with self._read() as cursor:
+            cursor.execute(_SQL_SELECT_CURRENCIES)
+            rows: List[sqlite3.Row] = cursor.fetchall()
+        
+        return rows
+
+    def read_currencies_array(self) -> 'np.ndarray':
+        """Читает курсы всех валют в структурированный массив NumPy.
+        
+        Колонки хранятся непрерывными массивами, поэтому расчёты по всем
+        валютам выполняются векторно, без цикла по словарям:
         
-        sql: str = 'SELECT * FROM currency'
-        cursor.execute(sql)
+            rates = db.read_currencies_array()
+            unit_values = rates['value'] / rates['nominal']
         
-        rows: List[sqlite3.Row] = cursor.fetchall()
-        return [dict(row) for row in rows]
+        Валюты без курса или номинала (NULL в базе) пропускаются:
+        в целочисленное поле nominal NULL не преобразовать, а подставленное
+        значение исказило бы расчёты. Массив заполняется через np.fromiter
+        с заранее известной длиной, без промежуточного списка кортежей.
+        
+        Returns:
+            Массив с полями id (int64), value (float64), nominal (int32).
+        
+        Raises:
+            ImportError: Если numpy не установлен.
+            sqlite3.Error: Если запрос не удался.
+        """
+        if np is None:
+            raise ImportError("Для read_currencies_array требуется numpy")
+        
+        with self._read() as cursor:
+            cursor.execute(_SQL_SELECT_CURRENCY_RATES)
+            rows: List[sqlite3.Row] = cursor.fetchall()
+        
+        return np.fromiter(
+            map(tuple, rows),
+            dtype=[('id', 'i8'), ('value', 'f8'), ('nominal', 'i4')],
+            count=len(rows),
+        )
 
     def read_currency(self, currency_id: int) -> Optional[Dict[str, Any]]:
         """Читает одну валюту по ID.
         
+        Повторные запросы обслуживаются из LRU-кэша; вызывающий код
+        получает копию, поэтому может изменять её без влияния на кэш.
+        
         Args:
             currency_id: ID валюты для получения.
         
@@ -167,17 +611,57 @@ class CurrencyRatesCRUD:
         Raises:
             sqlite3.Error: Если запрос не удался.
         """
-        cursor: sqlite3.Cursor = self.conn.cursor()
+        cached: Optional[Dict[str, Any]] = self._cached_currency(currency_id)
+        if cached is not None:
+            return cached
+        
+        gen: int = self._cache_gen
+        with self._read() as cursor:
+            cursor.execute(_SQL_SELECT_CURRENCY, (currency_id,))
+            row: Optional[sqlite3.Row] = cursor.fetchone()
+        
+        if not row:
+            return None
+        currency: Dict[str, Any] = dict(row)
+        self._cache_currency(currency, gen)
+        return dict(currency)
+
+    def read_currencies_by_ids(
+        self,
+        ids: Sequence[int]
+    ) -> Dict[int, Dict[str, Any]]:
+        """Читает несколько валют по списку ID одним запросом.
         
-        sql: str = 'SELECT * FROM currency WHERE id = ?'
-        cursor.execute(sql, (currency_id,))
+        Вместо N запросов read_currency выполняется один
+        SELECT ... WHERE id IN (?, ?, ...).
         
-        row: Optional[sqlite3.Row] = cursor.fetchone()
-        return dict(row) if row else None
+        Args:
+            ids: ID валют для получения.
+        
+        Returns:
+            Словарь {id: данные валюты}. Несуществующие ID в нём отсутствуют.
+        
+        Raises:
+            sqlite3.Error: Если запрос не удался.
+        """
+        if not ids:
+            return {}
+        
+        placeholders: str = ','.join('?' * len(ids))
+        with self._read() as cursor:
+            cursor.execute(
+                _SQL_SELECT_CURRENCIES_BY_IDS.format(placeholders), tuple(ids)
+            )
+            rows: List[sqlite3.Row] = cursor.fetchall()
+        
+        return {row['id']: dict(row) for row in rows}
 
     def read_currency_by_char_code(self, char_code: str) -> Optional[Dict[str, Any]]:
         """Читает валюту по символьному коду.
         
+        Код разрешается в ID через кэш, затем используется тот же
+        LRU-кэш строк, что и в read_currency.
+        
         Args:
             char_code: Символьный код валюты (например, "USD").
         
@@ -188,13 +672,22 @@ class CurrencyRatesCRUD:
         Raises:
             sqlite3.Error: Если запрос не удался.
         """
-        cursor: sqlite3.Cursor = self.conn.cursor()
-        
-        sql: str = 'SELECT * FROM currency WHERE char_code = ?'
-        cursor.execute(sql, (char_code,))
-        
-        row: Optional[sqlite3.Row] = cursor.fetchone()
-        return dict(row) if row else None
+        cached: Optional[Dict[str, Any]] = self._cached_currency(
+            self._cur_by_code.get(char_code)
+        )
+        if cached is not None:
+            return cached
+        
+        gen: int = self._cache_gen
+        with self._read() as cursor:
+            cursor.execute(_SQL_SELECT_CURRENCY_BY_CODE, (char_code,))
+            row: Optional[sqlite3.Row] = cursor.fetchone()
+        
+        if not row:
+            return None
+        currency: Dict[str, Any] = dict(row)
+        self._cache_currency(currency, gen)
+        return dict(currency)
 
     def update_currency(self, currency_id: int, **kwargs: Any) -> bool:
         """Обновляет запись валюты.
@@ -227,13 +720,64 @@ class CurrencyRatesCRUD:
         set_sql: str = ', '.join(set_clauses)
         values: Tuple[Any, ...] = tuple(kwargs.values()) + (currency_id,)
         
-        sql: str = f'UPDATE currency SET {set_sql} WHERE id = ?'
+        sql: str = f'UPDATE currency SET {set_sql} WHERE id = ? RETURNING 1'
+        
+        cursor: sqlite3.Cursor = self._cur
+        with self.transaction():
+            cursor.execute(sql, values)
+            found: bool = cursor.fetchone() is not None
+        self._invalidate_currency(currency_id)
+        
+        return found
+
+    def update_value(self, currency_id: int, value: float) -> bool:
+        """Обновляет курс валюты по ID заранее заданным запросом.
+        
+        В отличие от update_currency не собирает SQL и не проверяет
+        имена полей при каждом вызове.
+        
+        Args:
+            currency_id: ID валюты.
+            value: Новое значение курса.
+        
+        Returns:
+            True, если запись обновлена, False если не найдена.
+        
+        Raises:
+            sqlite3.Error: Если обновление не удалось.
+        """
+        cursor: sqlite3.Cursor = self._cur
+        with self.transaction():
+            cursor.execute(_SQL_UPDATE_VALUE, (value, currency_id))
+            found: bool = cursor.fetchone() is not None
+        self._invalidate_currency(currency_id)
+        
+        return found
+
+    def update_value_by_code(self, char_code: str, value: float) -> bool:
+        """Обновляет курс валюты по символьному коду одним запросом.
         
-        cursor: sqlite3.Cursor = self.conn.cursor()
-        cursor.execute(sql, values)
-        self.conn.commit()
+        Args:
+            char_code: Символьный код валюты (например, "USD").
+            value: Новое значение курса.
         
-        return cursor.rowcount > 0
+        Returns:
+            True, если запись обновлена, False если валюта не найдена.
+        
+        Raises:
+            sqlite3.Error: Если обновление не удалось.
+        """
+        cursor: sqlite3.Cursor = self._cur
+        with self.transaction():
+            cursor.execute(_SQL_UPDATE_VALUE_BY_CODE, (value, char_code))
+            row: Optional[sqlite3.Row] = cursor.fetchone()
+        if row is None:
+            return False
+        # ID берётся из RETURNING, а не из кэша: валюта могла ещё
+        # не попасть в кэш, но её чтение уже идти в другом потоке
+        self._invalidate_currency(row['id'])
+        
+        return True
 
     def delete_currency(self, currency_id: int) -> bool:
         """Удаляет запись валюты.
@@ -249,13 +793,13 @@ class CurrencyRatesCRUD:
         Raises:
             sqlite3.Error: Если удаление не удалось.
         """
-        cursor: sqlite3.Cursor = self.conn.cursor()
-        
-        sql: str = 'DELETE FROM currency WHERE id = ?'
-        cursor.execute(sql, (currency_id,))
-        self.conn.commit()
+        cursor: sqlite3.Cursor = self._cur
+        with self.transaction():
+            cursor.execute(_SQL_DELETE_CURRENCY, (currency_id,))
+            found: bool = cursor.fetchone() is not None
+        self._invalidate_currency(currency_id)
         
-        return cursor.rowcount > 0
+        return found
 
     # ============= USER CRUD OPERATIONS =============
     
@@ -271,31 +815,26 @@ class CurrencyRatesCRUD:
         Raises:
             sqlite3.Error: Если вставка не удалась.
         """
-        cursor: sqlite3.Cursor = self.conn.cursor()
-        
-        sql: str = 'INSERT INTO user (name) VALUES (?)'
-        cursor.execute(sql, (name,))
-        self.conn.commit()
+        cursor: sqlite3.Cursor = self._cur
+        with self.transaction():
+            cursor.execute(_SQL_INSERT_USER, (name,))
         
         return cursor.lastrowid
 
-    def read_users(self) -> List[Dict[str, Any]]:
+    def read_users(self) -> List[sqlite3.Row]:
         """Читает всех пользователей из базы данных.
         
         Returns:
-            Список словарей с информацией о пользователях.
-            Каждый словарь имеет ключи: id, name.
+            Список строк sqlite3.Row с ключами: id, name.
         
         Raises:
             sqlite3.Error: Если запрос не удался.
         """
-        cursor: sqlite3.Cursor = self.conn.cursor()
+        with self._read() as cursor:
+            cursor.execute(_SQL_SELECT_USERS)
+            rows: List[sqlite3.Row] = cursor.fetchall()
         
-        sql: str = 'SELECT * FROM user'
-        cursor.execute(sql)
-        
-        rows: List[sqlite3.Row] = cursor.fetchall()
-        return [dict(row) for row in rows]
+        return rows
 
     def read_user(self, user_id: int) -> Optional[Dict[str, Any]]:
         """Читает одного пользователя по ID.
@@ -310,12 +849,10 @@ class CurrencyRatesCRUD:
         Raises:
             sqlite3.Error: Если запрос не удался.
         """
-        cursor: sqlite3.Cursor = self.conn.cursor()
-        
-        sql: str = 'SELECT * FROM user WHERE id = ?'
-        cursor.execute(sql, (user_id,))
+        with self._read() as cursor:
+            cursor.execute(_SQL_SELECT_USER, (user_id,))
+            row: Optional[sqlite3.Row] = cursor.fetchone()
         
-        row: Optional[sqlite3.Row] = cursor.fetchone()
         return dict(row) if row else None
 
     def update_user(self, user_id: int, name: str) -> bool:
@@ -331,13 +868,12 @@ class CurrencyRatesCRUD:
         Raises:
             sqlite3.Error: Если обновление не удалось.
         """
-        cursor: sqlite3.Cursor = self.conn.cursor()
+        cursor: sqlite3.Cursor = self._cur
+        with self.transaction():
+            cursor.execute(_SQL_UPDATE_USER, (name, user_id))
+            found: bool = cursor.fetchone() is not None
         
-        sql: str = 'UPDATE user SET name = ? WHERE id = ?'
-        cursor.execute(sql, (name, user_id))
-        self.conn.commit()
-        
-        return cursor.rowcount > 0
+        return found
 
     def delete_user(self, user_id: int) -> bool:
         """Удаляет запись пользователя.
@@ -353,13 +889,12 @@ class CurrencyRatesCRUD:
         Raises:
             sqlite3.Error: Если удаление не удалось.
         """
-        cursor: sqlite3.Cursor = self.conn.cursor()
-        
-        sql: str = 'DELETE FROM user WHERE id = ?'
-        cursor.execute(sql, (user_id,))
-        self.conn.commit()
+        cursor: sqlite3.Cursor = self._cur
+        with self.transaction():
+            cursor.execute(_SQL_DELETE_USER, (user_id,))
+            found: bool = cursor.fetchone() is not None
         
-        return cursor.rowcount > 0
+        return found
 
     # ============= USER_CURRENCY (SUBSCRIPTION) CRUD OPERATIONS =============
     
@@ -376,63 +911,104 @@ class CurrencyRatesCRUD:
         Raises:
             sqlite3.Error: Если вставка не удалась (например, неверные внешние ключи).
         """
-        cursor: sqlite3.Cursor = self.conn.cursor()
+        cursor: sqlite3.Cursor = self._cur
+        with self.transaction():
+            cursor.execute(_SQL_INSERT_USER_CURRENCY, (user_id, currency_id))
         
-        sql: str = '''
-            INSERT INTO user_currency (user_id, currency_id)
-            VALUES (?, ?)
-        '''
+        return cursor.lastrowid
+
+    def subscribe_many(self, pairs: Iterable[Tuple[int, int]]) -> int:
+        """Создаёт несколько подписок одним пакетом.
         
-        cursor.execute(sql, (user_id, currency_id))
-        self.conn.commit()
+        Вместо N отдельных INSERT и N фиксаций выполняется один
+        executemany в одной транзакции. При ошибке в любой паре
+        (несуществующий ключ, повторная подписка) пакет откатывается целиком.
         
-        return cursor.lastrowid
+        Args:
+            pairs: Пары (user_id, currency_id).
+        
+        Returns:
+            Количество созданных подписок.
+        
+        Raises:
+            sqlite3.Error: Если вставка не удалась.
+        """
+        cursor: sqlite3.Cursor = self._cur
+        with self.transaction():
+            cursor.executemany(_SQL_INSERT_USER_CURRENCY, pairs)
+        
+        return cursor.rowcount
 
     def read_user_currencies(
         self,
         user_id: int
-    ) -> List[Dict[str, Any]]:
+    ) -> List[sqlite3.Row]:
         """Читает все валюты, на которые подписан указанный пользователь.
         
         Args:
             user_id: ID пользователя.
         
         Returns:
-            Список словарей валют, на которые подписан пользователь.
-            Каждый словарь содержит ключи из таблицы currency: id, num_code, char_code, name, value, nominal.
+            Список строк sqlite3.Row валют, на которые подписан пользователь,
+            с ключами из таблицы currency: id, num_code, char_code, name, value, nominal.
         
         Raises:
             sqlite3.Error: Если запрос не удался.
         """
-        cursor: sqlite3.Cursor = self.conn.cursor()
+        with self._read() as cursor:
+            cursor.execute(_SQL_SELECT_USER_CURRENCIES, (user_id,))
+            rows: List[sqlite3.Row] = cursor.fetchall()
         
-        sql: str = '''
-            SELECT c.*
-            FROM currency c
-            INNER JOIN user_currency uc ON c.id = uc.currency_id
-            WHERE uc.user_id = ?
-        '''
-        
-        cursor.execute(sql, (user_id,))
-        rows: List[sqlite3.Row] = cursor.fetchall()
-        return [dict(row) for row in rows]
+        return rows
 
-    def read_all_user_currencies(self) -> List[Dict[str, Any]]:
-        """Читает все записи подписок (user_currency).
+    def read_all_subscriptions(self) -> List[sqlite3.Row]:
+        """Читает все подписки сразу с данными валют одним запросом с JOIN.
+        
+        Заменяет read_all_user_currencies, который возвращал только ID:
+        вызывающему коду больше не нужно дочитывать каждую валюту
+        через read_currency.
         
         Returns:
-            Список словарей с ключами: id, user_id, currency_id.
+            Список строк sqlite3.Row в порядке создания подписок с ключами:
+            subscription_id, user_id и колонки currency (id, num_code,
+            char_code, name, value, nominal), где id — ID валюты.
         
         Raises:
             sqlite3.Error: Если запрос не удался.
         """
-        cursor: sqlite3.Cursor = self.conn.cursor()
+        with self._read() as cursor:
+            cursor.execute(_SQL_SELECT_ALL_SUBSCRIPTIONS)
+            rows: List[sqlite3.Row] = cursor.fetchall()
         
-        sql: str = 'SELECT * FROM user_currency'
-        cursor.execute(sql)
+        return rows
+
+    def read_all_subscriptions_expanded(self) -> Dict[int, List[Dict[str, Any]]]:
+        """Читает валюты всех пользователей одним запросом с JOIN.
+        
+        Заменяет цикл read_user_currencies по каждому пользователю:
+        строки приходят отсортированными по user_id и группируются
+        за один проход.
         
-        rows: List[sqlite3.Row] = cursor.fetchall()
-        return [dict(row) for row in rows]
+        Returns:
+            Словарь {user_id: список словарей валют}. Пользователи без
+            подписок в нём отсутствуют.
+        
+        Raises:
+            sqlite3.Error: Если запрос не удался.
+        """
+        with self._read() as cursor:
+            cursor.execute(_SQL_SELECT_SUBSCRIPTIONS_EXPANDED)
+            all_rows: List[sqlite3.Row] = cursor.fetchall()
+        
+        grouped: Dict[int, List[Dict[str, Any]]] = {}
+        for user_id, rows in groupby(all_rows, key=itemgetter('user_id')):
+            currencies: List[Dict[str, Any]] = []
+            for row in rows:
+                currency: Dict[str, Any] = dict(row)
+                del currency['user_id']
+                currencies.append(currency)
+            grouped[user_id] = currencies
+        return grouped
 
     def delete_user_currency(self, user_id: int, currency_id: int) -> bool:
         """Удаляет подписку пользователя на валюту.
@@ -447,17 +1023,12 @@ class CurrencyRatesCRUD:
         Raises:
             sqlite3.Error: Если удаление не удалось.
         """
-        cursor: sqlite3.Cursor = self.conn.cursor()
-        
-        sql: str = '''
-            DELETE FROM user_currency
-            WHERE user_id = ? AND currency_id = ?
-        '''
+        cursor: sqlite3.Cursor = self._cur
+        with self.transaction():
+            cursor.execute(_SQL_DELETE_USER_CURRENCY, (user_id, currency_id))
+            found: bool = cursor.fetchone() is not None
         
-        cursor.execute(sql, (user_id, currency_id))
-        self.conn.commit()
-        
-        return cursor.rowcount > 0
+        return found
 
     def delete_user_currency_by_id(self, uc_id: int) -> bool:
         """Удаляет запись подписки по ID.
@@ -471,13 +1042,12 @@ class CurrencyRatesCRUD:
         Raises:
             sqlite3.Error: Если удаление не удалось.
         """
-        cursor: sqlite3.Cursor = self.conn.cursor()
-        
-        sql: str = 'DELETE FROM user_currency WHERE id = ?'
-        cursor.execute(sql, (uc_id,))
-        self.conn.commit()
+        cursor: sqlite3.Cursor = self._cur
+        with self.transaction():
+            cursor.execute(_SQL_DELETE_USER_CURRENCY_BY_ID, (uc_id,))
+            found: bool = cursor.fetchone() is not None
         
-        return cursor.rowcount > 0
+        return found
 
     def close(self) -> None:
         """Закрывает соединение с базой данных.
@@ -485,6 +1055,9 @@ class CurrencyRatesCRUD:
         Raises:
             sqlite3.Error: Если закрытие соединения не удалось.
         """
+        if self._readers is not None:
+            while not self._readers.empty():
+                self._readers.get_nowait().connection.close()
         if self.conn:
             self.conn.close()
 
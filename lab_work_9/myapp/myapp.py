@@ -498,14 +498,13 @@ def _init_sample_data(controller: CurrencyController) -> None:
         (4, 1),  # User 5 -> EUR
     ]
 
-    for user_idx, currency_idx in subscriptions:
-        try:
-            controller.subscribe_user_to_currency(
-                user_ids[user_idx],
-                currency_ids[currency_idx]
-            )
-        except Exception:
-            pass  # Игнорируем ошибки при подписке
+    try:
+        controller.subscribe_many(
+            (user_ids[user_idx], currency_ids[currency_idx])
+            for user_idx, currency_idx in subscriptions
+        )
+    except Exception:
+        pass  # Игнорируем ошибки при подписке
 
 
 if __name__ == "__main__":
@@ -11,10 +11,20 @@
 логики контроллера в изоляции.
 """
 
+import os
+import sqlite3
+import tempfile
+import threading
 import unittest
+from contextlib import contextmanager
 from unittest.mock import MagicMock, patch, call
 from typing import Dict, Any
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from myapp.controllers.database_controller import CurrencyRatesCRUD
 from myapp.controllers.currency_controller import CurrencyController
 
@@ -271,6 +281,272 @@ class TestCurrencyRatesCRUD(unittest.TestCase):
 
     # ============= ТЕСТЫ ВНЕШНИХ КЛЮЧЕЙ И ЦЕЛОСТНОСТИ ДАННЫХ =============
     
+    def test_delete_user_cascades_subscriptions(self) -> None:
+        """Тест что удаление пользователя удаляет его подписки (CASCADE)."""
+        user_id = self.db.create_user('Иван Петров')
+        currency_id = self.db.create_currency(
+            '840', 'USD', 'Доллар США', 90.0, 1
+        )
+        self.db.create_user_currency(user_id, currency_id)
+        
+        self.db.delete_user(user_id)
+        
+        self.assertEqual(self.db.read_all_subscriptions(), [])
+
+    def test_subscription_requires_existing_user(self) -> None:
+        """Тест что внешний ключ не допускает подписку несуществующего пользователя."""
+        currency_id = self.db.create_currency(
+            '840', 'USD', 'Доллар США', 90.0, 1
+        )
+        
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.db.create_user_currency(999, currency_id)
+
+    def test_duplicate_char_code_rejected(self) -> None:
+        """Тест что уникальный индекс не допускает повтор кода валюты."""
+        self.db.create_currency('840', 'USD', 'Доллар США', 90.0, 1)
+        
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.db.create_currency('840', 'USD', 'Доллар США', 91.0, 1)
+
+    def test_duplicate_subscription_rejected(self) -> None:
+        """Тест что пара (пользователь, валюта) подписывается один раз."""
+        user_id = self.db.create_user('Иван')
+        currency_id = self.db.create_currency(
+            '840', 'USD', 'Доллар США', 90.0, 1
+        )
+        self.db.create_user_currency(user_id, currency_id)
+        
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.db.create_user_currency(user_id, currency_id)
+
+    def test_transaction_groups_writes(self) -> None:
+        """Тест что изменения в transaction() фиксируются вместе."""
+        with self.db.transaction():
+            self.db.create_user('Иван')
+            self.db.create_user('Анна')
+            self.assertTrue(self.db.conn.in_transaction)
+        
+        self.assertFalse(self.db.conn.in_transaction)
+        self.assertEqual(len(self.db.read_users()), 2)
+
+    def test_transaction_rolls_back_on_error(self) -> None:
+        """Тест что исключение в transaction() отменяет все изменения."""
+        with self.assertRaises(RuntimeError):
+            with self.db.transaction():
+                self.db.create_user('Иван')
+                raise RuntimeError('boom')
+        
+        self.assertEqual(self.db.read_users(), [])
+
+    def test_update_value_by_code(self) -> None:
+        """Тест обновления курса по коду одним запросом."""
+        currency_id = self.db.create_currency(
+            '840', 'USD', 'Доллар США', 90.0, 1
+        )
+        self.db.read_currency_by_char_code('USD')
+        
+        self.assertTrue(self.db.update_value_by_code('USD', 95.5))
+        self.assertFalse(self.db.update_value_by_code('XXX', 1.0))
+        self.assertEqual(self.db.read_currency(currency_id)['value'], 95.5)
+        self.assertTrue(self.db.update_value(currency_id, 96.0))
+        self.assertEqual(self.db.read_currency_by_char_code('USD')['value'], 96.0)
+
+    def test_upsert_currency_rates(self) -> None:
+        """Тест что upsert добавляет новые валюты и обновляет существующие."""
+        usd_id = self.db.create_currency('840', 'USD', 'Доллар США', 90.0, 1)
+        self.db.read_currency(usd_id)
+        
+        self.db.upsert_currency_rates([
+            ('840', 'USD', 'Доллар США', 95.5, 1),
+            ('392', 'JPY', 'Японская йена', 0.7, 100),
+        ])
+        
+        usd = self.db.read_currency(usd_id)
+        self.assertEqual(usd['value'], 95.5)
+        self.assertEqual(usd['id'], usd_id)
+        self.assertEqual(self.db.read_currency_by_char_code('JPY')['nominal'], 100)
+        self.assertEqual(len(self.db.read_currencies()), 2)
+
+    @unittest.skipIf(numpy is None, "numpy не установлен")
+    def test_read_currencies_array(self) -> None:
+        """Тест чтения курсов в структурированный массив NumPy."""
+        self.db.create_currencies_bulk([
+            ('840', 'USD', 'Доллар США', 90.0, 1),
+            ('392', 'JPY', 'Японская йена', 70.0, 100),
+        ])
+        
+        rates = self.db.read_currencies_array()
+        
+        self.assertEqual(rates.shape, (2,))
+        self.assertEqual(list(rates['id']), [1, 2])
+        self.assertEqual(list(rates['value'] / rates['nominal']), [90.0, 0.7])
+
+    @unittest.skipIf(numpy is None, "numpy не установлен")
+    def test_read_currencies_array_skips_nulls(self) -> None:
+        """Тест что валюты без курса или номинала не попадают в массив."""
+        usd_id = self.db.create_currency('840', 'USD', 'Доллар США', 90.0, 1)
+        eur_id = self.db.create_currency('978', 'EUR', 'Евро', 91.0, 1)
+        jpy_id = self.db.create_currency('392', 'JPY', 'Японская йена', 70.0, 100)
+        self.db.update_currency(eur_id, value=None)
+        self.db.update_currency(jpy_id, nominal=None)
+        
+        rates = self.db.read_currencies_array()
+        
+        self.assertEqual(list(rates['id']), [usd_id])
+        self.assertEqual(list(rates['value']), [90.0])
+
+    def test_read_currencies_returns_rows(self) -> None:
+        """Тест что списочное чтение возвращает sqlite3.Row без копий в dict."""
+        self.db.create_currency('840', 'USD', 'Доллар США', 90.0, 1)
+        
+        currencies = self.db.read_currencies()
+        
+        self.assertIsInstance(currencies[0], sqlite3.Row)
+        self.assertEqual(currencies[0]['char_code'], 'USD')
+        self.assertEqual(dict(currencies[0])['value'], 90.0)
+
+    def test_read_currency_cached_until_update(self) -> None:
+        """Тест что кэш валюты сбрасывается при её изменении."""
+        currency_id = self.db.create_currency(
+            '840', 'USD', 'Доллар США', 90.0, 1
+        )
+        self.db.read_currency_by_char_code('USD')
+        
+        with patch.object(self.db, '_read') as read:
+            self.assertEqual(self.db.read_currency(currency_id)['value'], 90.0)
+            self.assertEqual(self.db.read_currency_by_char_code('USD')['id'], currency_id)
+            read.assert_not_called()
+        
+        self.db.update_currency(currency_id, value=95.5, char_code='USX')
+        
+        self.assertEqual(self.db.read_currency(currency_id)['value'], 95.5)
+        self.assertIsNone(self.db.read_currency_by_char_code('USD'))
+
+    def test_read_currency_not_cached_after_concurrent_update(self) -> None:
+        """Тест что строка, изменённая после чтения, не попадает в кэш."""
+        currency_id = self.db.create_currency(
+            '840', 'USD', 'Доллар США', 90.0, 1
+        )
+        read = self.db._read
+
+        @contextmanager
+        def read_then_update():
+            with read() as cursor:
+                yield cursor
+            # Запись другого потока между запросом и заполнением кэша
+            self.db.update_value_by_code('USD', 95.5)
+
+        with patch.object(self.db, '_read', read_then_update):
+            self.assertEqual(self.db.read_currency(currency_id)['value'], 90.0)
+
+        self.assertEqual(self.db.read_currency(currency_id)['value'], 95.5)
+        self.assertEqual(self.db.read_currency_by_char_code('USD')['value'], 95.5)
+
+    def test_read_currency_cache_cleared_on_rollback(self) -> None:
+        """Тест что откат транзакции не оставляет в кэше отменённых данных."""
+        currency_id = self.db.create_currency(
+            '840', 'USD', 'Доллар США', 90.0, 1
+        )
+        
+        with self.assertRaises(RuntimeError):
+            with self.db.transaction():
+                self.db.update_currency(currency_id, value=95.5)
+                self.db.read_currency(currency_id)
+                raise RuntimeError('boom')
+        
+        self.assertEqual(self.db.read_currency(currency_id)['value'], 90.0)
+
+    def test_delete_currency_invalidates_cache(self) -> None:
+        """Тест что удалённая валюта не возвращается из кэша."""
+        currency_id = self.db.create_currency(
+            '840', 'USD', 'Доллар США', 90.0, 1
+        )
+        self.db.read_currency(currency_id)
+        
+        self.db.delete_currency(currency_id)
+        
+        self.assertIsNone(self.db.read_currency(currency_id))
+        self.assertIsNone(self.db.read_currency_by_char_code('USD'))
+
+    def test_read_currencies_by_ids(self) -> None:
+        """Тест чтения нескольких валют по списку ID."""
+        usd_id = self.db.create_currency('840', 'USD', 'Доллар США', 90.0, 1)
+        eur_id = self.db.create_currency('978', 'EUR', 'Евро', 91.0, 1)
+        
+        result = self.db.read_currencies_by_ids([usd_id, eur_id, 999])
+        
+        self.assertEqual(set(result), {usd_id, eur_id})
+        self.assertEqual(result[eur_id]['char_code'], 'EUR')
+        self.assertEqual(self.db.read_currencies_by_ids([]), {})
+
+    def test_create_currencies_bulk(self) -> None:
+        """Тест пакетного добавления валют."""
+        count = self.db.create_currencies_bulk([
+            ('840', 'USD', 'Доллар США', 90.0, 1),
+            ('978', 'EUR', 'Евро', 91.0, 1),
+        ])
+        
+        self.assertEqual(count, 2)
+        char_codes = [c['char_code'] for c in self.db.read_currencies()]
+        self.assertEqual(char_codes, ['USD', 'EUR'])
+
+    def test_subscribe_many(self) -> None:
+        """Тест пакетной подписки пользователя на несколько валют."""
+        user_id = self.db.create_user('Иван')
+        usd_id = self.db.create_currency('840', 'USD', 'Доллар США', 90.0, 1)
+        eur_id = self.db.create_currency('978', 'EUR', 'Евро', 91.0, 1)
+        
+        count = self.db.subscribe_many([(user_id, usd_id), (user_id, eur_id)])
+        
+        self.assertEqual(count, 2)
+        self.assertEqual(len(self.db.read_user_currencies(user_id)), 2)
+
+    def test_read_all_subscriptions(self) -> None:
+        """Тест что подписки читаются сразу с данными валют."""
+        user_id = self.db.create_user('Иван')
+        usd_id = self.db.create_currency('840', 'USD', 'Доллар США', 90.0, 1)
+        uc_id = self.db.create_user_currency(user_id, usd_id)
+        
+        subscriptions = self.db.read_all_subscriptions()
+        
+        self.assertEqual(len(subscriptions), 1)
+        self.assertEqual(subscriptions[0]['subscription_id'], uc_id)
+        self.assertEqual(subscriptions[0]['user_id'], user_id)
+        self.assertEqual(subscriptions[0]['id'], usd_id)
+        self.assertEqual(subscriptions[0]['char_code'], 'USD')
+
+    def test_read_all_subscriptions_expanded(self) -> None:
+        """Тест группировки валют подписок по пользователям."""
+        ivan_id = self.db.create_user('Иван')
+        anna_id = self.db.create_user('Анна')
+        self.db.create_user('Без подписок')
+        usd_id = self.db.create_currency('840', 'USD', 'Доллар США', 90.0, 1)
+        eur_id = self.db.create_currency('978', 'EUR', 'Евро', 91.0, 1)
+        self.db.subscribe_many(
+            [(anna_id, usd_id), (ivan_id, eur_id), (ivan_id, usd_id)]
+        )
+        
+        grouped = self.db.read_all_subscriptions_expanded()
+        
+        self.assertEqual(set(grouped), {ivan_id, anna_id})
+        self.assertEqual(
+            sorted(c['char_code'] for c in grouped[ivan_id]), ['EUR', 'USD']
+        )
+        self.assertEqual(grouped[anna_id], [self.db.read_currency(usd_id)])
+
+    def test_subscribe_many_rolls_back_on_error(self) -> None:
+        """Тест что ошибка в одной паре отменяет весь пакет."""
+        user_id = self.db.create_user('Иван')
+        currency_id = self.db.create_currency(
+            '840', 'USD', 'Доллар США', 90.0, 1
+        )
+        
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.db.subscribe_many([(user_id, currency_id), (999, currency_id)])
+        
+        self.assertEqual(self.db.read_all_subscriptions(), [])
+
     def test_parameterized_queries_protection(self) -> None:
         """Тест, что параметризованные запросы защищают от SQL-инъекций."""
         # Пытаемся создать валюту с попыткой SQL-инъекции
@@ -286,6 +562,113 @@ class TestCurrencyRatesCRUD(unittest.TestCase):
         self.assertEqual(currency['name'], malicious_name)
 
 
+class TestCurrencyRatesCRUDFile(unittest.TestCase):
+    """Тесты пула соединений для чтения у файловой базы."""
+
+    def setUp(self) -> None:
+        """Создаёт файловую базу во временном каталоге."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = CurrencyRatesCRUD(
+            db_path=os.path.join(self.tmp.name, 'currency.db'), readers=2
+        )
+
+    def tearDown(self) -> None:
+        """Закрывает соединения и удаляет временный каталог."""
+        self.db.close()
+        self.tmp.cleanup()
+
+    def test_readers_see_committed_writes(self) -> None:
+        """Тест что чтение через пул видит зафиксированные изменения."""
+        currency_id = self.db.create_currency(
+            '840', 'USD', 'Доллар США', 90.0, 1
+        )
+        
+        self.assertIsNotNone(self.db._readers)
+        self.assertEqual(self.db.read_currency(currency_id)['char_code'], 'USD')
+
+    def test_readers_are_read_only(self) -> None:
+        """Тест что соединения пула не допускают запись."""
+        with self.db._read() as cursor:
+            with self.assertRaises(sqlite3.OperationalError):
+                cursor.execute("INSERT INTO user (name) VALUES ('Иван')")
+
+    def test_read_inside_transaction_uses_writer(self) -> None:
+        """Тест что внутри транзакции видны незафиксированные изменения."""
+        with self.db.transaction():
+            user_id = self.db.create_user('Иван')
+            self.assertEqual(self.db.read_user(user_id)['name'], 'Иван')
+
+    def test_read_from_other_thread_during_transaction(self) -> None:
+        """Тест что другой поток во время транзакции читает через пул."""
+        results = []
+        errors = []
+
+        def worker() -> None:
+            try:
+                results.append(len(self.db.read_users()))
+            except Exception as e:
+                errors.append(e)
+
+        with self.db.transaction():
+            self.db.create_user('Иван')
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(results, [0])
+
+    def _read_in_thread(self, read) -> None:
+        """Выполняет чтение в отдельном потоке и дожидается его."""
+        thread = threading.Thread(target=read)
+        thread.start()
+        thread.join()
+
+    def test_cache_invalidated_after_commit(self) -> None:
+        """Тест что чтение через пул до COMMIT не оставляет старую строку."""
+        currency_id = self.db.create_currency(
+            '840', 'USD', 'Доллар США', 75.0, 1
+        )
+
+        with self.db.transaction():
+            self.db.update_value(currency_id, 99.0)
+            self._read_in_thread(lambda: self.db.read_currency(currency_id))
+
+        self.assertEqual(self.db.read_currency(currency_id)['value'], 99.0)
+        self.assertEqual(self.db.read_currency_by_char_code('USD')['value'], 99.0)
+
+    def test_cache_cleared_after_commit_of_upsert(self) -> None:
+        """Тест сброса кэша после COMMIT внешней транзакции с upsert."""
+        currency_id = self.db.create_currency(
+            '840', 'USD', 'Доллар США', 75.0, 1
+        )
+
+        with self.db.transaction():
+            self.db.upsert_currency_rates([
+                ('840', 'USD', 'Доллар США', 99.0, 1),
+            ])
+            self._read_in_thread(lambda: self.db.read_currency(currency_id))
+
+        self.assertEqual(self.db.read_currency(currency_id)['value'], 99.0)
+
+    def test_readers_from_threads(self) -> None:
+        """Тест параллельного чтения из нескольких потоков."""
+        self.db.create_currency('840', 'USD', 'Доллар США', 90.0, 1)
+        results = []
+
+        def worker() -> None:
+            for _ in range(20):
+                results.append(len(self.db.read_currencies()))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(results, [1] * 80)
+
+
 class TestCurrencyController(unittest.TestCase):
     """Тесты для бизнес-логики CurrencyController."""
 
@@ -354,28 +737,39 @@ class TestCurrencyController(unittest.TestCase):
 
     def test_update_currency_value(self) -> None:
         """Тест обновления только значения курса валюты."""
-        self.mock_db.update_currency.return_value = True
+        self.mock_db.update_value.return_value = True
         
         result = self.controller.update_currency_value(1, 95.5)
         
         self.assertTrue(result)
-        self.mock_db.update_currency.assert_called_once_with(1, value=95.5)
+        self.mock_db.update_value.assert_called_once_with(1, 95.5)
+        self.mock_db.update_currency.assert_not_called()
 
     def test_update_currency_value_by_code(self) -> None:
-        """Тест обновления курса валюты по символьному коду."""
-        # Мокаем get_currency_by_code, чтобы вернуть валюту
-        self.mock_db.read_currency_by_char_code.return_value = {
-            'id': 1,
-            'char_code': 'USD',
-            'value': 90.0
-        }
-        self.mock_db.update_currency.return_value = True
+        """Тест обновления курса валюты по символьному коду одним запросом."""
+        self.mock_db.update_value_by_code.return_value = True
         
         result = self.controller.update_currency_value_by_code('USD', 95.5)
         
         self.assertTrue(result)
-        self.mock_db.read_currency_by_char_code.assert_called_once_with('USD')
-        self.mock_db.update_currency.assert_called_once_with(1, value=95.5)
+        self.mock_db.update_value_by_code.assert_called_once_with('USD', 95.5)
+        self.mock_db.read_currency_by_char_code.assert_not_called()
+
+    def test_refresh_rates(self) -> None:
+        """Тест что обновление курсов делегируется одному upsert."""
+        rows = [('840', 'USD', 'Доллар США', 95.5, 1)]
+        self.mock_db.upsert_currency_rates.return_value = 1
+        
+        result = self.controller.refresh_rates(rows)
+        
+        self.assertEqual(result, 1)
+        self.mock_db.upsert_currency_rates.assert_called_once_with(rows)
+
+    def test_update_currency_value_by_unknown_code(self) -> None:
+        """Тест что обновление по неизвестному коду возвращает False."""
+        self.mock_db.update_value_by_code.return_value = False
+        
+        self.assertFalse(self.controller.update_currency_value_by_code('XXX', 1.0))
 
     def test_update_nonexistent_currency_returns_false(self) -> None:
         """Тест того, что обновление несуществующей валюты возвращает False."""
@@ -444,6 +838,15 @@ class TestCurrencyController(unittest.TestCase):
         self.assertEqual(result, 1)
         self.mock_db.create_user_currency.assert_called_once_with(1, 1)
 
+    def test_subscribe_many(self) -> None:
+        """Тест пакетной подписки через контроллер."""
+        self.mock_db.subscribe_many.return_value = 2
+        
+        result = self.controller.subscribe_many([(1, 1), (1, 2)])
+        
+        self.assertEqual(result, 2)
+        self.mock_db.subscribe_many.assert_called_once_with([(1, 1), (1, 2)])
+
     def test_get_user_currencies(self) -> None:
         """Тест получения валют, на которые подписан пользователь."""
         expected_currencies = [
@@ -456,6 +859,16 @@ class TestCurrencyController(unittest.TestCase):
         
         self.assertEqual(result, expected_currencies)
 
+    def test_get_all_subscriptions(self) -> None:
+        """Тест что подписки берутся одним запросом с JOIN."""
+        expected = [{'subscription_id': 1, 'user_id': 1, 'id': 1, 'char_code': 'USD'}]
+        self.mock_db.read_all_subscriptions.return_value = expected
+        
+        result = self.controller.get_all_subscriptions()
+        
+        self.assertEqual(result, expected)
+        self.mock_db.read_all_subscriptions.assert_called_once_with()
+
     def test_unsubscribe_user_from_currency(self) -> None:
         """Тест отписки пользователя от валюты."""
         self.mock_db.delete_user_currency.return_value = True